@@ -11,44 +11,76 @@ bl_info = {
 }
 
 
-import importlib
-
-modules = (
-    ".operators",
-    ".ui",
-    ".uv_layers",
-)
+import os
+import time
 
+_import_start = time.perf_counter()
 
-def import_modules():
-    for module in modules:
-        print(f"{module} - {__package__}")
-        importlib.import_module(module, __package__)
+try:
+    import bpy
+except ImportError:
+    # plain python, e.g. a pipeline using the core package - there is no addon to set up
+    bpy = None
 
+# dependencies first - profiling is left out to keep the recorded profiles
+modules = (
+    "core.union_find",
+    "core.uv_verts",
+    "core.analysis_cache",
+    "core.mesh",
+    "core.edge_labels",
+    "core.islands",
+    "core.walk",
+    "core.select",
+    "core.bounds",
+    "core.align",
+    "core.straighten",
+    "core.rotate",
+    "core.unwrap",
+    "mesh_objects",
+    "snapshot",
+    "uv_layers",
+    "uv_layer_data",
+    "batch_operations",
+    "operators",
+    "ui",
+)
 
-def reimport_modules():
-    for module in modules:
-        want_reload_module = importlib.import_module(module, __package__)
-        importlib.reload(want_reload_module)
+if bpy is not None:
+    # "Reload Scripts" runs this file again, with the modules of the last run still around. Reloading them is
+    # for working on the addon and has to be turned on with UVKIT_RELOAD=1, otherwise the loaded modules stay.
+    # A normal startup imports every module once, the numpy based ones only when an operator needs them.
+    if "operators" in locals() and os.environ.get("UVKIT_RELOAD") == "1":
+        import importlib
+        import sys
 
+        for module in modules:
+            loaded = sys.modules.get(f"{__package__}.{module}")
+            if loaded is not None:
+                importlib.reload(loaded)
 
-import_modules()
-reimport_modules()
+    from . import operators
+    from . import ui
+    from . import uv_layers
+    from .core.profiling import profiler
 
-from . import operators
-from . import ui
-from . import uv_layers
+    register_modules = [
+        operators,
+        ui,
+        uv_layers,
+    ]
 
-register_modules = [
-    operators,
-    ui,
-    uv_layers,
-]
+    profiler.startup["import"] = time.perf_counter() - _import_start
 
 
 def register():
+    start = time.perf_counter()
     for module in register_modules:
         module.register()
+    profiler.startup["register"] = time.perf_counter() - start
+
+    if bpy.app.debug_python:
+        print(profiler.startup_report())
 
 
 def unregister():
@@ -0,0 +1,349 @@
+'''Applies uv_kit operations to many .blend files, with a pool of background Blender workers.
+
+    blender -b -P uv_kit/batch.py -- job.json --out results.jsonl --workers 8
+    python uv_kit/batch.py job.json --out results.jsonl
+
+The job is a JSON file, paths are relative to it:
+
+    {
+        "files": ["assets/**/*.blend"],
+        "exclude": ["**/archive/**"],
+        "objects": ["SM_*"],
+        "collections": ["Export"],
+        "faces": "all",
+        "operations": [
+            {"op": "sync_uv_maps", "order": ["UVMap", "lightmap"]},
+            {"op": "select_uv_edgeloop", "mode": "CONTINUOS"},
+            {"op": "straighten", "mode": "EVEN"},
+            {"op": "align_uv_edgeloops", "direction": "AUTO", "mode": "AVERAGE", "apply_per_edgeloop": true},
+            {"op": "copy_uvs", "source": "UVMap", "destination": "lightmap", "all_faces": true},
+            {"op": "sort_uv_maps"}
+        ],
+        "save": true
+    }
+
+objects and collections are name patterns, without them all mesh objects are used. The uv tools
+work on the uv selection saved in the files - on the selected faces, or on all faces with "faces": "all".
+The uv operations take the active uv map or the one named by "uv_map". Files are only written with
+"save": true, or as copies below "output_dir".
+
+Every file gets one JSON line in the results, written as soon as it's done. Running the job again
+with the same results file skips the files which already succeeded, so crashed, timed out or failed
+files get another try. A crashing file only takes down its worker, which gets replaced.
+'''
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from typing import Dict, List
+
+RESULT_PREFIX = "UVKIT_BATCH "
+READY = RESULT_PREFIX + "ready"
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="apply uv_kit operations to .blend files")
+    parser.add_argument("job", help="job json file")
+    parser.add_argument("--out", default=None, help="results as json lines, default is <job>.results.jsonl")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--blender", default=None, help="blender executable for the workers, default is the running one")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per file before its worker gets killed")
+    parser.add_argument("--files-per-worker", type=int, default=50, help="restart workers after this many files to keep memory in check")
+    parser.add_argument("--force", action="store_true", help="also process the files which already succeeded")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def load_job(path:str) -> Dict:
+    with open(path) as f:
+        job = json.load(f)
+
+    if not job.get("files"):
+        raise ValueError(f"{path}: the job has no files")
+    for operation in job.get("operations", []):
+        if operation.get("op") not in OPERATION_NAMES:
+            raise ValueError(f"{path}: unknown operation {operation.get('op')}, expected one of {', '.join(OPERATION_NAMES)}")
+    return job
+
+
+def job_hash(job:Dict) -> str:
+    '''identifies the job, a result only counts as done for the same job'''
+    return hashlib.sha1(json.dumps(job, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def job_files(job:Dict, base_dir:str) -> List[str]:
+    '''the files matching the globs of the job, without the excluded ones'''
+    files = set()
+    for pattern in job["files"]:
+        files.update(glob.glob(os.path.join(base_dir, pattern), recursive=True))
+
+    excluded = set()
+    for pattern in job.get("exclude", []):
+        excluded.update(glob.glob(os.path.join(base_dir, pattern), recursive=True))
+
+    return sorted(os.path.abspath(path) for path in files - excluded if path.endswith(".blend"))
+
+
+def finished_files(out:str, hash:str) -> set:
+    '''files with a successful result of this job in an earlier run'''
+    finished = set()
+    if not os.path.exists(out):
+        return finished
+
+    with open(out) as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # the last line of a killed run can be cut off
+                continue
+            if result.get("job") != hash:
+                continue
+            if result.get("status") == "ok":
+                finished.add(result["file"])
+            else:
+                finished.discard(result["file"])
+    return finished
+
+
+# -------------------------------------------------------------------
+#   Coordinator
+# -------------------------------------------------------------------
+
+def worker_command(args) -> List[str]:
+    script = os.path.abspath(__file__)
+    job = os.path.abspath(args.job)
+
+    blender = args.blender
+    if blender is None:
+        try:
+            import bpy
+            blender = bpy.app.binary_path
+        except ImportError:
+            blender = "blender"
+
+    # the bpy module has no blender executable, its workers run with the same python
+    if not blender:
+        return [sys.executable, script, job, "--worker"]
+    return [blender, "-b", "--factory-startup", "-P", script, "--", job, "--worker"]
+
+
+class Worker():
+    '''one background Blender, gets a file path per line on stdin and answers with a result line on stdout'''
+
+    def __init__(self, command:List[str], name:str) -> None:
+        self.name = name
+        self.files = 0
+        self.log = tempfile.TemporaryFile(mode="w+")
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=self.log, text=True, bufsize=1,
+        )
+        # starting blender and importing the addon doesn't count into the timeout of the first file
+        for line in self.process.stdout:
+            if line.startswith(READY):
+                break
+
+    def process_file(self, path:str, timeout:float) -> Dict:
+        self.files += 1
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            self.process.kill()
+
+        watchdog = threading.Timer(timeout, kill)
+        watchdog.start()
+        try:
+            self.process.stdin.write(path + "\n")
+            self.process.stdin.flush()
+
+            # blender prints to stdout as well, the result has its own prefix
+            for line in self.process.stdout:
+                if line.startswith(RESULT_PREFIX):
+                    return json.loads(line[len(RESULT_PREFIX):])
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            watchdog.cancel()
+
+        # no result - the worker is gone
+        self.process.wait()
+        return {
+            "file": path,
+            "status": "timeout" if timed_out.is_set() else "crashed",
+            "returncode": self.process.returncode,
+            "log": self.log_tail(),
+        }
+
+    def log_tail(self, lines:int=20) -> str:
+        self.log.seek(0)
+        return "".join(self.log.readlines()[-lines:])
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def close(self) -> None:
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.log.close()
+
+
+def run_workers(args, files:List[str], hash:str, out:str) -> Dict[str, int]:
+    '''processes the files with a pool of workers, every worker takes the next file when it's done with the last one'''
+    pending = queue.Queue()
+    for path in files:
+        pending.put(path)
+
+    command = worker_command(args)
+    lock = threading.Lock()
+    status_counts: Dict[str, int] = {}
+    started = time.perf_counter()
+
+    with open(out, "a") as results:
+
+        def write(result:Dict) -> None:
+            result["job"] = hash
+            with lock:
+                results.write(json.dumps(result) + "\n")
+                results.flush()
+                status_counts[result["status"]] = status_counts.get(result["status"], 0) + 1
+                done = sum(status_counts.values())
+                print(f"[{done}/{len(files)}] {result['status']:<8} {result.get('time', 0.0):8.2f}s {result['file']}", file=sys.stderr)
+
+        def work(index:int) -> None:
+            worker = None
+            while True:
+                try:
+                    path = pending.get_nowait()
+                except queue.Empty:
+                    break
+
+                if worker is None or not worker.alive or worker.files >= args.files_per_worker:
+                    if worker is not None:
+                        worker.close()
+                    worker = Worker(command, f"worker-{index}")
+
+                result = worker.process_file(path, args.timeout)
+                result["worker"] = worker.name
+                write(result)
+
+            if worker is not None:
+                worker.close()
+
+        threads = [threading.Thread(target=work, args=(index,)) for index in range(min(args.workers, len(files)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    print(f"{len(files)} files in {time.perf_counter() - started:.1f}s: {status_counts}", file=sys.stderr)
+    return status_counts
+
+
+def main():
+    args = parse_args()
+    if args.worker:
+        return run_worker(args)
+
+    job = load_job(args.job)
+    hash = job_hash(job)
+    out = args.out or os.path.splitext(args.job)[0] + ".results.jsonl"
+
+    files = job_files(job, os.path.dirname(os.path.abspath(args.job)))
+    if not args.force:
+        finished = finished_files(out, hash)
+        skipped = len([path for path in files if path in finished])
+        files = [path for path in files if path not in finished]
+        if skipped:
+            print(f"skipping {skipped} files which are already done", file=sys.stderr)
+
+    status_counts = run_workers(args, files, hash, out) if files else {}
+    failed = sum(count for status, count in status_counts.items() if status != "ok")
+    sys.exit(1 if failed else 0)
+
+
+# -------------------------------------------------------------------
+#   Worker
+# -------------------------------------------------------------------
+
+OPERATION_NAMES = (
+    "select_uv_edgeloop",
+    "select_uv_edgering",
+    "align_uv_edgeloops",
+    "straighten",
+    "align",
+    "rotate",
+    "constrained_unwrap",
+    "copy_uvs",
+    "sort_uv_maps",
+    "sync_uv_maps",
+)
+
+
+def import_addon():
+    '''imports the addon this script belongs to as a package, the operations don't need it registered'''
+    import importlib
+
+    addon_dir = os.path.dirname(os.path.abspath(__file__))
+    addon_name = os.path.basename(addon_dir)
+
+    if os.path.dirname(addon_dir) not in sys.path:
+        sys.path.insert(0, os.path.dirname(addon_dir))
+
+    return addon_name, importlib.import_module(addon_name)
+
+
+def run_worker(args) -> None:
+    import importlib
+    import traceback
+
+    import bpy
+
+    job = load_job(args.job)
+    base_dir = os.path.dirname(os.path.abspath(args.job))
+    addon_name, _ = import_addon()
+    operations = importlib.import_module(f"{addon_name}.batch_operations")
+
+    sys.stdout.write(READY + "\n")
+    sys.stdout.flush()
+
+    for line in sys.stdin:
+        path = line.strip()
+        if not path:
+            continue
+
+        start = time.perf_counter()
+        result = {"file": path, "status": "ok"}
+        try:
+            result.update(operations.process_file(path, job, base_dir))
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["traceback"] = traceback.format_exc()
+        result["time"] = time.perf_counter() - start
+
+        # the next file starts from an empty scene, also after an error
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+
+        sys.stdout.write(RESULT_PREFIX + json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+'''The operations of batch.py - the same code as the operators, run on the meshes in object mode without any editor.'''
+
+import fnmatch
+import math
+import os
+import time
+
+from typing import Callable, Dict, List
+
+import bpy
+
+from .mesh_objects import unique_mesh_objects
+from .snapshot import UVMeshSnapshot
+from .core.align import align_uv_edgeloops, align_uvs, uv_selection_bounds
+from .core.select import (expand_uv_edgeloops, expand_uv_edgerings, select_uv_edgeloops_of_selection,
+                          select_uv_edgerings_of_selection, shrink_uv_edgeloops, shrink_uv_edgerings)
+from .core.rotate import rotate_uvs
+from .core.straighten import straighten_uv_edgeloops
+from .core.unwrap import constrained_unwrap
+from .uv_layer_data import copy_uvs, reorder_uv_layers, uv_layer_names
+from .uv_layers import uv_map_index
+
+
+def job_objects(job:Dict) -> List[bpy.types.Object]:
+    '''the mesh objects of the scene the job applies to, one object per mesh'''
+    objects = list(bpy.context.scene.objects)
+
+    if job.get("collections"):
+        in_collections = set()
+        for collection in bpy.data.collections:
+            if any(fnmatch.fnmatchcase(collection.name, pattern) for pattern in job["collections"]):
+                in_collections.update(collection.all_objects)
+        objects = [obj for obj in objects if obj in in_collections]
+
+    if job.get("objects"):
+        objects = [obj for obj in objects if any(fnmatch.fnmatchcase(obj.name, pattern) for pattern in job["objects"])]
+
+    # linked meshes can't be changed
+    return [obj for obj in unique_mesh_objects(objects) if obj.data.library is None]
+
+
+# the classes in List[] are quoted - the cached typing alias would keep them and the bpy types in their
+# annotations alive past the bpy shutdown, which crashes the bpy module on exit
+def snapshots(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> List["UVMeshSnapshot"]:
+    '''snapshots of the uv map the operation works on, meshes without it are left out'''
+    result = []
+    for obj in objects:
+        uvs = obj.data.uv_layers
+        uv_map = operation.get("uv_map") or (uvs.active.name if uvs.active else None)
+        if uv_map is None or uv_map not in uvs:
+            continue
+
+        snapshot = UVMeshSnapshot.from_mesh(obj.data, uv_map)
+        if job.get("faces") == "all":
+            snapshot.use_all_faces()
+        result.append(snapshot)
+    return result
+
+
+def write_flags(meshes:List["UVMeshSnapshot"]) -> Dict:
+    changed = sum(len(snapshot.changed_flag_loops()) for snapshot in meshes)
+    for snapshot in meshes:
+        snapshot.write_uv_flags()
+    return {"meshes": len(meshes), "changed_loops": changed}
+
+
+def write_uvs(meshes:List["UVMeshSnapshot"]) -> Dict:
+    changed = sum(len(snapshot.changed_uv_loops()) for snapshot in meshes)
+    for snapshot in meshes:
+        snapshot.write_uvs()
+    return {"meshes": len(meshes), "changed_loops": changed}
+
+
+def select_uv_edgeloop(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    select = {
+        "CONTINUOS": select_uv_edgeloops_of_selection,
+        "EXPAND": expand_uv_edgeloops,
+        "SHRINK": shrink_uv_edgeloops,
+    }[operation.get("mode", "CONTINUOS")]
+
+    meshes = snapshots(objects, operation, job)
+    for snapshot in meshes:
+        select(snapshot)
+    return write_flags(meshes)
+
+
+def select_uv_edgering(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    select = {
+        "CONTINUOS": select_uv_edgerings_of_selection,
+        "EXPAND": expand_uv_edgerings,
+        "SHRINK": shrink_uv_edgerings,
+    }[operation.get("mode", "CONTINUOS")]
+
+    meshes = snapshots(objects, operation, job)
+    for snapshot in meshes:
+        select(snapshot)
+    return write_flags(meshes)
+
+
+def align_edgeloops(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    meshes = snapshots(objects, operation, job)
+    align_uv_edgeloops(
+        meshes, operation.get("direction", "AUTO"), operation.get("mode", "AVERAGE"), operation.get("apply_per_edgeloop", True)
+    )
+    return write_uvs(meshes)
+
+
+def straighten(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    meshes = snapshots(objects, operation, job)
+    for snapshot in meshes:
+        straighten_uv_edgeloops(snapshot, operation.get("mode", "GEOMETRY"))
+    return write_uvs(meshes)
+
+
+def align(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    meshes = snapshots(objects, operation, job)
+    move_island = operation.get("move_island", False)
+
+    bounds = uv_selection_bounds(meshes, move_island)
+    if bounds is not None:
+        if operation.get("use_unit_square", False):
+            bounds.set_to_unit_square()
+        align_uvs(meshes, bounds, operation.get("direction", "center"), move_island)
+    return write_uvs(meshes)
+
+
+def rotate(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    '''angle in degrees, counter-clockwise'''
+    meshes = snapshots(objects, operation, job)
+    rotate_uvs(
+        meshes,
+        math.radians(operation.get("angle", 90.0)),
+        operation.get("pivot", "CENTER"),
+        operation.get("cursor", (0.0, 0.0)),
+        operation.get("use_island", False),
+        operation.get("aspect", (1.0, 1.0)),
+    )
+    return write_uvs(meshes)
+
+
+def unwrap(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    '''conformal, the selected uvs stay in place'''
+    meshes = snapshots(objects, operation, job)
+    iterations = 0
+    for snapshot in meshes:
+        iterations += constrained_unwrap(snapshot, operation.get("ignore_seams", False), operation.get("ignore_pins", False))
+    return dict(write_uvs(meshes), iterations=iterations)
+
+
+def copy_uv_faces(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    faces = 0
+    for obj in objects:
+        faces += copy_uvs(obj.data, operation["source"], operation["destination"], operation.get("all_faces", False))
+    return {"meshes": len(objects), "faces": faces}
+
+
+def sort_uv_maps(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    written = 0
+    for obj in objects:
+        written += reorder_uv_layers(obj.data, sorted(uv_layer_names(obj.data)))
+    return {"meshes": len(objects), "maps_written": written}
+
+
+def sync_uv_maps(objects:List[bpy.types.Object], operation:Dict, job:Dict) -> Dict:
+    '''creates the missing uv maps of the order as copy of the first uv map, like Sync in the uv map list, and brings them into that order'''
+    order = operation["order"]
+    created = 0
+    written = 0
+    skipped = []
+
+    for obj in objects:
+        mesh = obj.data
+        uvs = mesh.uv_layers
+        missing = [name for name in order if name not in uvs]
+
+        # TODO this might be obsolete already, can add more than 8 uv layers via attributes...
+        if len(uvs) + len(missing) > 8:
+            skipped.append(obj.name)
+            continue
+
+        if missing:
+            active_name = uvs.active.name if uvs.active else None
+            if len(uvs) > 0:
+                uvs[0].active = True
+            for name in missing:
+                uvs.new(name=name, do_init=True)
+            if active_name is not None:
+                uvs[active_name].active = True
+            uv_map_index.discard(mesh)
+            created += len(missing)
+
+        names = uv_layer_names(mesh)
+        written += reorder_uv_layers(mesh, order + [name for name in names if name not in order])
+
+    result = {"meshes": len(objects), "maps_created": created, "maps_written": written}
+    if skipped:
+        result["skipped"] = skipped
+        result["reason"] = "UV map limit reached, cannot have more than 8 UV maps."
+    return result
+
+
+OPERATIONS: Dict[str, Callable[[List[bpy.types.Object], Dict, Dict], Dict]] = {
+    "select_uv_edgeloop": select_uv_edgeloop,
+    "select_uv_edgering": select_uv_edgering,
+    "align_uv_edgeloops": align_edgeloops,
+    "straighten": straighten,
+    "align": align,
+    "rotate": rotate,
+    "constrained_unwrap": unwrap,
+    "copy_uvs": copy_uv_faces,
+    "sort_uv_maps": sort_uv_maps,
+    "sync_uv_maps": sync_uv_maps,
+}
+
+
+def output_path(path:str, job:Dict, base_dir:str) -> str:
+    '''where to save the file - next to the other outputs with the same path relative to the job'''
+    output_dir = os.path.join(base_dir, job["output_dir"])
+    relative = os.path.relpath(path, base_dir)
+    if relative.startswith(os.pardir):
+        relative = os.path.basename(path)
+    return os.path.join(output_dir, relative)
+
+
+def process_file(path:str, job:Dict, base_dir:str) -> Dict:
+    '''opens the file, applies the operations of the job in order and saves it'''
+    result = {}
+
+    start = time.perf_counter()
+    bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+    if bpy.context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    result["load_time"] = time.perf_counter() - start
+
+    objects = job_objects(job)
+    result["objects"] = len(objects)
+
+    result["operations"] = []
+    for operation in job.get("operations", []):
+        start = time.perf_counter()
+        stats = OPERATIONS[operation["op"]](objects, operation, job)
+        stats["op"] = operation["op"]
+        stats["time"] = time.perf_counter() - start
+        result["operations"].append(stats)
+
+    start = time.perf_counter()
+    if job.get("save"):
+        bpy.ops.wm.save_mainfile()
+        result["saved"] = path
+    elif job.get("output_dir"):
+        target = output_path(path, job, base_dir)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=target, copy=True)
+        result["saved"] = target
+    result["save_time"] = time.perf_counter() - start
+
+    return result
@@ -0,0 +1 @@
+'''headless benchmarks of the uv_kit operators, see run.py'''
@@ -0,0 +1,187 @@
+import math
+
+import bpy
+import numpy as np
+
+from typing import Callable, Dict, List
+
+from ..core.islands import find_uv_islands
+from ..snapshot import UVMeshSnapshot
+
+
+class BenchmarkCase():
+    '''one timed operator call - prepare runs untimed right before it, after the selection is set up'''
+
+    def __init__(self, name:str, operator:str, properties:Dict=None, mode:str="EDIT", selection:str=None,
+                 prepare:Callable[[List[bpy.types.Object]], None]=None, uses_uv_editor:bool=False) -> None:
+        self.name = name
+        self.operator = operator
+        self.properties = properties or {}
+        self.mode = mode
+        self.selection = selection  # "edges", "verts", "islands" or None
+        self.prepare = prepare
+        self.uses_uv_editor = uses_uv_editor  # runs in an uv editor when there is a window
+
+    def call(self) -> None:
+        category, name = self.operator.split(".")
+        getattr(getattr(bpy.ops, category), name)(**self.properties)
+
+
+def _select_edgeloops(objects:List[bpy.types.Object]) -> None:
+    bpy.ops.view2d.uvkit_select_uv_edgeloop(mode="CONTINUOS")
+
+
+def _select_edgerings(objects:List[bpy.types.Object]) -> None:
+    bpy.ops.view2d.uvkit_select_uv_edgering(mode="CONTINUOS")
+
+
+def _update_uv_list(objects:List[bpy.types.Object]) -> None:
+    bpy.ops.uvkit.uv_list_update()
+
+
+def _activate_second_uv_map(objects:List[bpy.types.Object]) -> None:
+    for obj in objects:
+        obj.data.uv_layers.active_index = 1
+    bpy.ops.uvkit.uv_list_update()
+
+
+def create_cases() -> List[BenchmarkCase]:
+    cases = []
+
+    for mode in ("CONTINUOS", "EXPAND", "SHRINK"):
+        cases.append(BenchmarkCase(
+            f"select_uv_edgeloop_{mode.lower()}", "view2d.uvkit_select_uv_edgeloop", {"mode": mode},
+            selection="edges", prepare=_select_edgeloops if mode == "SHRINK" else None,
+        ))
+        cases.append(BenchmarkCase(
+            f"select_uv_edgering_{mode.lower()}", "view2d.uvkit_select_uv_edgering", {"mode": mode},
+            selection="edges", prepare=_select_edgerings if mode == "SHRINK" else None,
+        ))
+
+    cases += [
+        BenchmarkCase(
+            "align_uv_edgeloops", "view2d.uvkit_align_uv_edgeloops", {"direction": "AUTO", "mode": "AVERAGE"},
+            selection="edges", prepare=_select_edgeloops,
+        ),
+        BenchmarkCase(
+            "spread_loop", "view2d.uvkit_spread_loop", {"mode": "GEOMETRY"},
+            selection="edges", prepare=_select_edgeloops,
+        ),
+        BenchmarkCase(
+            "constrained_unwrap", "view2d.uvkit_constrained_unwrap", {"mode": "ANGLE_BASED"},
+            selection="verts",
+        ),
+        BenchmarkCase(
+            "constrained_unwrap_conformal", "view2d.uvkit_constrained_unwrap", {"mode": "CONFORMAL"},
+            selection="islands",
+        ),
+        BenchmarkCase("align", "view2d.uvkit_align", {"direction": "center"}, selection="verts"),
+        BenchmarkCase("align_island", "view2d.uvkit_align", {"direction": "left", "move_island": True}, selection="verts"),
+        BenchmarkCase(
+            "rotate_shell", "view2d.uvkit_rotate_shell", {"angle": math.pi * 0.5},
+            selection="verts", uses_uv_editor=True,
+        ),
+        BenchmarkCase(
+            "rotate_shell_island", "view2d.uvkit_rotate_shell", {"angle": math.pi * 0.5, "use_island": True},
+            selection="verts", uses_uv_editor=True,
+        ),
+        BenchmarkCase("uv_list_update", "uvkit.uv_list_update", mode="OBJECT"),
+        BenchmarkCase(
+            "uv_list_new_map", "uvkit.uv_list_new_map", {"uv_layer_name": "lightmap", "mode": "Duplicate"},
+            mode="OBJECT", prepare=_update_uv_list,
+        ),
+        BenchmarkCase(
+            "uv_list_delete_map", "uvkit.uv_list_delete_map", {"uv_layer_name": "bake"},
+            mode="OBJECT", prepare=_update_uv_list,
+        ),
+        BenchmarkCase(
+            "uv_list_set_map_render_active", "uvkit.uv_list_set_map_render_active", {"uv_layer_name": "detail"},
+            mode="OBJECT", prepare=_update_uv_list,
+        ),
+        BenchmarkCase("uv_list_move_slot_down", "uvkit.uv_list_move_slot_down", mode="OBJECT", prepare=_update_uv_list),
+        BenchmarkCase("uv_list_move_slot_up", "uvkit.uv_list_move_slot_up", mode="OBJECT", prepare=_activate_second_uv_map),
+        BenchmarkCase("uv_list_sort_maps_a_to_z", "uvkit.uv_list_sort_maps_a_to_z", mode="OBJECT", prepare=_update_uv_list),
+        BenchmarkCase(
+            "copy_uvs", "view2d.uvkit_copy_uvs", {"source": "UVMap", "destination": "lightmap"},
+            selection="verts", prepare=_update_uv_list,
+        ),
+        BenchmarkCase(
+            "copy_uvs_all_faces", "view2d.uvkit_copy_uvs", {"source": "UVMap", "destination": "lightmap", "all_faces": True},
+            prepare=_update_uv_list,
+        ),
+    ]
+    return cases
+
+
+class FixtureState():
+    '''uv maps, flags and seams of the fixture objects, to start every run from the same data'''
+
+    def __init__(self, objects:List[bpy.types.Object]) -> None:
+        self.objects = objects
+        self.meshes = {}
+
+        for obj in objects:
+            mesh = obj.data
+            uv_maps = []
+            for uv_layer in mesh.uv_layers:
+                uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+                uv_layer.uv.foreach_get("vector", uv)
+                uv_maps.append((uv_layer.name, uv))
+
+            seams = np.empty(len(mesh.edges), dtype=bool)
+            mesh.edges.foreach_get("use_seam", seams)
+
+            self.meshes[mesh.name] = (uv_maps, seams)
+
+    def restore(self) -> None:
+        '''restores the captured state - objects have to be in object mode'''
+        for obj in self.objects:
+            mesh = obj.data
+            uv_maps, seams = self.meshes[mesh.name]
+
+            if [uv_layer.name for uv_layer in mesh.uv_layers] != [name for name, _ in uv_maps]:
+                while len(mesh.uv_layers):
+                    mesh.uv_layers.remove(mesh.uv_layers[0])
+                for name, _ in uv_maps:
+                    mesh.uv_layers.new(name=name)
+
+            # without uv selection and pin layers, like a freshly imported mesh - the operators have to
+            # cope with their layers getting created, which moves the loop data of all uv maps
+            for name, uv in uv_maps:
+                mesh.uv_layers[name].uv.foreach_set("vector", uv)
+                for prefix in (".vs.", ".es.", ".pn."):
+                    attribute = mesh.attributes.get(prefix + name)
+                    if attribute is not None:
+                        mesh.attributes.remove(attribute)
+
+            mesh.uv_layers.active_index = 0
+            mesh.uv_layers[0].active_render = True
+            mesh.edges.foreach_set("use_seam", seams)
+
+            for domain in (mesh.vertices, mesh.edges, mesh.polygons):
+                domain.foreach_set("select", np.ones(len(domain), dtype=bool))
+            mesh.update()
+
+
+def select_uvs(objects:List[bpy.types.Object], selection:str, count:int, seed:int) -> None:
+    '''random uv edge or uv vert selection, flushed to all loops sharing the uv - objects have to be in object mode
+
+    "islands" selects one random uv vert in every uv island instead of count loops'''
+    rng = np.random.RandomState(seed)
+
+    for obj in objects:
+        snapshot = UVMeshSnapshot.from_mesh(obj.data, obj.data.uv_layers.active.name)
+        if selection == "islands":
+            # one random uv in every island, so all of them get unwrapped
+            islands = find_uv_islands(snapshot)
+            offsets = (rng.random_sample(islands.count) * np.diff(islands.loop_start)).astype(np.int32)
+            loops = islands.loops[islands.loop_start[:-1] + offsets]
+        else:
+            loops = rng.choice(snapshot.loop_count, size=min(count, snapshot.loop_count), replace=False)
+
+        if selection == "edges":
+            snapshot.select_uv_edges(loops)
+        else:
+            snapshot.vert_select[snapshot.connected_uv_loops(loops)] = True
+
+        snapshot.write_uv_flags()
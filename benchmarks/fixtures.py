@@ -0,0 +1,213 @@
+import math
+
+import bpy
+import numpy as np
+
+from typing import List
+
+FIXTURES = ("grid", "cylinder", "torus", "mixed", "split", "triangles", "multi")
+
+UV_MAP_NAMES = ("UVMap", "lightmap", "detail", "bake")
+
+
+def _grid_size(face_count:int) -> int:
+    return max(2, int(round(math.sqrt(face_count))))
+
+
+def _quad_grid(nu:int, nv:int, wrap_u:bool=False, wrap_v:bool=False):
+    '''corner indices of a nu x nv quad grid - returns the per quad (col, row) corners and the vert index per corner'''
+    cols, rows = np.meshgrid(np.arange(nu), np.arange(nv))
+    cols = cols.ravel()
+    rows = rows.ravel()
+
+    # counter clockwise corners of every quad
+    corner_cols = np.stack((cols, cols + 1, cols + 1, cols), axis=1)
+    corner_rows = np.stack((rows, rows, rows + 1, rows + 1), axis=1)
+
+    vert_cols = nu if wrap_u else nu + 1
+    vert_rows = nv if wrap_v else nv + 1
+    corner_verts = (corner_rows % vert_rows) * vert_cols + (corner_cols % vert_cols)
+
+    return corner_cols, corner_rows, corner_verts, vert_cols, vert_rows
+
+
+def _vert_params(vert_cols:int, vert_rows:int):
+    cols, rows = np.meshgrid(np.arange(vert_cols), np.arange(vert_rows))
+    return cols.ravel().astype(np.float64), rows.ravel().astype(np.float64)
+
+
+def _link_object(name:str, co:np.ndarray, face_sizes:np.ndarray, loop_verts:np.ndarray, uv:np.ndarray, location=(0, 0, 0), uv_map_names=UV_MAP_NAMES) -> bpy.types.Object:
+    '''builds the mesh with foreach_set, so even the big fixtures are created in a few seconds'''
+    mesh = bpy.data.meshes.new(name)
+
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts.astype(np.int32))
+
+    loop_start = np.zeros(len(face_sizes), dtype=np.int32)
+    np.cumsum(face_sizes[:-1], out=loop_start[1:])
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set("loop_start", loop_start)
+
+    mesh.update(calc_edges=True)
+
+    for uv_map_name in uv_map_names:
+        uv_layer = mesh.uv_layers.new(name=uv_map_name)
+        uv_layer.uv.foreach_set("vector", uv.astype(np.float32).ravel())
+    mesh.uv_layers.active_index = 0
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _grid_object(name:str, face_count:int, location=(0, 0, 0)) -> bpy.types.Object:
+    n = _grid_size(face_count)
+    corner_cols, corner_rows, corner_verts, vert_cols, vert_rows = _quad_grid(n, n)
+
+    cols, rows = _vert_params(vert_cols, vert_rows)
+    co = np.column_stack((cols / n - 0.5, rows / n - 0.5, np.zeros_like(cols)))
+    uv = np.stack((corner_cols / n, corner_rows / n), axis=-1).reshape(-1, 2)
+
+    return _link_object(name, co, np.full(n * n, 4), corner_verts.ravel(), uv, location)
+
+
+def _cylinder_object(name:str, face_count:int) -> bpy.types.Object:
+    # around the cylinder with a uv seam where the columns wrap
+    n = _grid_size(face_count)
+    corner_cols, corner_rows, corner_verts, vert_cols, vert_rows = _quad_grid(n, n, wrap_u=True)
+
+    cols, rows = _vert_params(vert_cols, vert_rows)
+    angle = cols / n * 2.0 * math.pi
+    co = np.column_stack((np.cos(angle), np.sin(angle), rows / n * 2.0))
+    uv = np.stack((corner_cols / n, corner_rows / n), axis=-1).reshape(-1, 2)
+
+    return _link_object(name, co, np.full(n * n, 4), corner_verts.ravel(), uv)
+
+
+def _torus_object(name:str, face_count:int) -> bpy.types.Object:
+    # closed in both directions, with two uv seams
+    n = _grid_size(face_count)
+    corner_cols, corner_rows, corner_verts, vert_cols, vert_rows = _quad_grid(n, n, wrap_u=True, wrap_v=True)
+
+    cols, rows = _vert_params(vert_cols, vert_rows)
+    major = cols / n * 2.0 * math.pi
+    minor = rows / n * 2.0 * math.pi
+    radius = 1.0 + 0.25 * np.cos(minor)
+    co = np.column_stack((radius * np.cos(major), radius * np.sin(major), 0.25 * np.sin(minor)))
+    uv = np.stack((corner_cols / n, corner_rows / n), axis=-1).reshape(-1, 2)
+
+    return _link_object(name, co, np.full(n * n, 4), corner_verts.ravel(), uv)
+
+
+def _mixed_object(name:str, face_count:int, seed:int) -> bpy.types.Object:
+    '''rows of quads, triangulated quads and ngons built from two quads'''
+    n = _grid_size(face_count)
+    n += n % 2
+    corner_cols, corner_rows, corner_verts, vert_cols, vert_rows = _quad_grid(n, n)
+
+    cols, rows = _vert_params(vert_cols, vert_rows)
+    co = np.column_stack((cols / n - 0.5, rows / n - 0.5, np.zeros_like(cols)))
+
+    row_kind = np.random.RandomState(seed).randint(0, 3, size=n)
+    quad_kind = row_kind[corner_rows[:, 0]]
+
+    face_sizes = []
+    loop_cols = []
+    loop_rows = []
+    loop_verts = []
+
+    def add(sizes, corners):
+        face_sizes.append(sizes)
+        loop_cols.append(corner_cols[corners].ravel())
+        loop_rows.append(corner_rows[corners].ravel())
+        loop_verts.append(corner_verts[corners].ravel())
+
+    # quads
+    quads = np.flatnonzero(quad_kind == 0)
+    add(np.full(len(quads), 4), (quads[:, None], np.arange(4)[None, :]))
+
+    # two triangles per quad
+    tris = np.flatnonzero(quad_kind == 1)
+    tri_quads = np.repeat(tris, 2)
+    tri_corners = np.tile(np.array([[0, 1, 2], [0, 2, 3]]), (len(tris), 1))
+    add(np.full(len(tri_quads), 3), (tri_quads[:, None], tri_corners))
+
+    # hexagons from two neighbouring quads
+    left = np.flatnonzero((quad_kind == 2) & (corner_cols[:, 0] % 2 == 0))
+    right = left + 1
+    hexagon_quads = np.stack((left, left, right, right, right, left), axis=1)
+    hexagon_corners = np.tile(np.array([0, 1, 1, 2, 3, 3]), (len(left), 1))
+    add(np.full(len(left), 6), (hexagon_quads, hexagon_corners))
+
+    uv = np.column_stack((np.concatenate(loop_cols) / n, np.concatenate(loop_rows) / n))
+    return _link_object(name, co, np.concatenate(face_sizes), np.concatenate(loop_verts), uv)
+
+
+def _split_object(name:str, face_count:int, island_size:int=4) -> bpy.types.Object:
+    '''a grid cut into many small uv islands - lots of split uv verts'''
+    n = _grid_size(face_count)
+    corner_cols, corner_rows, corner_verts, vert_cols, vert_rows = _quad_grid(n, n)
+
+    cols, rows = _vert_params(vert_cols, vert_rows)
+    co = np.column_stack((cols / n - 0.5, rows / n - 0.5, np.zeros_like(cols)))
+
+    # every island gets a gap, so the loops on the island borders don't share uvs anymore
+    island_cols = np.repeat(corner_cols[:, :1] // island_size, 4, axis=1)
+    island_rows = np.repeat(corner_rows[:, :1] // island_size, 4, axis=1)
+    gap = 0.5
+    scale = n + gap * (n // island_size + 1)
+    uv = np.stack(((corner_cols + island_cols * gap) / scale, (corner_rows + island_rows * gap) / scale), axis=-1)
+
+    return _link_object(name, co, np.full(n * n, 4), corner_verts.ravel(), uv.reshape(-1, 2))
+
+
+def _triangles_object(name:str, face_count:int) -> bpy.types.Object:
+    '''separate triangles, each its own uv island - like a lightmap with every triangle split off'''
+    n = _grid_size(face_count)
+    corner_cols, corner_rows, _, _, _ = _quad_grid(n, n)
+
+    # the first half of every quad, with its own three verts
+    corners = np.array([0, 1, 2])
+    cols = corner_cols[:, corners].ravel()
+    rows = corner_rows[:, corners].ravel()
+    co = np.column_stack((cols / n - 0.5, rows / n - 0.5, np.zeros_like(cols, dtype=np.float64)))
+
+    # shrunk towards the first corner of their quad, so no two triangles share an uv
+    origin_cols = np.repeat(corner_cols[:, 0], 3)
+    origin_rows = np.repeat(corner_rows[:, 0], 3)
+    uv = np.column_stack((origin_cols + (cols - origin_cols) * 0.8, origin_rows + (rows - origin_rows) * 0.8)) / n
+
+    return _link_object(name, co, np.full(n * n, 3), np.arange(3 * n * n), uv)
+
+
+def create_fixture(kind:str, face_count:int, seed:int=0) -> List[bpy.types.Object]:
+    '''adds the objects of a fixture to the scene - the same arguments always give the same meshes'''
+    name = f"bench_{kind}"
+
+    if kind == "grid":
+        return [_grid_object(name, face_count)]
+    elif kind == "cylinder":
+        return [_cylinder_object(name, face_count)]
+    elif kind == "torus":
+        return [_torus_object(name, face_count)]
+    elif kind == "mixed":
+        return [_mixed_object(name, face_count, seed)]
+    elif kind == "split":
+        return [_split_object(name, face_count)]
+    elif kind == "triangles":
+        return [_triangles_object(name, face_count)]
+    elif kind == "multi":
+        return [_grid_object(f"{name}_{i}", face_count // 4, location=(i * 1.5, 0, 0)) for i in range(4)]
+
+    raise ValueError(f"unknown fixture: {kind}")
+
+
+def remove_fixture(objects:List[bpy.types.Object]) -> None:
+    for obj in objects:
+        mesh = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
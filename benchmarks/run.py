@@ -0,0 +1,211 @@
+'''Benchmarks the uv_kit operators on generated meshes and writes the results as JSON.
+
+Runs in background mode or with the bpy module:
+
+    blender -b --factory-startup -P benchmarks/run.py -- --sizes 10000 100000 --out results.json
+    python benchmarks/run.py --sizes 10000 --fixtures grid torus --cases select_uv
+
+Every case starts from the same fixture state, runs the operator --repeat times and once more
+under tracemalloc for the peak memory.
+'''
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import bpy
+
+try:
+    import resource
+except ImportError:
+    # not available on windows
+    resource = None
+
+
+def import_addon():
+    '''imports the addon this script belongs to as a package and registers it when needed'''
+    addon_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    addon_name = os.path.basename(addon_dir)
+
+    if os.path.dirname(addon_dir) not in sys.path:
+        sys.path.insert(0, os.path.dirname(addon_dir))
+
+    addon = importlib.import_module(addon_name)
+    if not hasattr(bpy.types.Scene, "uvkit_uv_list"):
+        addon.register()
+    return addon, addon_name
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="uv_kit operator benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="face counts, up to 2000000")
+    parser.add_argument("--fixtures", nargs="+", default=None, help="fixture kinds, default is all")
+    parser.add_argument("--cases", nargs="+", default=None, help="only run cases containing one of these names")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--select", type=int, default=100, help="number of randomly selected uv edges / verts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the extra tracemalloc run")
+    parser.add_argument("--out", default=None, help="json file, default is stdout")
+    return parser.parse_args(argv)
+
+
+def find_uv_editor():
+    '''turns the first area of the window into an uv editor - there is no window in background mode'''
+    window = bpy.context.window or next(iter(bpy.context.window_manager.windows), None)
+    if window is None:
+        return None
+
+    area = window.screen.areas[0]
+    area.type = "IMAGE_EDITOR"
+    area.ui_type = "UV"
+    region = next(region for region in area.regions if region.type == "WINDOW")
+    return dict(window=window, area=area, region=region)
+
+
+def max_rss() -> int:
+    if resource is None:
+        return None
+    # kilobytes on linux, bytes on macos
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def set_mode(objects, mode:str) -> None:
+    if bpy.context.object and bpy.context.object.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+
+    for obj in bpy.context.view_layer.objects:
+        obj.select_set(obj in objects)
+    bpy.context.view_layer.objects.active = objects[0]
+
+    if mode == "EDIT":
+        bpy.ops.object.mode_set(mode="EDIT")
+
+
+def run_case(case, objects, state, args, walk, analysis_cache, benchmark_cases, uv_editor):
+    result = {
+        "case": case.name,
+        "operator": case.operator,
+        "properties": case.properties,
+        "status": "ok",
+    }
+
+    def run_once(measure_memory:bool):
+        set_mode(objects, "OBJECT")
+        state.restore()
+        if case.selection:
+            benchmark_cases.select_uvs(objects, case.selection, args.select, args.seed)
+        set_mode(objects, case.mode)
+
+        if case.prepare:
+            case.prepare(objects)
+
+        # every run starts from the same mesh state, measure it without the cached analysis of the last run
+        analysis_cache.clear()
+        walk.walk_stats.reset()
+        if measure_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        if case.uses_uv_editor and uv_editor is not None:
+            with bpy.context.temp_override(**uv_editor):
+                case.call()
+        else:
+            case.call()
+        wall_time = time.perf_counter() - start
+
+        peak = None
+        if measure_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        return wall_time, peak
+
+    try:
+        wall_times = [run_once(False)[0] for _ in range(args.repeat)]
+        result["wall_time"] = wall_times
+        result["wall_time_min"] = min(wall_times)
+        result["loops_visited"] = walk.walk_stats.loops_walked
+        result["longest_walk"] = walk.walk_stats.longest_walk
+
+        if not args.no_memory:
+            result["peak_memory"] = run_once(True)[1]
+        result["max_rss"] = max_rss()
+
+    except Exception as e:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def main():
+    args = parse_args()
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    addon, addon_name = import_addon()
+    bpy.context.scene.tool_settings.use_uv_select_sync = False
+
+    fixtures = importlib.import_module(f"{addon_name}.benchmarks.fixtures")
+    benchmark_cases = importlib.import_module(f"{addon_name}.benchmarks.cases")
+    walk = importlib.import_module(f"{addon_name}.core.walk")
+    analysis_cache = importlib.import_module(f"{addon_name}.core.analysis_cache").analysis_cache
+
+    cases = benchmark_cases.create_cases()
+    if args.cases:
+        cases = [case for case in cases if any(name in case.name for name in args.cases)]
+
+    uv_editor = find_uv_editor()
+
+    report = {
+        "blender": bpy.app.version_string,
+        "uv_kit": ".".join(str(v) for v in addon.bl_info["version"]),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "arguments": vars(args),
+        "results": [],
+    }
+
+    for size in args.sizes:
+        for kind in args.fixtures or fixtures.FIXTURES:
+            objects = fixtures.create_fixture(kind, size, args.seed)
+            state = benchmark_cases.FixtureState(objects)
+
+            fixture_info = {
+                "fixture": kind,
+                "size": size,
+                "objects": len(objects),
+                "faces": sum(len(obj.data.polygons) for obj in objects),
+                "loops": sum(len(obj.data.loops) for obj in objects),
+            }
+
+            for case in cases:
+                result = dict(fixture_info)
+                result.update(run_case(case, objects, state, args, walk, analysis_cache, benchmark_cases, uv_editor))
+                report["results"].append(result)
+
+                print(f"{kind:>10} {size:>8} {case.name:<32} {result['status']:<8} {result.get('wall_time_min', 0.0):.4f}s", file=sys.stderr)
+
+            set_mode(objects, "OBJECT")
+            fixtures.remove_fixture(objects)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
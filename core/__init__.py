@@ -0,0 +1,14 @@
+'''the uv algorithms on plain numpy arrays - no bpy, bmesh or mathutils, so they also run outside of Blender
+
+mesh.UVMesh holds the loop, face and vert arrays, the operators fill it from Blender (see snapshot.py)
+and write the results back. Pipelines can build it from plain arrays:
+
+    from uv_kit.core.mesh import UVMesh
+    from uv_kit.core.straighten import straighten_uv_edgeloops
+
+    mesh = UVMesh.from_arrays(face_vertex_counts, face_vertex_indices, uv, vert_co=points, edge_select=edge_select)
+    straighten_uv_edgeloops(mesh, "GEOMETRY")
+    changed = mesh.changed_uv_loops()
+
+The modules are imported on their own, nothing is imported here to keep the addon startup free of numpy.
+'''
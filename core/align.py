@@ -0,0 +1,121 @@
+import numpy as np
+
+from typing import List, Union
+
+from .mesh import UVMesh
+from .bounds import BBoxesUV
+from .islands import find_uv_islands
+from .walk import selected_uv_edgeloops, with_end_loops
+
+
+def align_uv_edgeloops(meshes:List[UVMesh], direction:str="AUTO", mode:str="AVERAGE", apply_per_edgeloop:bool=True) -> None:
+    '''aligns the selected uv edgeloops of all meshes on X or Y
+
+    direction is X, Y or AUTO to align every edgeloop along the shorter side of its bounds,
+    the target is the AVERAGE, MIN or MAX of the edgeloop - or of all edgeloops together.
+    '''
+    walks = []
+    for mesh in meshes:
+        loops, segment_start = with_end_loops(mesh, *selected_uv_edgeloops(mesh))
+        walks.append((loops, segment_start, BBoxesUV(mesh.uv[loops], segment_start)))
+
+    global_bounds = None
+    if not apply_per_edgeloop:
+        global_bounds = BBoxesUV.concatenate([bounds for _, _, bounds in walks]).merged()
+
+    for mesh, (loops, segment_start, bounds) in zip(meshes, walks):
+        axes, targets = _edgeloop_targets(bounds, direction, mode, global_bounds)
+
+        counts = np.diff(segment_start)
+        _set_uv_vert_axes(mesh, loops, np.repeat(axes, counts), np.repeat(targets, counts))
+        mesh.uvs_changed()
+
+
+def _edgeloop_targets(bounds:BBoxesUV, direction:str, mode:str, global_bounds:Union[BBoxesUV, None]):
+    '''per edgeloop: the axis to align and the coordinate on it, from its own bounds or the global ones'''
+    if direction == "AUTO":
+        diagonal = bounds.diagonal
+        axes = np.where(diagonal[:, 1] < diagonal[:, 0], 1, 0)
+    else:
+        axes = np.full(len(bounds), 0 if direction == "X" else 1)
+
+    # AVERAGE / MIN / MAX
+    target_location = mode.lower()
+    if global_bounds is None:
+        targets = getattr(bounds, target_location)[np.arange(len(bounds)), axes]
+    else:
+        targets = getattr(global_bounds, target_location)[0, axes]
+    return axes, targets
+
+
+def _set_uv_vert_axes(mesh:UVMesh, loops:np.ndarray, axes:np.ndarray, targets:np.ndarray) -> None:
+    '''sets one coordinate of the uv vert of every loop, on all loops sharing it - later loops win on shared uv verts'''
+    connected, connected_start = mesh.connected_uv_loops_per_loop(loops)
+    counts = np.diff(connected_start)
+    mesh.uv[connected, np.repeat(axes, counts)] = np.repeat(targets, counts)
+
+
+def uv_selection_bounds(meshes:List[UVMesh], move_island:bool=False) -> Union[BBoxesUV, None]:
+    '''bounds of the selected uvs of all meshes, or of their islands - None when nothing is selected'''
+    if not any(len(mesh.selected_uv_vert_loops()) for mesh in meshes):
+        return None
+
+    bounds = []
+    for mesh in meshes:
+        if move_island:
+            islands = find_uv_islands(mesh)
+            bounds.append(BBoxesUV(mesh.uv[islands.loops], islands.loop_start).take(np.flatnonzero(islands.selected)))
+        else:
+            selected = mesh.selected_uv_vert_loops()
+            bounds.append(BBoxesUV(mesh.uv[selected], [0, len(selected)]))
+
+    return BBoxesUV.concatenate(bounds).merged()
+
+
+# direction -> the location of the island bounds moved onto the one of the bounds, and the axes it moves on
+ISLAND_ANCHORS = {
+    'left': ('left', (1, 0)),
+    'topleft': ('topleft', (1, 1)),
+    'top': ('top', (0, 1)),
+    'topright': ('topright', (1, 1)),
+    'right': ('right', (1, 0)),
+    'bottomright': ('bottomright', (1, 1)),
+    'bottom': ('bottom', (0, 1)),
+    'bottomleft': ('bottomleft', (1, 1)),
+    'center': ('center', (1, 1)),
+    'horizontal': ('center', (1, 0)),
+    'vertical': ('center', (0, 1)),
+}
+
+
+def align_uvs(meshes:List[UVMesh], bounds:BBoxesUV, direction:str="center", move_island:bool=False) -> None:
+    '''moves the selected uvs to a side, corner or the center of the bounds - or moves their islands there
+
+    direction is one of left, topleft, top, topright, right, bottomright, bottom, bottomleft,
+    center, horizontal (center on Y) and vertical (center on X).
+    '''
+    location = bounds.get_location(direction)[0]
+
+    for mesh in meshes:
+        if move_island:
+            islands = find_uv_islands(mesh)
+            islands_bounds = BBoxesUV(mesh.uv[islands.loops], islands.loop_start)
+
+            anchor, axis_mask = ISLAND_ANCHORS[direction]
+            deltas = (location - getattr(islands_bounds, anchor)) * axis_mask
+
+            loop_island = np.repeat(np.arange(islands.count), np.diff(islands.loop_start))
+            moved = islands.selected[loop_island]
+            mesh.uv[islands.loops[moved]] += deltas[loop_island[moved]]
+
+        else:
+            selected = mesh.selected_uv_vert_loops()
+
+            if direction in ('left', 'right', 'vertical'):
+                mesh.uv[selected, 0] = location[0]
+            elif direction in ('top', 'bottom', 'horizontal'):
+                mesh.uv[selected, 1] = location[1]
+            else:
+                mesh.uv[selected] = location
+
+        mesh.uvs_changed()
@@ -0,0 +1,52 @@
+import hashlib
+
+from collections import OrderedDict
+from typing import Dict
+
+import numpy as np
+
+from .profiling import profiler
+
+
+def fingerprint(uv_layer_name:str, edge_count:int, arrays) -> bytes:
+    '''cheap content hash of the snapshot arrays - equal fingerprints mean equal topology, uvs and selection'''
+    h = hashlib.sha1()
+    h.update(uv_layer_name.encode())
+    h.update(np.array([edge_count] + [len(array) for array in arrays], dtype=np.int64).tobytes())
+    for array in arrays:
+        h.update(np.ascontiguousarray(array).data)
+    return h.digest()
+
+
+class AnalysisCache():
+    '''Topology and selection analysis of the last snapshots, keyed by their fingerprint.
+
+    The redo panel undoes the operator and runs it again on the same mesh state, only with other
+    parameters - then the snapshot gets the same fingerprint and reuses what the last run derived.
+    Entries only depend on the content of the mesh, so identical meshes share them as well.
+    '''
+
+    def __init__(self, max_entries:int=8) -> None:
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[bytes, Dict]" = OrderedDict()
+
+    def entry(self, key:bytes) -> Dict:
+        '''the entry of a fingerprint, least recently used entries get dropped'''
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            profiler.count("cache_hits")
+            return entry
+
+        profiler.count("cache_misses")
+        entry = {}
+        self.entries[key] = entry
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+analysis_cache = AnalysisCache()
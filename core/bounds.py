@@ -0,0 +1,118 @@
+import math
+
+import numpy as np
+
+from typing import List
+
+
+class BBoxesUV():
+    '''Store bounds of many segments of uv coordinates at once - segment i covers uv[segment_start[i]:segment_start[i + 1]]
+
+    Every location is an array with one row per segment, empty segments have inverted infinite bounds.
+    '''
+
+    __slots__ = ("min", "max")
+
+    def __init__(self, uv:np.ndarray=None, segment_start:np.ndarray=None) -> None:
+        self.min = np.zeros((0, 2))
+        self.max = np.zeros((0, 2))
+
+        if uv is not None and segment_start is not None:
+            self.update(uv, segment_start)
+
+    def __len__(self) -> int:
+        return len(self.min)
+
+    @property
+    def topleft(self) -> np.ndarray:
+        return np.column_stack((self.min[:, 0], self.max[:, 1]))
+
+    @property
+    def topright(self) -> np.ndarray:
+        return self.max.copy()
+
+    @property
+    def bottomleft(self) -> np.ndarray:
+        return self.min.copy()
+
+    @property
+    def bottomright(self) -> np.ndarray:
+        return np.column_stack((self.max[:, 0], self.min[:, 1]))
+
+    @property
+    def left(self) -> np.ndarray:
+        return np.column_stack((self.min[:, 0], (self.max[:, 1] + self.min[:, 1]) * 0.5))
+
+    @property
+    def right(self) -> np.ndarray:
+        return np.column_stack((self.max[:, 0], (self.max[:, 1] + self.min[:, 1]) * 0.5))
+
+    @property
+    def top(self) -> np.ndarray:
+        return np.column_stack(((self.max[:, 0] + self.min[:, 0]) * 0.5, self.max[:, 1]))
+
+    @property
+    def bottom(self) -> np.ndarray:
+        return np.column_stack(((self.max[:, 0] + self.min[:, 0]) * 0.5, self.min[:, 1]))
+
+    @property
+    def diagonal(self) -> np.ndarray:
+        return self.max - self.min
+
+    @property
+    def average(self) -> np.ndarray:
+        return (self.min + self.max) * 0.5
+
+    @property
+    def center(self) -> np.ndarray:
+        return self.average
+
+    def get_location(self, direction) -> np.ndarray:
+        if direction in ('horizontal', 'vertical'):
+            direction = 'center'
+        if direction in ('left', 'topleft', 'top', 'topright', 'right', 'bottomright', 'bottom', 'bottomleft', 'center'):
+            return getattr(self, direction)
+
+    def update(self, uv:np.ndarray, segment_start:np.ndarray) -> None:
+        uv = np.asarray(uv, dtype=np.float64).reshape(-1, 2)
+        starts = np.asarray(segment_start[:-1])
+        is_empty = starts == np.asarray(segment_start[1:])
+
+        self.min = np.full((len(starts), 2), math.inf)
+        self.max = np.full((len(starts), 2), -math.inf)
+
+        # reduceat can't handle empty segments, they keep the empty bounds
+        filled = np.flatnonzero(~is_empty)
+        if len(filled):
+            self.min[filled] = np.minimum.reduceat(uv, starts[filled], axis=0)
+            self.max[filled] = np.maximum.reduceat(uv, starts[filled], axis=0)
+
+    def merged(self) -> "BBoxesUV":
+        '''bounds of all segments together, as a single segment'''
+        bboxes = BBoxesUV()
+        bboxes.min = np.full((1, 2), math.inf)
+        bboxes.max = np.full((1, 2), -math.inf)
+        if len(self):
+            bboxes.min[0] = self.min.min(axis=0)
+            bboxes.max[0] = self.max.max(axis=0)
+        return bboxes
+
+    def take(self, segments:np.ndarray) -> "BBoxesUV":
+        '''bounds of a subset of the segments'''
+        bboxes = BBoxesUV()
+        bboxes.min = self.min[segments]
+        bboxes.max = self.max[segments]
+        return bboxes
+
+    def set_to_unit_square(self) -> None:
+        self.min = np.zeros_like(self.min)
+        self.max = np.ones_like(self.max)
+
+    @staticmethod
+    def concatenate(bboxes_list:List["BBoxesUV"]) -> "BBoxesUV":
+        '''the segments of several bounds, in order'''
+        bboxes = BBoxesUV()
+        if bboxes_list:
+            bboxes.min = np.concatenate([other.min for other in bboxes_list])
+            bboxes.max = np.concatenate([other.max for other in bboxes_list])
+        return bboxes
@@ -0,0 +1,187 @@
+import numpy as np
+
+from typing import Tuple
+
+from .mesh import UVMesh
+from .union_find import connected_components, compact_labels
+from .profiling import profiler
+
+
+def _same_uv_location(mesh:UVMesh):
+    '''mesh.is_same_uv_location, counting the compared pairs of loops as link_loop_comparisons'''
+    def same(a:np.ndarray, b:np.ndarray) -> np.ndarray:
+        profiler.count("link_loop_comparisons", len(a))
+        return mesh.is_same_uv_location(a, b)
+    return same
+
+
+def _label_links(mesh:UVMesh, a:np.ndarray, b:np.ndarray) -> np.ndarray:
+    '''labels per loop from the links a[i]-b[i], -1 for loops on unselected faces'''
+    roots = connected_components(mesh.loop_count, a, b)
+
+    labels = np.full(mesh.loop_count, -1, dtype=np.int32)
+    selected = np.flatnonzero(mesh.face_select[mesh.loop_face])
+    labels[selected] = compact_labels(roots[selected])
+    return labels
+
+
+def uv_edge_connected(mesh:UVMesh) -> np.ndarray:
+    '''per loop: the uv edge is not split, the radial loop has the same uvs on both ends'''
+    return mesh.cached("uv_edge_connected", lambda: _uv_edge_connected(mesh, np.arange(mesh.loop_count)))
+
+
+def _uv_edge_connected(mesh:UVMesh, loops:np.ndarray) -> np.ndarray:
+    radial = mesh.loop_radial_next[loops]
+    same = _same_uv_location(mesh)
+    return same(loops, mesh.loop_next[radial]) & same(radial, mesh.loop_next[loops])
+
+
+def uv_edgeloop_links(mesh:UVMesh) -> Tuple[np.ndarray, np.ndarray]:
+    '''next and previous loop of the uv edgeloop through every loop, -1 where the edgeloop ends
+
+    reminder for variable names...
+
+    ABCDE -> vertices
+    abcde, mnopq -> loops
+
+    C has split uv's -> p,d
+
+    ← e ← . C1   C   C2. → q →
+            ↘    |   ↗
+            d ↘  | ↗ p
+       . ← c ← . | . ←  o ← .
+       D --------B---------- E
+       . → b → . | . → n  → .
+               | | ↑
+         PREV  a | m  NEXT
+               ↓ | |
+         ← f ← . A .  ←  r  ←
+
+    The edgeloop continues from m to p and from a to d, when the uvs around A are either split or
+    connected on both sides, B is not on a topological border, p/d are on selected faces, B is a
+    regular uv vert or the edge of p is split, and the uvs around C are either split or connected on both sides.
+    '''
+    return mesh.cached("uv_edgeloop_links", lambda: (_uv_edgeloop_next(mesh), _uv_edgeloop_prev(mesh)))
+
+
+@profiler.timed("walk")
+def _uv_edgeloop_next(mesh:UVMesh) -> np.ndarray:
+    next, radial = mesh.loop_next, mesh.loop_radial_next
+    same = _same_uv_location(mesh)
+
+    m = np.arange(mesh.loop_count)
+    n = next[m]
+    p = next[radial[n]]
+    q = next[p]
+    d = radial[p]
+    c = next[d]
+    a = radial[m]
+    f = next[a]
+
+    end_split_free = same(d, q)
+
+    valid = same(m, f) == same(n, a)
+    valid &= ~mesh.loop_is_boundary[n]
+    valid &= mesh.face_select[mesh.loop_face[p]]
+    valid &= ~((mesh.uv_valence[n] != 4) & same(p, c) & end_split_free)
+    valid &= same(n, p)
+    valid &= end_split_free == same(p, c)
+
+    return np.where(valid, p, -1)
+
+
+@profiler.timed("walk")
+def _uv_edgeloop_prev(mesh:UVMesh) -> np.ndarray:
+    next, prev, radial = mesh.loop_next, mesh.loop_prev, mesh.loop_radial_next
+    same = _same_uv_location(mesh)
+
+    a = np.arange(mesh.loop_count)
+    b = prev[a]
+    c = radial[b]
+    d = prev[c]
+    f = next[a]
+    m = radial[a]
+    n = next[m]
+    p = radial[d]
+    q = next[p]
+
+    end_split_free = same(d, q)
+
+    valid = same(m, f) == same(n, a)
+    valid &= ~mesh.loop_is_boundary[b]
+    valid &= mesh.face_select[mesh.loop_face[d]]
+    valid &= ~((mesh.uv_valence[n] != 4) & end_split_free & same(p, c))
+    valid &= same(a, c)
+    valid &= end_split_free == same(p, c)
+
+    return np.where(valid, d, -1)
+
+
+def uv_edgering_next(mesh:UVMesh) -> np.ndarray:
+    '''per loop: the loop on the other side of its quad, -1 for loops of other faces
+
+    . -----> .  ||  . --------> .
+    ↑        |  ||  ↑           |
+    a        b  ||  c           |
+    |        |  ||  |           |
+    |        ↓  ||  |           ↓
+    . <----- .  ||  . <-------- .
+    '''
+    next = mesh.loop_next
+    opposite = next[next]
+    return np.where(mesh.face_loop_total[mesh.loop_face] == 4, opposite, -1).astype(np.int32)
+
+
+def label_uv_edgeloops(mesh:UVMesh) -> np.ndarray:
+    '''labels every uv edgeloop on the selected faces in one pass, loops with the same label form one edgeloop
+
+    Two loops are linked when the edgeloop walk continues from one to the other in both directions,
+    so the result doesn't depend on the loop a walk would have started from.
+    '''
+    return mesh.cached("uv_edgeloop_labels", lambda: _label_uv_edgeloops(mesh))
+
+
+@profiler.timed("walk")
+def _label_uv_edgeloops(mesh:UVMesh) -> np.ndarray:
+    next_loop, prev_loop = uv_edgeloop_links(mesh)
+
+    linked = np.flatnonzero(next_loop >= 0)
+    linked = linked[prev_loop[next_loop[linked]] == linked]
+
+    return _label_links(mesh, linked, next_loop[linked])
+
+
+def label_uv_edgerings(mesh:UVMesh) -> np.ndarray:
+    '''labels every uv edgering on the selected faces in one pass, loops with the same label form one edgering
+
+    Rings are linked across quads to the opposite loop and across uv connected edges to the radial loop.
+    '''
+    return mesh.cached("uv_edgering_labels", lambda: _label_uv_edgerings(mesh))
+
+
+@profiler.timed("walk")
+def _label_uv_edgerings(mesh:UVMesh) -> np.ndarray:
+    face_select = mesh.face_select[mesh.loop_face]
+
+    quad_loops = np.flatnonzero(face_select & (mesh.face_loop_total[mesh.loop_face] == 4))
+    opposite = uv_edgering_next(mesh)[quad_loops]
+
+    # radial loop across an edge which is not split in uv
+    edge_loops = np.flatnonzero(face_select & ~mesh.loop_is_boundary)
+    other = mesh.loop_radial_next[edge_loops]
+    connected = face_select[other] & uv_edge_connected(mesh)[edge_loops]
+
+    a = np.concatenate((quad_loops, edge_loops[connected]))
+    b = np.concatenate((opposite, other[connected]))
+    return _label_links(mesh, a, b)
+
+
+def labeled_loops(labels:np.ndarray, loop_indices:np.ndarray) -> np.ndarray:
+    '''all loops sharing a label with any of the given loops'''
+    label_count = int(labels.max()) + 1 if len(labels) else 0
+
+    used = np.zeros(label_count + 1, dtype=bool)
+    used[labels[loop_indices]] = True
+    used[-1] = False  # -1 marks unlabeled loops
+
+    return np.flatnonzero(used[labels])
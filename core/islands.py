@@ -0,0 +1,61 @@
+import numpy as np
+
+from .mesh import UVMesh
+from .union_find import connected_components, compact_labels
+from .profiling import profiler
+
+
+class UVIslands():
+    '''uv islands of a mesh - the loops are sorted by island, island i owns loops[loop_start[i]:loop_start[i + 1]]'''
+
+    def __init__(self) -> None:
+        self.face_island = np.zeros(0, dtype=np.int32)  # -1 for faces which are not part of any island
+        self.loops = np.zeros(0, dtype=np.int32)
+        self.loop_start = np.zeros(1, dtype=np.int32)
+        self.selected = np.zeros(0, dtype=bool)
+
+    @property
+    def count(self) -> int:
+        return len(self.loop_start) - 1
+
+    def island_loops(self, island:int) -> np.ndarray:
+        return self.loops[self.loop_start[island]:self.loop_start[island + 1]]
+
+
+def find_uv_islands(mesh:UVMesh) -> UVIslands:
+    '''labels the uv islands of the selected faces, faces are connected when they share a uv vert'''
+    return mesh.cached("uv_islands", lambda: _find_uv_islands(mesh))
+
+
+@profiler.timed("walk")
+def _find_uv_islands(mesh:UVMesh) -> UVIslands:
+    uv_vert_ids = mesh.uv_verts.loop_uv_vert
+
+    candidate_loops = np.flatnonzero(mesh.face_select[mesh.loop_face])
+    candidate_faces = mesh.loop_face[candidate_loops]
+    candidate_ids = uv_vert_ids[candidate_loops]
+
+    # connect every face to one face using the same uv vert
+    face_of_id = np.zeros(mesh.loop_count, dtype=np.int64)
+    face_of_id[candidate_ids] = candidate_faces
+    roots = connected_components(mesh.face_count, candidate_faces, face_of_id[candidate_ids])
+
+    islands = UVIslands()
+    islands.face_island = np.full(mesh.face_count, -1, dtype=np.int32)
+    selected_faces = np.flatnonzero(mesh.face_select)
+    islands.face_island[selected_faces] = compact_labels(roots[selected_faces])
+
+    loop_island = islands.face_island[candidate_faces]
+    order = np.argsort(loop_island, kind="stable")
+    islands.loops = candidate_loops[order].astype(np.int32)
+
+    island_count = int(loop_island.max()) + 1 if len(loop_island) else 0
+    profiler.count("islands_found", island_count)
+    loop_counts = np.bincount(loop_island, minlength=island_count)
+    islands.loop_start = np.zeros(island_count + 1, dtype=np.int32)
+    np.cumsum(loop_counts, out=islands.loop_start[1:])
+
+    selected_loops = mesh.vert_select[candidate_loops]
+    islands.selected = np.bincount(loop_island[selected_loops], minlength=island_count) > 0
+
+    return islands
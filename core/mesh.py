@@ -0,0 +1,310 @@
+import numpy as np
+
+from typing import Any, Callable, Tuple
+
+from .uv_verts import UVVertIndex
+
+# two uvs closer than this are at the same location
+UV_LOCATION_TOLERANCE = 0.001
+
+
+def face_loop_links(face_loop_start:np.ndarray, face_loop_total:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''loop_next and loop_prev inside the faces, the loops of a face are consecutive'''
+    loop_count = int(face_loop_total.sum())
+    face_ends = face_loop_start + face_loop_total - 1
+
+    loop_next = np.arange(1, loop_count + 1, dtype=np.int32)
+    loop_next[face_ends] = face_loop_start
+
+    loop_prev = np.arange(-1, loop_count - 1, dtype=np.int32)
+    loop_prev[face_loop_start] = face_ends
+
+    return loop_next, loop_prev
+
+
+def loop_edges(loop_vert:np.ndarray, loop_next:np.ndarray) -> Tuple[np.ndarray, int]:
+    '''numbers the edges by their two verts - returns the edge per loop and the edge count'''
+    a = loop_vert.astype(np.int64)
+    b = a[loop_next]
+    vert_count = int(loop_vert.max()) + 1 if len(loop_vert) else 0
+
+    keys = np.minimum(a, b) * vert_count + np.maximum(a, b)
+    edge_keys, loop_edge = np.unique(keys, return_inverse=True)
+    return loop_edge.reshape(-1).astype(np.int32), len(edge_keys)
+
+
+class UVMesh():
+    '''Contiguous numpy arrays of the mesh data the uv tools need - all loop arrays are indexed by the loop index.
+
+    The loop links follow bmesh: loop_next/loop_prev go around the face, loop_radial_next
+    goes around the loops of the same edge and points to the loop itself on boundary edges.
+    Only loops on selected faces are visible in the uv editor, the tools ignore the others.
+    '''
+
+    def __init__(self) -> None:
+        self.uv_layer_name = ""
+
+        # loop domain
+        self.uv = np.zeros((0, 2), dtype=np.float32)
+        self.vert_select = np.zeros(0, dtype=bool)
+        self.edge_select = np.zeros(0, dtype=bool)
+        self.pin = np.zeros(0, dtype=bool)
+        self.loop_vert = np.zeros(0, dtype=np.int32)
+        self.loop_edge = np.zeros(0, dtype=np.int32)
+        self.loop_face = np.zeros(0, dtype=np.int32)
+        self.loop_next = np.zeros(0, dtype=np.int32)
+        self.loop_prev = np.zeros(0, dtype=np.int32)
+        self.loop_radial_next = np.zeros(0, dtype=np.int32)
+        self.loop_is_boundary = np.zeros(0, dtype=bool)
+
+        # face domain
+        self.face_select = np.zeros(0, dtype=bool)
+        self.face_loop_start = np.zeros(0, dtype=np.int32)
+        self.face_loop_total = np.zeros(0, dtype=np.int32)
+
+        # vert domain
+        self.vert_co = np.zeros((0, 3), dtype=np.float32)
+
+        # edge domain, indexed by loop_edge
+        self.edge_seam = np.zeros(0, dtype=bool)
+
+        self._uv_verts = None
+        self._uv_valence = None
+
+        # analysis results, shared with other meshes of the same state (see analysis_cache), None once the mesh got modified
+        self._cache = None
+
+        # state when the mesh was read or last written, to find what the tools changed
+        self._written_uv = None
+        self._written_vert_select = None
+        self._written_edge_select = None
+        self._written_pin = None
+
+    @property
+    def loop_count(self) -> int:
+        return len(self.loop_vert)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_loop_start)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        face_loop_total:np.ndarray,
+        loop_vert:np.ndarray,
+        uv:np.ndarray,
+        vert_co:np.ndarray=None,
+        vert_select:np.ndarray=None,
+        edge_select:np.ndarray=None,
+        pin:np.ndarray=None,
+        face_select:np.ndarray=None,
+        loop_edge:np.ndarray=None,
+        edge_seam:np.ndarray=None,
+    ) -> "UVMesh":
+        '''mesh from plain arrays, like the face vertex counts, face vertex indices and a face varying uv set of USD or OBJ
+
+        The loops of a face are consecutive. Without loop_edge the edges are numbered by their verts,
+        edge_seam uses the same edge indices.
+        vert_co is only used for the GEOMETRY straighten, all faces count as selected when face_select is missing.
+        '''
+        mesh = cls()
+        mesh.face_loop_total = np.asarray(face_loop_total, dtype=np.int32)
+        mesh.face_loop_start = np.zeros(len(mesh.face_loop_total), dtype=np.int32)
+        np.cumsum(mesh.face_loop_total[:-1], out=mesh.face_loop_start[1:])
+
+        mesh.loop_vert = np.asarray(loop_vert, dtype=np.int32)
+        loop_count = len(mesh.loop_vert)
+        if int(mesh.face_loop_total.sum()) != loop_count:
+            raise ValueError(f"the faces have {int(mesh.face_loop_total.sum())} loops, but there are {loop_count} loop verts")
+
+        mesh.uv = np.array(uv, dtype=np.float32).reshape(-1, 2)
+        if len(mesh.uv) != loop_count:
+            raise ValueError(f"expected {loop_count} uvs, got {len(mesh.uv)}")
+
+        def loop_flags(values):
+            if values is None:
+                return np.zeros(loop_count, dtype=bool)
+            return np.array(values, dtype=bool).reshape(loop_count)
+
+        mesh.vert_select = loop_flags(vert_select)
+        mesh.edge_select = loop_flags(edge_select)
+        mesh.pin = loop_flags(pin)
+
+        if face_select is None:
+            mesh.face_select = np.ones(mesh.face_count, dtype=bool)
+        else:
+            mesh.face_select = np.array(face_select, dtype=bool).reshape(mesh.face_count)
+
+        vert_count = int(mesh.loop_vert.max()) + 1 if loop_count else 0
+        if vert_co is None:
+            mesh.vert_co = np.zeros((vert_count, 3), dtype=np.float32)
+        else:
+            mesh.vert_co = np.asarray(vert_co, dtype=np.float32).reshape(-1, 3)
+
+        if loop_edge is None:
+            loop_next, _ = face_loop_links(mesh.face_loop_start, mesh.face_loop_total)
+            mesh.loop_edge, edge_count = loop_edges(mesh.loop_vert, loop_next)
+        else:
+            mesh.loop_edge = np.asarray(loop_edge, dtype=np.int32)
+            edge_count = int(mesh.loop_edge.max()) + 1 if loop_count else 0
+
+        if edge_seam is None:
+            mesh.edge_seam = np.zeros(edge_count, dtype=bool)
+        else:
+            mesh.edge_seam = np.array(edge_seam, dtype=bool).reshape(edge_count)
+
+        (
+            mesh.loop_face, mesh.loop_next, mesh.loop_prev,
+            mesh.loop_radial_next, mesh.loop_is_boundary,
+        ) = mesh._build_topology(edge_count)
+
+        mesh._cache = {}
+        mesh._mark_written()
+        return mesh
+
+    def _build_topology(self, edge_count:int):
+        '''derive the bmesh like loop links from the flat face/loop arrays'''
+        loop_count = self.loop_count
+
+        loop_face = np.repeat(np.arange(self.face_count, dtype=np.int32), self.face_loop_total)
+        loop_next, loop_prev = face_loop_links(self.face_loop_start, self.face_loop_total)
+
+        # loops sharing an edge form the radial cycle, boundary loops point to themselves like in bmesh
+        order = np.argsort(self.loop_edge, kind="stable").astype(np.int32)
+        sorted_edges = self.loop_edge[order]
+        is_group_start = np.ones(loop_count, dtype=bool)
+        is_group_start[1:] = sorted_edges[1:] != sorted_edges[:-1]
+        group_start = np.maximum.accumulate(np.where(is_group_start, np.arange(loop_count), 0))
+
+        radial_sorted = np.arange(1, loop_count + 1)
+        is_group_end = np.ones(loop_count, dtype=bool)
+        is_group_end[:-1] = is_group_start[1:]
+        radial_sorted[is_group_end] = group_start[is_group_end]
+
+        loop_radial_next = np.empty(loop_count, dtype=np.int32)
+        loop_radial_next[order] = order[radial_sorted]
+
+        edge_face_count = np.bincount(self.loop_edge, minlength=edge_count)
+        loop_is_boundary = edge_face_count[self.loop_edge] == 1
+
+        return loop_face, loop_next, loop_prev, loop_radial_next, loop_is_boundary
+
+    def cached(self, name:str, build:Callable[[], Any]):
+        '''result of build, shared with all meshes of the same state (see analysis_cache)
+
+        build may only depend on the data as it was captured - once the flags or uvs of the mesh
+        got modified the results are not shared anymore.
+        '''
+        if self._cache is None:
+            return build()
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    def use_all_faces(self) -> None:
+        '''lets the tools work on all faces instead of the selected ones, like the uv editor with sync selection'''
+        self._cache = None
+        self.face_select[:] = True
+
+    def selected_uv_edge_loops(self) -> np.ndarray:
+        '''indices of the uv loops with a selected uv edge, on selected faces'''
+        return np.flatnonzero(self.edge_select & self.face_select[self.loop_face])
+
+    def selected_uv_vert_loops(self) -> np.ndarray:
+        '''indices of the selected uv loops, on selected faces - only checking the loop but not the edge'''
+        return np.flatnonzero(self.vert_select & self.face_select[self.loop_face])
+
+    def is_same_uv_location(self, a:np.ndarray, b:np.ndarray) -> np.ndarray:
+        '''per pair of loop indices: both uvs are at the same location'''
+        delta = self.uv[a] - self.uv[b]
+        return (delta * delta).sum(axis=-1) < UV_LOCATION_TOLERANCE * UV_LOCATION_TOLERANCE
+
+    @property
+    def uv_verts(self) -> UVVertIndex:
+        '''loops welded into uv verts, built on first use'''
+        if self._uv_verts is None:
+            self._uv_verts = self.cached("uv_verts", lambda: UVVertIndex(self.loop_vert, self.uv, UV_LOCATION_TOLERANCE))
+        return self._uv_verts
+
+    @property
+    def uv_valence(self) -> np.ndarray:
+        '''per loop: number of loops around the same vert sharing the uv location - the edges branching out from the uv vert'''
+        if self._uv_valence is None:
+            self._uv_valence = self.cached("uv_valence", lambda: self.uv_verts.loop_count[self.uv_verts.loop_uv_vert])
+        return self._uv_valence
+
+    def connected_uv_loops(self, loop_indices:np.ndarray) -> np.ndarray:
+        '''loops on selected faces which share a uv vert with any of the given loops'''
+        connected = self.uv_verts.coincident_loops(loop_indices)
+        return connected[self.face_select[self.loop_face[connected]]]
+
+    def connected_uv_loops_per_loop(self, loop_indices:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        '''like connected_uv_loops, but separately for every given loop
+
+        Returns (loops, loop_start), given loop i is connected to loops[loop_start[i]:loop_start[i + 1]].
+        '''
+        uv_verts = self.uv_verts
+        loop_uv_verts = uv_verts.loop_uv_vert[loop_indices]
+
+        connected = uv_verts.uv_vert_loops(loop_uv_verts)
+        owner = np.repeat(np.arange(len(loop_uv_verts)), uv_verts.loop_count[loop_uv_verts])
+
+        selected = self.face_select[self.loop_face[connected]]
+        loop_start = np.zeros(len(loop_uv_verts) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owner[selected], minlength=len(loop_uv_verts)), out=loop_start[1:])
+
+        return connected[selected], loop_start
+
+    def select_uv_edges(self, loop_indices:np.ndarray) -> None:
+        '''selects the uv edges and flushes the selection to both uv verts of every edge'''
+        self._cache = None
+        self.edge_select[loop_indices] = True
+        edge_verts = np.concatenate((loop_indices, self.loop_next[loop_indices]))
+        self.vert_select[self.connected_uv_loops(edge_verts)] = True
+
+    def deselect_uv_edges(self, loop_indices:np.ndarray) -> None:
+        '''deselects the uv edges, their uv verts stay selected as long as another selected uv edge uses them'''
+        self._cache = None
+        self.edge_select[loop_indices] = False
+
+        loop_uv_vert = self.uv_verts.loop_uv_vert
+        edge_verts = np.unique(loop_uv_vert[np.concatenate((loop_indices, self.loop_next[loop_indices]))])
+
+        selected_edges = self.selected_uv_edge_loops()
+        used = np.zeros(self.uv_verts.count, dtype=bool)
+        used[loop_uv_vert[selected_edges]] = True
+        used[loop_uv_vert[self.loop_next[selected_edges]]] = True
+
+        unused_loops = self.uv_verts.uv_vert_loops(edge_verts[~used[edge_verts]])
+        self.vert_select[unused_loops[self.face_select[self.loop_face[unused_loops]]]] = False
+
+    def uvs_changed(self) -> None:
+        '''to call after moving uvs - the uv verts and the analysis depend on the uv locations'''
+        self._cache = None
+        self._uv_verts = None
+        self._uv_valence = None
+
+    def _mark_written(self) -> None:
+        self._mark_uvs_written()
+        self._mark_flags_written()
+
+    def _mark_uvs_written(self) -> None:
+        self._written_uv = self.uv.copy()
+
+    def _mark_flags_written(self) -> None:
+        self._written_vert_select = self.vert_select.copy()
+        self._written_edge_select = self.edge_select.copy()
+        self._written_pin = self.pin.copy()
+
+    def changed_uv_loops(self) -> np.ndarray:
+        '''indices of the loops with a uv which changed since the mesh was read or last written'''
+        return np.flatnonzero((self.uv != self._written_uv).any(axis=1))
+
+    def changed_flag_loops(self) -> np.ndarray:
+        '''indices of the loops with a select or pin flag which changed since the mesh was read or last written'''
+        return np.flatnonzero(
+            (self.vert_select != self._written_vert_select)
+            | (self.edge_select != self._written_edge_select)
+            | (self.pin != self._written_pin)
+        )
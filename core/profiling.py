@@ -0,0 +1,145 @@
+import functools
+import json
+import time
+
+from collections import deque
+from contextlib import nullcontext
+from typing import Callable, Dict, List
+
+_no_phase = nullcontext()
+
+
+class OperatorProfile():
+    '''timings and counters of one operator execute - phase times exclude the nested phases'''
+
+    def __init__(self, operator:str) -> None:
+        self.operator = operator
+        self.started = time.time()
+        self.total = 0.0
+        self.result = ""
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._phase_stack = []
+
+    def to_dict(self) -> Dict:
+        return {
+            "operator": self.operator,
+            "started": self.started,
+            "total": self.total,
+            "result": self.result,
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+        }
+
+
+class _Phase():
+    def __init__(self, profile:OperatorProfile, name:str) -> None:
+        self.profile = profile
+        self.name = name
+        self.start = 0.0
+        self.nested = 0.0
+
+    def __enter__(self) -> "_Phase":
+        self.profile._phase_stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        stack = self.profile._phase_stack
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+
+        phases = self.profile.phases
+        phases[self.name] = phases.get(self.name, 0.0) + elapsed - self.nested
+
+
+class Profiler():
+    '''Opt-in instrumentation of the operators, keeps the profiles of the last executes.
+
+    While disabled, or outside of an operator, phase() and count() return right away.
+    '''
+
+    def __init__(self, history_size:int=20) -> None:
+        self.enabled = False
+        self.history = deque(maxlen=history_size)
+        self._running: List[OperatorProfile] = []
+        # seconds the addon took to import and register
+        self.startup: Dict[str, float] = {}
+
+    def set_history_size(self, history_size:int) -> None:
+        self.history = deque(self.history, maxlen=history_size)
+
+    def phase(self, name:str):
+        '''context manager timing a phase of the running operator'''
+        if not self._running:
+            return _no_phase
+        return _Phase(self._running[-1], name)
+
+    def timed(self, name:str) -> Callable:
+        '''decorator timing every call of a function as phase'''
+        def decorator(function):
+            @functools.wraps(function)
+            def timed_function(*args, **kwargs):
+                if not self._running:
+                    return function(*args, **kwargs)
+                with _Phase(self._running[-1], name):
+                    return function(*args, **kwargs)
+            return timed_function
+        return decorator
+
+    def count(self, name:str, value:int=1) -> None:
+        if not self._running:
+            return
+        counters = self._running[-1].counters
+        counters[name] = counters.get(name, 0) + int(value)
+
+    def instrument(self, operator_class) -> None:
+        '''wraps the execute of an operator class, needs to happen before it gets registered'''
+        execute = operator_class.execute
+        if getattr(execute, "_uvkit_profiled", False):
+            return
+
+        profiler = self
+
+        @functools.wraps(execute)
+        def profiled_execute(operator, context):
+            if not profiler.enabled:
+                return execute(operator, context)
+
+            # operators calling other operators - the nested call shows up as phase
+            with profiler.phase(operator.bl_idname):
+                profile = OperatorProfile(operator.bl_idname)
+                profiler._running.append(profile)
+                start = time.perf_counter()
+                try:
+                    result = execute(operator, context)
+                    profile.result = ", ".join(sorted(result))
+                    return result
+                finally:
+                    profile.total = time.perf_counter() - start
+                    profile.phases["compute"] = profile.total - sum(profile.phases.values())
+                    profiler._running.pop()
+                    profiler.history.append(profile)
+
+        profiled_execute._uvkit_profiled = True
+        operator_class.execute = profiled_execute
+
+    def results(self) -> List[Dict]:
+        '''profiles of the last executes, oldest first'''
+        return [profile.to_dict() for profile in self.history]
+
+    def export_json(self, filepath:str) -> None:
+        with open(filepath, "w") as f:
+            json.dump(self.results(), f, indent=2)
+
+    def startup_report(self) -> str:
+        phases = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.startup.items())
+        return f"uv kit startup: {phases}"
+
+    def clear(self) -> None:
+        self.history.clear()
+
+
+profiler = Profiler()
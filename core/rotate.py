@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+
+from typing import List, Sequence, Tuple
+
+from .mesh import UVMesh
+from .bounds import BBoxesUV
+from .islands import find_uv_islands
+
+
+def rotate_uvs(
+    meshes:List[UVMesh],
+    angle:float,
+    pivot:str="CENTER",
+    cursor:Sequence[float]=(0.0, 0.0),
+    use_island:bool=False,
+    aspect:Sequence[float]=(1.0, 1.0),
+) -> None:
+    '''rotates the selected uvs of all meshes counter-clockwise by angle (radians) - or their whole islands
+
+    pivot is CENTER for the center of the bounds of everything that rotates, INDIVIDUAL_ORIGINS for
+    the mean uv vert of every island or CURSOR. aspect is the one of the image, like the uv editor the
+    rotation happens in pixel space. The selection stays as it is.
+    '''
+    moving = [_rotated_loops(mesh, use_island) for mesh in meshes]
+    if not any(len(loops) for loops, _ in moving):
+        return
+
+    if pivot == "CENTER":
+        bounds = BBoxesUV.concatenate([BBoxesUV(mesh.uv[loops], [0, len(loops)]) for mesh, (loops, _) in zip(meshes, moving)])
+        center = bounds.merged().center[0]
+    elif pivot == "CURSOR":
+        center = np.array(cursor, dtype=np.float64)
+    elif pivot != "INDIVIDUAL_ORIGINS":
+        raise ValueError(f"unknown pivot {pivot}")
+
+    cos, sin = math.cos(angle), math.sin(angle)
+    rotation = np.array(((cos, -sin), (sin, cos)))
+    aspect = np.array(aspect, dtype=np.float64)
+
+    for mesh, (loops, loop_island) in zip(meshes, moving):
+        if len(loops) == 0:
+            continue
+
+        uv = mesh.uv[loops].astype(np.float64)
+        if pivot == "INDIVIDUAL_ORIGINS":
+            centers = _island_origins(mesh, loops, loop_island)[loop_island]
+        else:
+            centers = center
+
+        rotated = ((uv - centers) * aspect) @ rotation.T
+        mesh.uv[loops] = rotated / aspect + centers
+        mesh.uvs_changed()
+
+
+def _rotated_loops(mesh:UVMesh, use_island:bool) -> Tuple[np.ndarray, np.ndarray]:
+    '''the loops which rotate with the island of each of them'''
+    islands = find_uv_islands(mesh)
+    loop_island = np.full(mesh.loop_count, -1, dtype=np.int32)
+    loop_island[islands.loops] = np.repeat(np.arange(islands.count, dtype=np.int32), np.diff(islands.loop_start))
+
+    if use_island:
+        loops = islands.loops[islands.selected[loop_island[islands.loops]]]
+    else:
+        loops = mesh.selected_uv_vert_loops()
+    return loops, loop_island[loops]
+
+
+def _island_origins(mesh:UVMesh, loops:np.ndarray, loop_island:np.ndarray) -> np.ndarray:
+    '''per island: the mean of its rotating uv verts, every uv vert counts once no matter how many loops share it'''
+    uv_verts, first = np.unique(mesh.uv_verts.loop_uv_vert[loops], return_index=True)
+    island_count = int(loop_island.max()) + 1
+
+    counts = np.bincount(loop_island[first], minlength=island_count)
+    origins = np.zeros((island_count, 2))
+    for axis in range(2):
+        origins[:, axis] = np.bincount(loop_island[first], mesh.uv[loops[first], axis], minlength=island_count)
+    return origins / np.maximum(counts, 1)[:, None]
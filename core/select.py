@@ -0,0 +1,80 @@
+import numpy as np
+
+from .mesh import UVMesh
+from .edge_labels import label_uv_edgeloops, label_uv_edgerings, labeled_loops, uv_edgeloop_links, uv_edgering_next
+from .walk import selected_uv_edgeloops, selected_uv_edgerings
+
+
+def _ends(loops:np.ndarray, segment_start:np.ndarray):
+    '''first and last loop of every walk'''
+    return loops[segment_start[:-1]], loops[segment_start[1:] - 1]
+
+
+def _linked(links:np.ndarray, loops:np.ndarray) -> np.ndarray:
+    linked = links[loops]
+    return linked[linked >= 0]
+
+
+def select_uv_edgeloops_of_selection(mesh:UVMesh) -> None:
+    '''selects the complete uv edgeloops of all selected uv edges - a label lookup instead of walking every loop'''
+    mesh.select_uv_edges(labeled_loops(label_uv_edgeloops(mesh), mesh.selected_uv_edge_loops()))
+
+
+def expand_uv_edgeloops(mesh:UVMesh) -> None:
+    '''expands the selected uv edgeloops by the next uv edge on both ends'''
+    loops, segment_start = selected_uv_edgeloops(mesh)
+    next_links, prev_links = uv_edgeloop_links(mesh)
+    first, last = _ends(loops, segment_start)
+
+    mesh.select_uv_edges(np.concatenate((loops, _linked(next_links, last), _linked(prev_links, first))))
+
+
+def shrink_uv_edgeloops(mesh:UVMesh) -> None:
+    '''shrinks the selected uv edgeloops by the uv edge on both ends'''
+    loops, segment_start = selected_uv_edgeloops(mesh)
+    first, last = _ends(loops, segment_start)
+
+    shrinking = np.diff(segment_start) > 1
+    mesh.deselect_uv_edges(np.concatenate((first[shrinking], last[shrinking])))
+
+
+def select_uv_edgerings_of_selection(mesh:UVMesh) -> None:
+    '''selects the complete uv edgerings of all selected uv edges - a label lookup instead of walking every ring'''
+    mesh.select_uv_edges(labeled_loops(label_uv_edgerings(mesh), mesh.selected_uv_edge_loops()))
+
+
+def expand_uv_edgerings(mesh:UVMesh) -> None:
+    '''expands the selected uv edgerings by one uv edge on both ends'''
+    loops, segment_start = selected_uv_edgerings(mesh)
+    ring_next = uv_edgering_next(mesh)
+    first, last = _ends(loops, segment_start)
+
+    mesh.select_uv_edges(np.concatenate((loops, _linked(ring_next, last), _linked(ring_next, first))))
+
+
+def shrink_uv_edgerings(mesh:UVMesh) -> None:
+    '''shrinks the selected uv edgerings by one uv edge on both ends
+
+    Both loops of an edge are part of a ring, so a shrinking end drops the radial loop as well.
+    '''
+    loops, segment_start = selected_uv_edgerings(mesh)
+    radial = mesh.loop_radial_next
+
+    removed = []
+    for start, end in zip(segment_start[:-1].tolist(), segment_start[1:].tolist()):
+        if end - start < 2:
+            continue
+
+        removed.append(loops[start])
+        start += 1
+        if radial[loops[start]] == loops[start - 1]:
+            removed.append(loops[start])
+            start += 1
+
+        if end - start >= 2:
+            removed.append(loops[end - 1])
+            end -= 1
+            if radial[loops[end - 1]] == loops[end]:
+                removed.append(loops[end - 1])
+
+    mesh.deselect_uv_edges(np.array(removed, dtype=np.int32))
@@ -0,0 +1,102 @@
+import numpy as np
+
+from typing import Tuple
+
+from .mesh import UVMesh
+from .walk import selected_uv_edgeloops, with_end_loops
+
+
+def straighten_uv_edgeloops(mesh:UVMesh, mode:str="GEOMETRY") -> None:
+    '''places the inner uv verts of every selected uv edgeloop on the line from its first to its last uv vert
+
+    GEOMETRY spaces them like the edges in 3D, EVEN spaces them evenly over the length of the bounds
+    diagonal, PROJECT moves them onto the line. The uv verts move with all loops sharing them.
+    Edgeloops sharing uv verts run in the walk order, the one through the lowest selected loop first,
+    and see the uvs moved by the ones before them.
+    '''
+    loops, segment_start = with_end_loops(mesh, *selected_uv_edgeloops(mesh))
+    if len(loops) == 0:
+        return
+
+    # an edgeloop sees the uvs moved by the edgeloops before it sharing uv verts, so it waits for them
+    waves = _waves(mesh, loops, segment_start)
+    for wave in range(int(waves.max()) + 1):
+        segments = np.flatnonzero(waves == wave)
+        _apply(mesh, *_straighten_targets(mesh, *_take_segments(loops, segment_start, segments), mode))
+
+    mesh.uvs_changed()
+
+
+def _segment_owner(segment_start:np.ndarray) -> np.ndarray:
+    return np.repeat(np.arange(len(segment_start) - 1), np.diff(segment_start))
+
+
+def _take_segments(loops:np.ndarray, segment_start:np.ndarray, segments:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    counts = np.diff(segment_start)[segments]
+    taken_start = np.zeros(len(segments) + 1, dtype=np.int64)
+    np.cumsum(counts, out=taken_start[1:])
+
+    offset = np.arange(taken_start[-1]) - np.repeat(taken_start[:-1], counts)
+    return loops[np.repeat(segment_start[segments], counts) + offset], taken_start
+
+
+def _waves(mesh:UVMesh, loops:np.ndarray, segment_start:np.ndarray) -> np.ndarray:
+    '''per edgeloop: the first wave after the waves of all earlier edgeloops sharing uv verts with it'''
+    uv_verts = mesh.uv_verts.loop_uv_vert[loops]
+    last_wave = np.full(len(mesh.uv_verts.loop_count), -1, dtype=np.int32)
+
+    waves = []
+    for start, end in zip(segment_start[:-1].tolist(), segment_start[1:].tolist()):
+        edgeloop_uv_verts = uv_verts[start:end]
+        wave = int(last_wave[edgeloop_uv_verts].max()) + 1
+        last_wave[edgeloop_uv_verts] = wave
+        waves.append(wave)
+    return np.array(waves, dtype=np.int32)
+
+
+def _straighten_targets(mesh:UVMesh, loops:np.ndarray, segment_start:np.ndarray, mode:str) -> Tuple[np.ndarray, np.ndarray]:
+    '''the inner loops of all edgeloops with their new uvs, edgeloops are loops[segment_start[i]:segment_start[i + 1]]'''
+    first, last = segment_start[:-1], segment_start[1:] - 1
+    owner = _segment_owner(segment_start)
+    index = np.arange(len(loops)) - segment_start[owner]
+
+    loop_uvs = mesh.uv[loops].astype(np.float64)
+    first_uv = loop_uvs[first]
+
+    uv_distance = np.linalg.norm(np.maximum.reduceat(loop_uvs, first) - np.minimum.reduceat(loop_uvs, first), axis=1)
+
+    direction = loop_uvs[last] - first_uv
+    length = np.linalg.norm(direction, axis=1)
+    np.divide(direction, length[:, None], out=direction, where=length[:, None] > 0)
+
+    if mode == "GEOMETRY":
+        # 3D length from the first uv vert along the edgeloop, scaled to the uv distance
+        co = mesh.vert_co[mesh.loop_vert[loops]].astype(np.float64)
+        distances = np.zeros(len(loops))
+        distances[1:] = np.linalg.norm(co[1:] - co[:-1], axis=1)
+        distances[first] = 0.0
+        along = np.cumsum(distances)
+        along -= along[first][owner]
+
+        total_distance = along[last]
+        scale = np.divide(uv_distance, total_distance, out=np.zeros_like(uv_distance), where=total_distance > 0)
+        along *= scale[owner]
+
+    elif mode == "EVEN":
+        along = index * (uv_distance / (np.diff(segment_start) - 1))[owner]
+
+    elif mode == "PROJECT":
+        along = np.einsum("ij,ij->i", loop_uvs - first_uv[owner], direction[owner])
+
+    else:
+        raise ValueError(f"unknown mode {mode}")
+
+    inner = (index > 0) & (index < (last - first)[owner])
+    targets = first_uv[owner[inner]] + direction[owner[inner]] * along[inner, None]
+    return loops[inner], targets
+
+
+def _apply(mesh:UVMesh, loops:np.ndarray, targets:np.ndarray) -> None:
+    '''moves the uv verts of the loops to the targets, with all loops sharing them'''
+    connected, connected_start = mesh.connected_uv_loops_per_loop(loops)
+    mesh.uv[connected] = np.repeat(targets, np.diff(connected_start), axis=0)
@@ -0,0 +1,45 @@
+import numpy as np
+
+
+def find_roots(parent:np.ndarray) -> np.ndarray:
+    '''path compression - points every element directly at the root of its set'''
+    while True:
+        grand_parent = parent[parent]
+        if np.array_equal(grand_parent, parent):
+            return parent
+        parent = grand_parent
+
+
+def connected_components(count:int, a:np.ndarray, b:np.ndarray) -> np.ndarray:
+    '''disjoint set over the elements 0..count-1, joined by the pairs a[i]-b[i]
+
+    Works on all pairs at once instead of recursing, so the size of a component doesn't matter.
+    Returns the root per element, which is always the smallest element of its set.
+    '''
+    parent = np.arange(count, dtype=np.int64)
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+
+    while True:
+        parent = find_roots(parent)
+
+        root_a = parent[a]
+        root_b = parent[b]
+        unmerged = root_a != root_b
+        if not unmerged.any():
+            return parent
+
+        # pairs which already share a root stay merged, no need to look at them again
+        a = a[unmerged]
+        b = b[unmerged]
+        root_a = root_a[unmerged]
+        root_b = root_b[unmerged]
+
+        # union - hook the larger root under the smaller one
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+
+
+def compact_labels(roots:np.ndarray) -> np.ndarray:
+    '''turns the roots from connected_components into consecutive labels 0..n-1'''
+    _, labels = np.unique(roots, return_inverse=True)
+    return labels.astype(np.int32)
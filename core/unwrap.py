@@ -0,0 +1,399 @@
+import numpy as np
+
+from typing import Tuple
+
+from .mesh import UVMesh
+from .islands import find_uv_islands
+from .union_find import connected_components, compact_labels
+from .profiling import profiler
+
+
+class UVCharts():
+    '''the parts of the islands which get unwrapped on their own - like the islands, but cut at seams instead of uv splits
+
+    loops are the loops of the islands, loop_vert[i] is the chart vert of loops[i]. The loops of
+    a mesh vert which are connected over edges without seam share a chart vert.
+    '''
+
+    def __init__(self) -> None:
+        self.loops = np.zeros(0, dtype=np.int32)
+        self.loop_vert = np.zeros(0, dtype=np.int32)
+        self.vert_chart = np.zeros(0, dtype=np.int32)
+        self.vert_mesh_vert = np.zeros(0, dtype=np.int32)
+        self.count = 0
+
+    @property
+    def vert_count(self) -> int:
+        return len(self.vert_chart)
+
+
+def find_uv_charts(mesh:UVMesh, faces:np.ndarray, ignore_seams:bool=False) -> UVCharts:
+    '''charts of the given faces (a bool per face), with ignore_seams they only end at the border of the faces'''
+    charts = UVCharts()
+    charts.loops = np.flatnonzero(faces[mesh.loop_face]).astype(np.int32)
+
+    loop_position = np.full(mesh.loop_count, -1, dtype=np.int64)
+    loop_position[charts.loops] = np.arange(len(charts.loops))
+
+    # the edges over which the charts continue
+    a = charts.loops[~mesh.loop_is_boundary[charts.loops]]
+    radial = mesh.loop_radial_next[a]
+    linked = faces[mesh.loop_face[radial]]
+    if not ignore_seams:
+        linked &= ~mesh.edge_seam[mesh.loop_edge[a]]
+    a, radial = a[linked], radial[linked]
+
+    # the loop of the same vert on the other side, which is the next one when both faces point the same way
+    next_radial = mesh.loop_next[radial]
+    b = np.where(mesh.loop_vert[next_radial] == mesh.loop_vert[a], next_radial, radial)
+
+    roots = connected_components(len(charts.loops), loop_position[a], loop_position[b])
+    charts.loop_vert = compact_labels(roots).astype(np.int32)
+
+    face_ids = np.flatnonzero(faces)
+    face_position = np.full(mesh.face_count, -1, dtype=np.int64)
+    face_position[face_ids] = np.arange(len(face_ids))
+    face_roots = connected_components(len(face_ids), face_position[mesh.loop_face[a]], face_position[mesh.loop_face[radial]])
+    face_chart = compact_labels(face_roots)
+    charts.count = int(face_chart.max()) + 1 if len(face_chart) else 0
+
+    vert_count = int(charts.loop_vert.max()) + 1 if len(charts.loop_vert) else 0
+    charts.vert_chart = np.zeros(vert_count, dtype=np.int32)
+    charts.vert_chart[charts.loop_vert] = face_chart[face_position[mesh.loop_face[charts.loops]]]
+    charts.vert_mesh_vert = np.zeros(vert_count, dtype=np.int32)
+    charts.vert_mesh_vert[charts.loop_vert] = mesh.loop_vert[charts.loops]
+    return charts
+
+
+def constrained_unwrap(
+    mesh:UVMesh,
+    ignore_seams:bool=False,
+    ignore_pins:bool=False,
+    tolerance:float=1e-8,
+    max_iterations:int=2000,
+) -> int:
+    '''unwraps the uv islands touched by the selection conformally (LSCM), the selected uvs stay where they are
+
+    Like the unwrap of Blender, the islands get cut into charts at the seams, uv splits without a seam
+    get closed. A selected uv pins all loops of its vert in the islands, pinned uvs stay in place too
+    unless ignore_pins. Charts with less than two fixed uv verts keep their place, rotation and size
+    as good as possible. The flags and seams of the mesh don't change.
+
+    Returns the number of conjugate gradient iterations.
+    '''
+    islands = find_uv_islands(mesh)
+    in_islands = np.zeros(mesh.face_count, dtype=bool)
+    faces = np.flatnonzero(islands.face_island >= 0)
+    in_islands[faces] = islands.selected[islands.face_island[faces]]
+    if not in_islands.any():
+        return 0
+
+    charts = find_uv_charts(mesh, in_islands, ignore_seams)
+    loops = charts.loops
+
+    uv = mesh.uv[loops].astype(np.float64)
+    loop_uv = uv[:, 0] + 1j * uv[:, 1]
+    current = _vert_mean(charts, loop_uv, np.ones(len(loops), dtype=bool))
+
+    pinned_verts = np.zeros(len(mesh.vert_co), dtype=bool)
+    pinned_verts[mesh.loop_vert[loops[mesh.vert_select[loops]]]] = True
+    fixed_loops = pinned_verts[mesh.loop_vert[loops]]
+    if not ignore_pins:
+        fixed_loops |= mesh.pin[loops]
+
+    fixed = np.zeros(charts.vert_count, dtype=bool)
+    fixed[charts.loop_vert[fixed_loops]] = True
+    fixed_uv = _vert_mean(charts, loop_uv, fixed_loops)
+
+    # a conformal map is only fixed by two verts, charts with less get two verts far apart fixed for the solve
+    fixed_per_chart = np.bincount(charts.vert_chart[fixed], minlength=charts.count)
+    constrained = fixed & (fixed_per_chart[charts.vert_chart] >= 2)
+    start = np.where(constrained, fixed_uv, current)
+
+    free_charts = np.flatnonzero(fixed_per_chart < 2)
+    first, second = _extreme_verts(mesh, charts, free_charts)
+    constrained[first] = True
+    constrained[second] = True
+    start[second] = current[first] + _direction(current[second] - current[first]) * np.linalg.norm(
+        mesh.vert_co[charts.vert_mesh_vert[second]].astype(np.float64) - mesh.vert_co[charts.vert_mesh_vert[first]], axis=1
+    )
+    start[first] = current[first]
+
+    triangle_verts, weights = _lscm_triangles(mesh, charts)
+    result, iterations = _solve(mesh, charts, triangle_verts, weights, start, ~constrained, tolerance, max_iterations)
+    profiler.count("cg_iterations", iterations)
+
+    result = _fit_free_charts(charts, free_charts, result, current, fixed, fixed_uv)
+
+    # the fixed loops keep their own uv, even when others of their chart vert had a different one
+    moved = ~fixed_loops
+    result = result[charts.loop_vert[moved]]
+    mesh.uv[loops[moved]] = np.column_stack((result.real, result.imag))
+    mesh.uvs_changed()
+    return iterations
+
+
+def _vert_mean(charts:UVCharts, loop_uv:np.ndarray, loop_mask:np.ndarray) -> np.ndarray:
+    '''per chart vert: the mean of the uvs (as complex numbers) of its masked loops, 0 without any'''
+    verts = charts.loop_vert[loop_mask]
+    count = np.bincount(verts, minlength=charts.vert_count)
+    real = np.bincount(verts, loop_uv[loop_mask].real, minlength=charts.vert_count)
+    imag = np.bincount(verts, loop_uv[loop_mask].imag, minlength=charts.vert_count)
+    return (real + 1j * imag) / np.maximum(count, 1)
+
+
+def _direction(vectors:np.ndarray) -> np.ndarray:
+    '''complex unit vectors, 1 where a vector has no length'''
+    length = np.abs(vectors)
+    return np.where(length > 0, vectors / np.where(length > 0, length, 1.0), 1.0)
+
+
+def _extreme_verts(mesh:UVMesh, charts:UVCharts, chart_ids:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''per chart: the two chart verts at the ends of the longest side of its 3D bounds'''
+    in_charts = np.zeros(charts.count, dtype=bool)
+    in_charts[chart_ids] = True
+    verts = np.flatnonzero(in_charts[charts.vert_chart])
+    if len(verts) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    verts = verts[np.argsort(charts.vert_chart[verts], kind="stable")]
+    vert_chart = charts.vert_chart[verts]
+    segment_start = np.flatnonzero(np.diff(vert_chart, prepend=-1))
+
+    co = mesh.vert_co[charts.vert_mesh_vert[verts]].astype(np.float64)
+    size = np.maximum.reduceat(co, segment_start) - np.minimum.reduceat(co, segment_start)
+    axis = np.argmax(size, axis=1)
+    along = co[np.arange(len(verts)), np.repeat(axis, np.diff(np.append(segment_start, len(verts))))]
+
+    order = np.lexsort((along, vert_chart))
+    segment_end = np.append(segment_start[1:], len(verts)) - 1
+    return verts[order[segment_start]], verts[order[segment_end]]
+
+
+def _lscm_triangles(mesh:UVMesh, charts:UVCharts) -> Tuple[np.ndarray, np.ndarray]:
+    '''the faces as triangle fans, with the chart verts and LSCM weights of the triangle corners
+
+    The weights are the complex coefficients of a triangle in its own plane, divided by the square root
+    of its doubled area - a triangle is mapped conformally when the weighted sum of its uvs is zero.
+    '''
+    faces = np.unique(mesh.loop_face[charts.loops])
+    triangle_count = mesh.face_loop_total[faces] - 2
+    face_start = np.repeat(mesh.face_loop_start[faces], triangle_count)
+    fan = np.arange(len(face_start)) - np.repeat(np.cumsum(triangle_count) - triangle_count, triangle_count) + 1
+    corners = np.stack((face_start, face_start + fan, face_start + fan + 1), axis=1)
+
+    co = mesh.vert_co[mesh.loop_vert[corners]].astype(np.float64)
+    edge_1 = co[:, 1] - co[:, 0]
+    edge_2 = co[:, 2] - co[:, 0]
+    length_1 = np.linalg.norm(edge_1, axis=1)
+    doubled_area = np.linalg.norm(np.cross(edge_1, edge_2), axis=1)
+
+    valid = doubled_area > 1e-12 * length_1 * np.linalg.norm(edge_2, axis=1)
+    corners, edge_1, edge_2 = corners[valid], edge_1[valid], edge_2[valid]
+    length_1, doubled_area = length_1[valid], doubled_area[valid]
+
+    # the corners in the plane of the triangle: 0, length_1 and z2
+    z1 = length_1
+    z2 = np.einsum("ij,ij->i", edge_1, edge_2) / length_1 + 1j * doubled_area / length_1
+    weights = np.stack((z2 - z1, -z2, z1 + 0j), axis=1) / np.sqrt(doubled_area)[:, None]
+
+    loop_position = np.full(mesh.loop_count, -1, dtype=np.int64)
+    loop_position[charts.loops] = np.arange(len(charts.loops))
+    return charts.loop_vert[loop_position[corners]], weights
+
+
+class _HermitianMatrix():
+    '''sparse complex matrix in coordinate form, without duplicate entries'''
+
+    def __init__(self, rows:np.ndarray, cols:np.ndarray, values:np.ndarray, size:int) -> None:
+        keys, inverse = np.unique(rows.astype(np.int64) * size + cols, return_inverse=True)
+        self.rows = keys // size
+        self.cols = keys % size
+        self.values = (
+            np.bincount(inverse, values.real, minlength=len(keys))
+            + 1j * np.bincount(inverse, values.imag, minlength=len(keys))
+        )
+        self.size = size
+
+    def dot(self, x:np.ndarray) -> np.ndarray:
+        products = self.values * x[self.cols]
+        return (
+            np.bincount(self.rows, products.real, minlength=self.size)
+            + 1j * np.bincount(self.rows, products.imag, minlength=self.size)
+        )
+
+    def diagonal(self) -> np.ndarray:
+        on_diagonal = self.rows == self.cols
+        return np.bincount(self.rows[on_diagonal], self.values[on_diagonal].real, minlength=self.size)
+
+    def aggregated(self, aggregate:np.ndarray, count:int) -> "_HermitianMatrix":
+        '''the galerkin product P^H A P for the prolongation which copies every aggregate to its verts'''
+        return _HermitianMatrix(aggregate[self.rows], aggregate[self.cols], self.values, count)
+
+
+class _Multigrid():
+    '''V-cycle preconditioner over aggregates of nearby verts, with jacobi smoothing
+
+    The verts get aggregated by cells of a 3D grid which doubles in size per level, aggregates
+    never span several charts. The coarsest level is solved directly - unless the charts are too
+    many small ones to get it below dense_size, then it only gets jacobi smoothed as well.
+    '''
+
+    coarsest_size = 400
+    dense_size = 2000
+    smoothing = 2.0 / 3.0
+    # cell doublings in a row without enough aggregation before giving up, e.g. with many tiny charts
+    max_failed_passes = 8
+
+    def __init__(self, matrix:_HermitianMatrix, co:np.ndarray, chart:np.ndarray) -> None:
+        self.levels = []
+
+        edges = matrix.rows != matrix.cols
+        cell_size = 2.0 * float(np.mean(np.linalg.norm(co[matrix.rows[edges]] - co[matrix.cols[edges]], axis=1))) if edges.any() else 1.0
+        if not cell_size > 0.0:
+            cell_size = 1.0
+
+        failed_passes = 0
+        while matrix.size > self.coarsest_size and failed_passes < self.max_failed_passes and np.isfinite(cell_size):
+            cells = np.floor(co / cell_size).astype(np.int64)
+            _, aggregate = np.unique(np.column_stack((chart, cells)), axis=0, return_inverse=True)
+            aggregate = aggregate.ravel()
+            count = int(aggregate.max()) + 1
+            cell_size *= 2.0
+            if count > 0.8 * matrix.size:
+                failed_passes += 1
+                continue
+            failed_passes = 0
+
+            weight = np.bincount(aggregate, minlength=count)[:, None]
+            coarse_co = np.column_stack([np.bincount(aggregate, co[:, axis], minlength=count) for axis in range(3)]) / weight
+            coarse_chart = np.zeros(count, dtype=chart.dtype)
+            coarse_chart[aggregate] = chart
+
+            self.levels.append((matrix, 1.0 / np.maximum(matrix.diagonal(), 1e-300), aggregate, count))
+            matrix, co, chart = matrix.aggregated(aggregate, count), coarse_co, coarse_chart
+
+        self.coarsest = None
+        self.coarsest_inverse_diagonal = 1.0 / np.maximum(matrix.diagonal(), 1e-300)
+        if matrix.size <= self.dense_size:
+            dense = np.zeros((matrix.size, matrix.size), dtype=np.complex128)
+            dense[matrix.rows, matrix.cols] = matrix.values
+            self.coarsest = np.linalg.pinv(dense, hermitian=True)
+
+    def apply(self, b:np.ndarray, level:int=0) -> np.ndarray:
+        if level == len(self.levels):
+            if self.coarsest is None:
+                return self.coarsest_inverse_diagonal * b
+            return self.coarsest @ b
+
+        matrix, inverse_diagonal, aggregate, count = self.levels[level]
+        x = self.smoothing * inverse_diagonal * b
+        residual = b - matrix.dot(x)
+
+        coarse_residual = np.bincount(aggregate, residual.real, minlength=count) + 1j * np.bincount(aggregate, residual.imag, minlength=count)
+        x += self.apply(coarse_residual, level + 1)[aggregate]
+
+        x += self.smoothing * inverse_diagonal * (b - matrix.dot(x))
+        return x
+
+
+@profiler.timed("solve")
+def _solve(
+    mesh:UVMesh, charts:UVCharts, triangle_verts:np.ndarray, weights:np.ndarray, start:np.ndarray, free:np.ndarray,
+    tolerance:float, max_iterations:int,
+) -> Tuple[np.ndarray, int]:
+    '''minimizes the LSCM energy over the free verts with multigrid preconditioned conjugate gradients
+
+    The normal equations A^H A x = -A^H A fixed of the triangle equations are assembled once,
+    the conjugate gradients start from the current uvs.
+    '''
+    rows = np.repeat(triangle_verts, 3, axis=1).ravel()
+    cols = np.tile(triangle_verts, (1, 3)).ravel()
+    values = (np.conj(weights)[:, :, None] * weights[:, None, :]).ravel()
+
+    # verts without any triangle stay where they are
+    free = free & (np.bincount(triangle_verts.ravel(), minlength=len(start)) > 0)
+    free_verts = np.flatnonzero(free)
+    if len(free_verts) == 0:
+        return start, 0
+
+    fixed_part = np.where(free, 0.0, start)
+    full = _HermitianMatrix(rows, cols, values, len(start))
+    rhs = -full.dot(fixed_part)[free_verts]
+
+    free_index = np.full(len(start), -1, dtype=np.int64)
+    free_index[free_verts] = np.arange(len(free_verts))
+    both_free = free[rows] & free[cols]
+    matrix = _HermitianMatrix(free_index[rows[both_free]], free_index[cols[both_free]], values[both_free], len(free_verts))
+
+    co = mesh.vert_co[charts.vert_mesh_vert[free_verts]].astype(np.float64)
+    preconditioner = _Multigrid(matrix, co, charts.vert_chart[free_verts])
+
+    rhs_norm = np.linalg.norm(rhs)
+    if rhs_norm == 0.0:
+        rhs_norm = 1.0
+
+    x = start[free_verts].copy()
+    residual = rhs - matrix.dot(x)
+    z = preconditioner.apply(residual)
+    direction = z
+    rz = np.vdot(residual, z).real
+
+    iterations = 0
+    while iterations < max_iterations and np.linalg.norm(residual) > tolerance * rhs_norm:
+        product = matrix.dot(direction)
+        curvature = np.vdot(direction, product).real
+        if curvature <= 0.0:
+            break
+        alpha = rz / curvature
+        x += alpha * direction
+        residual -= alpha * product
+
+        z = preconditioner.apply(residual)
+        rz_next = np.vdot(residual, z).real
+        direction = z + (rz_next / rz) * direction
+        rz = rz_next
+        iterations += 1
+
+    result = start.copy()
+    result[free_verts] = x
+    return result, iterations
+
+
+def _fit_free_charts(
+    charts:UVCharts, chart_ids:np.ndarray, uv:np.ndarray, current:np.ndarray, fixed:np.ndarray, fixed_uv:np.ndarray
+) -> np.ndarray:
+    '''rotates, scales and moves the charts solved without two fixed verts onto their current uvs
+
+    Charts with one fixed vert get fitted around it and keep it in place, the others around their center.
+    '''
+    in_charts = np.zeros(charts.count, dtype=bool)
+    in_charts[chart_ids] = True
+    verts = np.flatnonzero(in_charts[charts.vert_chart])
+    if len(verts) == 0:
+        return uv
+
+    vert_chart = charts.vert_chart[verts]
+    counts = np.maximum(np.bincount(vert_chart, minlength=charts.count), 1)
+
+    def chart_sum(values:np.ndarray) -> np.ndarray:
+        real = np.bincount(vert_chart, values.real, minlength=charts.count)
+        imag = np.bincount(vert_chart, values.imag, minlength=charts.count)
+        return real + 1j * imag
+
+    anchor_old = chart_sum(current[verts]) / counts
+    anchor_new = chart_sum(uv[verts]) / counts
+
+    pinned = verts[fixed[verts]]
+    anchor_old[charts.vert_chart[pinned]] = fixed_uv[pinned]
+    anchor_new[charts.vert_chart[pinned]] = uv[pinned]
+
+    new = uv[verts] - anchor_new[vert_chart]
+    old = current[verts] - anchor_old[vert_chart]
+    norm = chart_sum(np.abs(new) ** 2).real
+    scale = chart_sum(np.conj(new) * old) / np.where(norm > 0, norm, 1.0)
+    scale = np.where(np.abs(scale) > 0, scale, 1.0)
+
+    uv = uv.copy()
+    uv[verts] = scale[vert_chart] * new + anchor_old[vert_chart]
+    return uv
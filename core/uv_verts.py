@@ -0,0 +1,66 @@
+import numpy as np
+
+from .union_find import connected_components, compact_labels
+
+
+def gather_ranges(starts:np.ndarray, ends:np.ndarray) -> np.ndarray:
+    '''concatenated np.arange(start, end) for all ranges'''
+    lengths = ends - starts
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(lengths.sum(), dtype=np.int64) + offsets
+
+
+class UVVertIndex():
+    '''assigns every loop the id of its uv vert - loops of the same vert with the same uv location
+
+    The uv verts are stored as CSR arrays: uv vert i owns loops[loop_start[i]:loop_start[i + 1]].
+    '''
+
+    def __init__(self, loop_vert:np.ndarray, uv:np.ndarray, tolerance:float) -> None:
+        self.loop_uv_vert, self.count = self._weld(loop_vert, uv, tolerance)
+
+        self.loops = np.argsort(self.loop_uv_vert, kind="stable").astype(np.int32)
+        self.loop_count = np.bincount(self.loop_uv_vert, minlength=self.count).astype(np.int32)
+        self.loop_start = np.zeros(self.count + 1, dtype=np.int32)
+        np.cumsum(self.loop_count, out=self.loop_start[1:])
+
+    @staticmethod
+    def _weld(loop_vert:np.ndarray, uv:np.ndarray, tolerance:float):
+        # quantize the uvs per vert, loops in the same cell get the same uv vert
+        cells = np.floor(uv / tolerance).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0], loop_vert))
+        keys = np.column_stack((loop_vert[order], cells[order]))
+
+        is_new_cell = np.ones(len(order), dtype=bool)
+        is_new_cell[1:] = (keys[1:] != keys[:-1]).any(axis=1)
+        loop_cell = np.empty(len(order), dtype=np.int64)
+        loop_cell[order] = np.cumsum(is_new_cell) - 1
+
+        # uvs within the tolerance can still end up in neighbouring cells, merge those per vert
+        cell_keys = keys[is_new_cell]
+        is_new_vert = np.ones(len(cell_keys), dtype=bool)
+        is_new_vert[1:] = cell_keys[1:, 0] != cell_keys[:-1, 0]
+        vert_start = np.flatnonzero(is_new_vert)
+        cells_per_vert = np.diff(np.append(vert_start, len(cell_keys)))
+
+        split_verts = cells_per_vert > 1
+        pair_count = cells_per_vert[split_verts]
+        a = gather_ranges(vert_start[split_verts], vert_start[split_verts] + pair_count)
+        b_start = np.repeat(vert_start[split_verts], pair_count)
+        a = np.repeat(a, np.repeat(pair_count, pair_count))
+        b = gather_ranges(b_start, b_start + np.repeat(pair_count, pair_count))
+
+        is_neighbour = (a < b) & (np.abs(cell_keys[a, 1:] - cell_keys[b, 1:]) <= 1).all(axis=1)
+        roots = connected_components(len(cell_keys), a[is_neighbour], b[is_neighbour])
+        cell_uv_vert = compact_labels(roots)
+
+        count = int(cell_uv_vert.max()) + 1 if len(cell_uv_vert) else 0
+        return cell_uv_vert[loop_cell], count
+
+    def uv_vert_loops(self, uv_verts:np.ndarray) -> np.ndarray:
+        '''all loops of the given uv verts'''
+        return self.loops[gather_ranges(self.loop_start[uv_verts], self.loop_start[uv_verts + 1])]
+
+    def coincident_loops(self, loop_indices:np.ndarray) -> np.ndarray:
+        '''all loops sharing a uv vert with any of the given loops'''
+        return self.uv_vert_loops(np.unique(self.loop_uv_vert[loop_indices]))
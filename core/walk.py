@@ -0,0 +1,184 @@
+import numpy as np
+
+from collections import deque
+from typing import Tuple
+
+from .mesh import UVMesh
+from .edge_labels import uv_edge_connected, uv_edgeloop_links, uv_edgering_next
+from .profiling import profiler
+
+
+class WalkStats():
+    '''counts the loops visited by the edgeloop / edgering walkers, to be able to monitor long walks'''
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.walks = 0
+        self.loops_walked = 0
+        self.longest_walk = 0
+
+    def add_walk(self, length:int) -> None:
+        self.walks += 1
+        self.loops_walked += length
+        self.longest_walk = max(self.longest_walk, length)
+        profiler.count("loops_walked", length)
+
+
+walk_stats = WalkStats()
+
+
+def _walk_arrays(walks) -> Tuple[np.ndarray, np.ndarray]:
+    '''loop indices of all walks concatenated, walk i owns loops[segment_start[i]:segment_start[i + 1]]'''
+    loop_count = sum(len(walk) for walk in walks)
+    loops = np.fromiter((loop for walk in walks for loop in walk), dtype=np.int32, count=loop_count)
+    segment_start = np.zeros(len(walks) + 1, dtype=np.int32)
+    np.cumsum([len(walk) for walk in walks], out=segment_start[1:])
+    return loops, segment_start
+
+
+def _constrained(links:np.ndarray, edge_select:np.ndarray) -> np.ndarray:
+    '''only the links to loops with a selected uv edge'''
+    return np.where((links >= 0) & edge_select[links], links, -1)
+
+
+@profiler.timed("walk")
+def find_uv_edgeloops(mesh:UVMesh, start_loops:np.ndarray, constrain_by_selected:bool=False) -> Tuple[np.ndarray, np.ndarray]:
+    '''the sorted uv edgeloops through the start loops as (loops, segment_start), see uv_edgeloop_links'''
+    next_links, prev_links = uv_edgeloop_links(mesh)
+    if constrain_by_selected:
+        next_links = _constrained(next_links, mesh.edge_select)
+        prev_links = _constrained(prev_links, mesh.edge_select)
+    next_links = next_links.tolist()
+    prev_links = prev_links.tolist()
+
+    edgeloops = []
+    uv_loops = set(start_loops.tolist())
+
+    for start_loop in sorted(uv_loops):
+        if start_loop not in uv_loops:
+            continue
+        uv_loops.discard(start_loop)
+        edge_loop = deque([start_loop])
+
+        current = start_loop
+        while True:
+            next_loop = next_links[current]
+            if next_loop < 0 or next_loop == start_loop:
+                break
+            uv_loops.discard(next_loop)
+            edge_loop.append(next_loop)
+            current = next_loop
+
+        current = start_loop
+        while True:
+            prev_loop = prev_links[current]
+            if prev_loop < 0 or prev_loop == start_loop:
+                break
+            uv_loops.discard(prev_loop)
+            edge_loop.appendleft(prev_loop)
+            current = prev_loop
+
+        walk_stats.add_walk(len(edge_loop))
+        edgeloops.append(edge_loop)
+
+    return _walk_arrays(edgeloops)
+
+
+@profiler.timed("walk")
+def find_uv_edgerings(mesh:UVMesh, start_loops:np.ndarray, constrain_by_selected:bool=False) -> Tuple[np.ndarray, np.ndarray]:
+    '''the sorted uv edgerings through the start loops as (loops, segment_start)
+
+    A ring goes across quads to the opposite loop and across uv connected edges to the radial loop.
+    '''
+    ring_next = uv_edgering_next(mesh)
+    if constrain_by_selected:
+        ring_next = _constrained(ring_next, mesh.edge_select)
+    ring_next = ring_next.tolist()
+    radial = mesh.loop_radial_next.tolist()
+    connected = uv_edge_connected(mesh).tolist()
+    face_selected = mesh.face_select[mesh.loop_face].tolist()
+    is_boundary = mesh.loop_is_boundary.tolist()
+
+    edge_rings = []
+    uv_loops = set(start_loops.tolist())
+
+    for start in sorted(uv_loops):
+        if start not in uv_loops:
+            continue
+        uv_loops.discard(start)
+        edge_ring = deque([start])
+
+        forward = True
+        current = start
+        cylic_ring = False
+        while True:
+            next = ring_next[current]
+            current = -1
+            if next >= 0:
+                if forward:
+                    edge_ring.append(next)
+                else:
+                    edge_ring.appendleft(next)
+                uv_loops.discard(next)
+
+                other = radial[next]
+
+                # on a cylinder end meets the start loop again, need to stop there
+                if other == radial[start] or other == start:
+                    cylic_ring = True
+
+                if not cylic_ring and connected[next] and face_selected[other]:
+                    current = other
+                    uv_loops.discard(current)
+
+                    if forward:
+                        edge_ring.append(current)
+                    else:
+                        edge_ring.appendleft(current)
+
+            if cylic_ring:
+                break
+
+            # if no next loop is found - start looking reverse from the start loop
+            if current < 0:
+                if forward and not is_boundary[start]:
+                    forward = False
+
+                    if connected[start]:
+                        current = radial[start]
+                        if face_selected[current]:
+                            edge_ring.appendleft(current)
+                            uv_loops.discard(current)
+                    else:
+                        break
+                else:
+                    break
+
+        walk_stats.add_walk(len(edge_ring))
+        edge_rings.append(edge_ring)
+
+    return _walk_arrays(edge_rings)
+
+
+def selected_uv_edgeloops(mesh:UVMesh) -> Tuple[np.ndarray, np.ndarray]:
+    '''find_uv_edgeloops constrained by the selection, starting from the selected uv edges - the walk is cached per mesh state'''
+    return mesh.cached("selected_uv_edgeloops", lambda: find_uv_edgeloops(
+        mesh, mesh.selected_uv_edge_loops(), constrain_by_selected=True
+    ))
+
+
+def selected_uv_edgerings(mesh:UVMesh) -> Tuple[np.ndarray, np.ndarray]:
+    '''find_uv_edgerings constrained by the selection, starting from the selected uv edges - the walk is cached per mesh state'''
+    return mesh.cached("selected_uv_edgerings", lambda: find_uv_edgerings(
+        mesh, mesh.selected_uv_edge_loops(), constrain_by_selected=True
+    ))
+
+
+def with_end_loops(mesh:UVMesh, loops:np.ndarray, segment_start:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''adds the "other" vert of the last edge to every walk, so the walks cover all uv verts of their edges'''
+    # a walk always contains at least its start loop
+    end_loops = mesh.loop_next[loops[segment_start[1:] - 1]]
+    with_ends = np.insert(loops, segment_start[1:], end_loops)
+    return with_ends.astype(np.int32), (segment_start + np.arange(len(segment_start))).astype(np.int32)
@@ -0,0 +1,25 @@
+from typing import Iterable, List
+
+import bpy
+
+
+def unique_mesh_objects(objects:Iterable[bpy.types.Object]) -> List[bpy.types.Object]:
+    """the mesh objects, only the first object of each mesh.
+
+    Instances and linked duplicates share their mesh, going through all of them would change the
+    same mesh several times - moving a uv map down twice, expanding a selection twice...
+    """
+    meshes = set()
+    unique_objects = []
+    for obj in objects:
+        if obj.type != 'MESH':
+            continue
+
+        key = obj.data.session_uid
+        if key in meshes:
+            continue
+
+        meshes.add(key)
+        unique_objects.append(obj)
+
+    return unique_objects
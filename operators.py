@@ -1,13 +1,14 @@
 import typing
-from typing import List, Set
+from typing import Set, Tuple
 
 import bpy
 from bpy.props import FloatProperty, BoolProperty, IntProperty
 import bmesh
 from bpy.types import Context, Event
 
-from .uv import *
-from .bbox import BBoxUV
+# the numpy based modules get imported by the operators on first use, to keep the addon startup short
+from .mesh_objects import unique_mesh_objects
+from .core.profiling import profiler
 
 expand_modes = (
     ("CONTINUOS", "Continous", ""),
@@ -64,43 +65,23 @@ class UV_OT_uvkit_select_uv_edgeloop(bpy.types.Operator):
         return is_uv_edit_mode()
 
     def execute(self, context):
-        # print("#" * 66)
-        for obj in context.selected_objects:
-            if obj.mode == "EDIT" and obj.type == "MESH":
-                bm = bmesh.from_edit_mesh(obj.data)
-                uv_layer = bm.loops.layers.uv.verify()
-
-                selected_uv_loops = get_selected_uv_edge_loops(bm, uv_layer)
-                
-                if self.mode == "CONTINUOS":
-                    edge_loops = find_uv_edgeloops(selected_uv_loops, uv_layer)
-                    # print(f"number of edgeloops: {len(edge_loops)}")
+        from .snapshot import UVMeshSnapshot
+        from .core.select import expand_uv_edgeloops, select_uv_edgeloops_of_selection, shrink_uv_edgeloops
 
-                    for edgeloop in edge_loops:
-                        select_uv_edgeloop(edgeloop, uv_layer)
+        for obj in unique_mesh_objects(context.selected_objects):
+            if obj.mode == "EDIT":
+                snapshot = UVMeshSnapshot.from_object(obj)
 
+                if self.mode == "CONTINUOS":
+                    select_uv_edgeloops_of_selection(snapshot)
                 elif self.mode == 'EXPAND':
-                    edge_loops = find_uv_edgeloops(
-                        selected_uv_loops, uv_layer, constrain_by_selected=True
-                    )
-                    # print(f"number of edgeloops: {len(edge_loops)}")
-
-                    for edgeloop in edge_loops:
-                        expand_uv_edgeloop(edgeloop, uv_layer)
-
-                    for edgeloop in edge_loops:
-                        select_uv_edgeloop(edgeloop, uv_layer)
-                
+                    expand_uv_edgeloops(snapshot)
                 elif self.mode == 'SHRINK':
-                    edge_loops = find_uv_edgeloops(
-                        selected_uv_loops, uv_layer, constrain_by_selected=True
-                    )
-                    # print(f"number of edgeloops: {len(edge_loops)}")
+                    shrink_uv_edgeloops(snapshot)
 
-                    for edgeloop in edge_loops:
-                        shrink_uv_edgeloop(edgeloop, uv_layer)
-
-                bmesh.update_edit_mesh(obj.data)
+                snapshot.write_uv_flags()
+                with profiler.phase("update_edit_mesh"):
+                    bmesh.update_edit_mesh(obj.data)
 
         return {"FINISHED"}
 
@@ -122,42 +103,23 @@ class UV_OT_uvkit_select_uv_edgering(bpy.types.Operator):
         return is_uv_edit_mode()
 
     def execute(self, context):
-        # print("#" * 66)
-        for obj in context.selected_objects:
-            if obj.mode == "EDIT" and obj.type == "MESH":
-                bm = bmesh.from_edit_mesh(obj.data)
-                uv_layer = bm.loops.layers.uv.verify()
+        from .snapshot import UVMeshSnapshot
+        from .core.select import expand_uv_edgerings, select_uv_edgerings_of_selection, shrink_uv_edgerings
 
-                selected_uv_loops = get_selected_uv_edge_loops(bm, uv_layer)
+        for obj in unique_mesh_objects(context.selected_objects):
+            if obj.mode == "EDIT":
+                snapshot = UVMeshSnapshot.from_object(obj)
 
                 if self.mode == "CONTINUOS":
-                    edge_rings = find_uv_edgerings(
-                        selected_uv_loops, uv_layer, constrain_by_selected=False
-                    )
-
-                    for edge_ring in edge_rings:
-                        select_uv_edgering(edge_ring, uv_layer)
-
+                    select_uv_edgerings_of_selection(snapshot)
                 elif self.mode == "EXPAND":
-                    edge_rings = find_uv_edgerings(
-                        selected_uv_loops, uv_layer, constrain_by_selected=True
-                    )
-
-                    for edge_ring in edge_rings:
-                        expand_uv_edgering(edge_ring, uv_layer)
-
-                    for edge_ring in edge_rings:
-                        select_uv_edgering(edge_ring, uv_layer)
-
+                    expand_uv_edgerings(snapshot)
                 elif self.mode == "SHRINK":
-                    edge_rings = find_uv_edgerings(
-                        selected_uv_loops, uv_layer, constrain_by_selected=True
-                    )
+                    shrink_uv_edgerings(snapshot)
 
-                    for edgering in edge_rings:
-                        shrink_uv_edgering(edgering, uv_layer)
-
-                bmesh.update_edit_mesh(obj.data)
+                snapshot.write_uv_flags()
+                with profiler.phase("update_edit_mesh"):
+                    bmesh.update_edit_mesh(obj.data)
 
         return {"FINISHED"}
 
@@ -186,98 +148,18 @@ CTRL  - use global values"""
         return is_uv_edit_mode()
 
     def execute(self, context):
-        # print( "#" * 66)
-        class Part:
-            def __init__(self):
-                self.mesh = None
-                self.bm = None
-                self.uv_layer = None
-                self.edge_loops = []
-                self.bounding_boxes = []
-                self.directions = []
-
-        parts = []
-
-        for obj in context.selected_objects:
-            if obj.mode != "EDIT" or obj.type != "MESH":
-                continue
-
-            bm = bmesh.from_edit_mesh(obj.data)
-            uv_layer = bm.loops.layers.uv.verify()
-
-            selected_uv_loops = get_selected_uv_edge_loops(bm, uv_layer)
-            edge_loops = find_uv_edgeloops(
-                selected_uv_loops, uv_layer, constrain_by_selected=True
-            )
-
-            # add "other" vert from end
-            for edge_loop in edge_loops:
-                edge_loop.append(edge_loop[-1].link_loop_next)
-
-            part = Part()
-            parts.append(part)
-            part.mesh = obj.data
-            part.bm = bm
-            part.uv_layer = uv_layer
-            part.edge_loops = edge_loops
-
-            for edge_loop in edge_loops:
-                bbox = BBoxUV(edge_loop, uv_layer)
-                direction = self.direction
-                # AUTO direction - need find out alignment
-                if self.direction == "AUTO":                   
-                    direction = "X"
-                    if bbox.diagonal.y < bbox.diagonal.x:
-                        direction = "Y"
-
-                part.bounding_boxes.append(bbox)
-                part.directions.append(direction)
-
-        global_bbox = BBoxUV()
-        if not self.apply_per_edgeloop:
-            for part in parts:
-                for bbox in part.bounding_boxes:
-                    global_bbox.merge(bbox)
-   
-        for part in parts:
-            bm = part.bm
-            uv_layer = part.uv_layer
-
-            for i, edge_loop in enumerate(part.edge_loops):
-                connected_uv_verts = []
-                for loop in edge_loop:
-                    for connected in loop.vert.link_loops:
-                        if not connected.face.select:
-                            continue
-
-                        a = loop[uv_layer].uv
-                        b = connected[uv_layer].uv
-                        if is_same_uv_location(a, b):
-                            connected_uv_verts.append(connected)
-
-                if self.apply_per_edgeloop:
-                    current_bbox = part.bounding_boxes[i]
-                else:
-                    current_bbox = global_bbox
-
-                for loop in connected_uv_verts:
-                    if part.directions[i] == "X":
-                        if self.mode == "AVERAGE":
-                            loop[uv_layer].uv.x = current_bbox.average.x
-                        elif self.mode == "MAX":
-                            loop[uv_layer].uv.x = current_bbox.max.x
-                        elif self.mode == "MIN":
-                            loop[uv_layer].uv.x = current_bbox.min.x
-
-                    elif part.directions[i] == "Y":
-                        if self.mode == "AVERAGE":
-                            loop[uv_layer].uv.y = current_bbox.average.y
-                        elif self.mode == "MAX":
-                            loop[uv_layer].uv.y = current_bbox.max.y
-                        elif self.mode == "MIN":
-                            loop[uv_layer].uv.y = current_bbox.min.y
-
-            bmesh.update_edit_mesh(part.mesh)
+        from .snapshot import UVMeshSnapshot
+        from .core.align import align_uv_edgeloops
+
+        objects = [obj for obj in unique_mesh_objects(context.selected_objects) if obj.mode == "EDIT"]
+        snapshots = [UVMeshSnapshot.from_object(obj) for obj in objects]
+
+        align_uv_edgeloops(snapshots, self.direction, self.mode, self.apply_per_edgeloop)
+
+        for obj, snapshot in zip(objects, snapshots):
+            snapshot.write_uvs()
+            with profiler.phase("update_edit_mesh"):
+                bmesh.update_edit_mesh(obj.data)
 
         return {"FINISHED"}
 
@@ -311,77 +193,17 @@ class UV_OT_uvkit_spread_loop(bpy.types.Operator):
         return is_uv_edit_mode()
 
     def execute(self, context):
-        # print("#"*66)
-        for obj in context.selected_objects:
-            if obj.mode == "EDIT" and obj.type == "MESH":
-                bm = bmesh.from_edit_mesh(obj.data)
-                uv_layer = bm.loops.layers.uv.verify()
-
-                selected_uv_loops = get_selected_uv_edge_loops(bm, uv_layer)
-
-                edge_loops = find_uv_edgeloops(
-                    selected_uv_loops, uv_layer, constrain_by_selected=True
-                )
-                # add "other" vert from end
-                for edge_loop in edge_loops:
-                    edge_loop.append(edge_loop[-1].link_loop_next)
-
-                for edge_loop in edge_loops:
-                    bbox = BBoxUV(edge_loop, uv_layer)
-                    uv_distance = bbox.diagonal.length
-
-                    distances = []
-                    for i in range(1, len(edge_loop)):
-                        a = edge_loop[i - 1]
-                        b = edge_loop[i]
-                        c = b.vert.co - a.vert.co
-                        distances.append(c.length)
-                    total_distance = sum(distances)
-
-                    first_loop_uv = edge_loop[0][uv_layer].uv
-                    last_loop_uv = edge_loop[-1][uv_layer].uv
-                    direction = (last_loop_uv - first_loop_uv).normalized()
-
-                    uv_vectors = []
-                    for loop in edge_loop:
-                        uv_vectors.append(loop[uv_layer].uv - first_loop_uv)
-
-                    for i in range(1, len(edge_loop) - 1):
-                        a = edge_loop[i - 1]
-                        b = edge_loop[i]
-
-                        a_uv = a[uv_layer]
-                        b_uv = b[uv_layer]
-
-                        target_pos = b_uv.uv.to_2d()
-
-                        if self.mode == "GEOMETRY":
-                            distance = (distances[i - 1] * uv_distance) / total_distance
-                            target_pos = a_uv.uv + direction * distance
-
-                        elif self.mode == "EVEN":
-                            distance = uv_distance / (len(edge_loop) - 1)
-                            target_pos = a_uv.uv + direction * distance
-
-                        elif self.mode == "PROJECT":
-                            vector = uv_vectors[i]
-                            projection = vector.dot(direction)
-                            target_pos = (
-                                edge_loop[0][uv_layer].uv + direction * projection
-                            )
-
-                        # need to store the pos, as b_uv could be moved around in following code
-                        b_pos = b_uv.uv.to_2d()
-
-                        for connected in b.vert.link_loops:
-                            if not connected.face.select:
-                                continue
+        from .snapshot import UVMeshSnapshot
+        from .core.straighten import straighten_uv_edgeloops
 
-                            c_uv = connected[uv_layer]
-                            if is_same_uv_location(c_uv.uv, b_pos):
-                                c_uv.uv = target_pos
+        for obj in unique_mesh_objects(context.selected_objects):
+            if obj.mode == "EDIT":
+                snapshot = UVMeshSnapshot.from_object(obj)
+                straighten_uv_edgeloops(snapshot, self.mode)
 
-                bmesh.update_edit_mesh(obj.data)
+                snapshot.write_uvs()
+                with profiler.phase("update_edit_mesh"):
+                    bmesh.update_edit_mesh(obj.data)
         return {"FINISHED"}
 
     def invoke(self, context, event):
@@ -408,76 +230,86 @@ ALT   - ignore seams and pins"""
         return is_uv_edit_mode()
 
     def execute(self, context):
-        for obj in context.selected_objects:
-            if obj.mode == "EDIT" and obj.type == "MESH":
+        import numpy as np
+        from .snapshot import UVMeshSnapshot
+        from .core.islands import find_uv_islands
+        from .core.unwrap import constrained_unwrap
+
+        for obj in unique_mesh_objects(context.selected_objects):
+            if obj.mode == "EDIT" and self.mode == "CONFORMAL":
+                # solved in place, the flags and seams stay untouched
+                snapshot = UVMeshSnapshot.from_object(obj)
+                constrained_unwrap(snapshot, self.ignore_seams, self.ignore_pins)
+
+                snapshot.write_uvs()
+                with profiler.phase("update_edit_mesh"):
+                    bmesh.update_edit_mesh(obj.data)
+
+            elif obj.mode == "EDIT":
                 bm = bmesh.from_edit_mesh(obj.data)
                 uv_layer = bm.loops.layers.uv.verify()
                 
-                selected_uv_loops = get_selected_uv_vert_loops(bm, uv_layer)
-                uv_islands = find_uv_islands_for_selected_uv_loops(bm, uv_layer)
-
-                pinned_uvs = set()
-                seam_edges = set()
-
-                for island in uv_islands:
-                    for loop in island:
-                        for connected in loop.face.loops:
-                            if not connected.face.select:
-                                continue
-
-                            connected[uv_layer].select = True
-                            connected[uv_layer].select_edge = False
-
-                            if self.ignore_pins:
-                                if connected[uv_layer].pin_uv:
-                                    pinned_uvs.add(connected)
-                                connected[uv_layer].pin_uv = False
-
-                            if self.ignore_seams:
-                                if connected.edge.seam:
-                                    seam_edges.add(connected.edge)
-                                connected.edge.seam = False
-
-                for selected_uv_loop in selected_uv_loops:
-                    selected_uv_loop[uv_layer].select = False
-
-                    if selected_uv_loop[uv_layer].pin_uv:
-                        pinned_uvs.add(selected_uv_loop)
-                    selected_uv_loop[uv_layer].pin_uv = True
-                    
-                    for connected in selected_uv_loop.vert.link_loops:
-                        if connected.face.select:
-                            connected[uv_layer].select = False
-
-                            if connected[uv_layer].pin_uv:
-                                pinned_uvs.add(connected)
-                            connected[uv_layer].pin_uv = True
-
-                if self.mode == "ANGLE_BASED":
-                    bpy.ops.uv.unwrap(method="ANGLE_BASED")
-                elif self.mode == "CONFORMAL":
-                    bpy.ops.uv.unwrap(method="CONFORMAL")
-
-                for island in uv_islands:
-                    for loop in island:
-                        for connected in loop.face.loops:
-                            connected[uv_layer].select = False
-                            connected[uv_layer].select_edge = False
-
-                for edge in seam_edges:
-                    edge.seam = True
-
-                for selected_uv_loop in selected_uv_loops:
-                    selected_uv_loop[uv_layer].select = True
-                    selected_uv_loop[uv_layer].pin_uv = False
-                
-                for pinned_uv in pinned_uvs:
-                    pinned_uv[uv_layer].pin_uv = False
+                snapshot = UVMeshSnapshot.from_bmesh(bm, uv_layer.name)
+                selected_uv_loops = snapshot.selected_uv_vert_loops()
 
-                for selected_uv_loop in selected_uv_loops:
-                    selected_uv_loop[uv_layer].select_edge = selected_uv_loop.link_loop_next[uv_layer].select
+                # the islands contain all loops of their faces
+                islands = find_uv_islands(snapshot)
+                island_loops = np.concatenate(
+                    [islands.island_loops(i) for i in np.flatnonzero(islands.selected)] + [np.zeros(0, dtype=np.int32)]
+                )
 
-                bmesh.update_edit_mesh(obj.data)
+                was_pinned = np.zeros(snapshot.loop_count, dtype=bool)
+                seam_edges = np.zeros(0, dtype=np.int32)
+
+                snapshot.vert_select[island_loops] = True
+                snapshot.edge_select[island_loops] = False
+
+                if self.ignore_pins:
+                    was_pinned[island_loops] |= snapshot.pin[island_loops]
+                    snapshot.pin[island_loops] = False
+
+                # the write of the flags can rebuild the bmesh, the seams are kept by edge index
+                if self.ignore_seams:
+                    island_edges = np.unique(snapshot.loop_edge[island_loops])
+                    seam_edges = island_edges[snapshot.edge_seam[island_edges]]
+                    bm.edges.ensure_lookup_table()
+                    for edge in seam_edges.tolist():
+                        bm.edges[edge].seam = False
+
+                # pin the selected uvs and all loops of their verts
+                pinned_verts = np.zeros(len(snapshot.vert_co), dtype=bool)
+                pinned_verts[snapshot.loop_vert[selected_uv_loops]] = True
+                pinned_loops = np.flatnonzero(pinned_verts[snapshot.loop_vert] & snapshot.face_select[snapshot.loop_face])
+
+                was_pinned[pinned_loops] |= snapshot.pin[pinned_loops]
+                was_pinned[selected_uv_loops] = True
+
+                # verts with several selected uvs get all their loops unpinned again afterwards
+                selected_per_vert = np.bincount(snapshot.loop_vert[selected_uv_loops], minlength=len(snapshot.vert_co))
+                was_pinned[pinned_loops] |= selected_per_vert[snapshot.loop_vert[pinned_loops]] > 1
+
+                snapshot.vert_select[pinned_loops] = False
+                snapshot.pin[pinned_loops] = True
+
+                snapshot.write_uv_flags()
+
+                bpy.ops.uv.unwrap(method="ANGLE_BASED")
+
+                snapshot.vert_select[island_loops] = False
+                snapshot.edge_select[island_loops] = False
+
+                bm.edges.ensure_lookup_table()
+                for edge in seam_edges.tolist():
+                    bm.edges[edge].seam = True
+
+                snapshot.vert_select[selected_uv_loops] = True
+                snapshot.pin[selected_uv_loops] = False
+                snapshot.pin[was_pinned] = False
+                snapshot.edge_select[selected_uv_loops] = snapshot.vert_select[snapshot.loop_next[selected_uv_loops]]
+
+                snapshot.write_uv_flags()
+                with profiler.phase("update_edit_mesh"):
+                    bmesh.update_edit_mesh(obj.data)
 
         return {"FINISHED"}
 
@@ -531,134 +363,29 @@ ALT   - set the Cursor"""
     set_cursor: bpy.props.BoolProperty(name="Set Cursor", default=False)
 
     def execute(self, context: Context) -> Set[str]:
-        class Part:
-            def __init__(self):
-                self.mesh = None
-                self.bm = None
-                self.uv_layer = None
-                self.selected_uvs = []
-                self.uv_islands = []
-                self.uv_islands_bounds = []
-
-        global_bbox = BBoxUV()
-        parts = []
-        has_uv_selection = False
-
-        # selection_mode = context.scene.tool_settings.uv_select_mode
-        # face_or_island_selection_mode = selection_mode == 'FACE' or selection_mode == 'ISLAND'
-
-        for obj in context.selected_objects:
-            if obj.mode != "EDIT" or obj.type != "MESH":
-                continue
-
-            bm = bmesh.from_edit_mesh(obj.data)
-            uv_layer = bm.loops.layers.uv.verify()
-
-            selected_uv_loops = get_selected_uv_vert_loops(bm, uv_layer)
-
-            if not has_uv_selection and len(selected_uv_loops) > 0:
-                has_uv_selection  = True
-
-            uv_islands: List[bmesh.types.BMLoop] = []
-            uv_islands_bounds: List[BBoxUV] = []
-            if self.move_island:
-                uv_islands = find_uv_islands_for_selected_uv_loops(bm, uv_layer)       
-                print(f"islands: {len(uv_islands)}")
-                for island in uv_islands:
-                    uv_islands_bounds.append(BBoxUV(island, uv_layer))
-
-            part = Part()
-            part.mesh = obj.data
-            part.bm = bm
-            part.uv_layer = uv_layer
-            part.selected_uvs = selected_uv_loops
-            part.uv_islands = uv_islands
-            part.uv_islands_bounds = uv_islands_bounds
-            parts.append(part)
-
-            if self.move_island:
-                for bbox in part.uv_islands_bounds:
-                    global_bbox.merge(bbox)
-            else:
-                global_bbox.merge(BBoxUV(selected_uv_loops, uv_layer))
-
-        if not has_uv_selection:
+        from .snapshot import UVMeshSnapshot
+        from .core.align import align_uvs, uv_selection_bounds
+
+        objects = [obj for obj in unique_mesh_objects(context.selected_objects) if obj.mode == "EDIT"]
+        snapshots = [UVMeshSnapshot.from_object(obj) for obj in objects]
+
+        bounds = uv_selection_bounds(snapshots, self.move_island)
+        if bounds is None:
             return {"FINISHED"}
-        
+
         if self.use_unit_square:
-            global_bbox.set_to_unit_square()                    
+            bounds.set_to_unit_square()
 
         if self.set_cursor:
-            space_data = context.space_data
-            space_data.cursor_location = global_bbox.get_location(self.direction)
+            context.space_data.cursor_location = bounds.get_location(self.direction)[0].tolist()
             return {"FINISHED"}
-                       
-        for part in parts:
-            bm = part.bm
-            uv_layer = part.uv_layer
-            
-            if self.move_island:
-                for i, island in enumerate(part.uv_islands):
-                    island_bbox: BBoxUV = part.uv_islands_bounds[i]
-                
-                    if self.direction == 'left':
-                        delta = global_bbox.left - island_bbox.left
-                        delta.y = 0 
-                    elif self.direction == 'topleft':
-                        delta = global_bbox.topleft - island_bbox.topleft                           
-                    elif self.direction == 'top':
-                        delta = global_bbox.top - island_bbox.top
-                        delta.x = 0 
-                    elif self.direction == 'topright':
-                        delta = global_bbox.topright - island_bbox.topright
-                    elif self.direction == 'right':
-                        delta = global_bbox.right - island_bbox.right
-                        delta.y = 0 
-                    elif self.direction == 'bottomright':
-                        delta = global_bbox.bottomright - island_bbox.bottomright
-                    elif self.direction == 'bottom':
-                        delta = global_bbox.bottom - island_bbox.bottom
-                        delta.x = 0 
-                    elif self.direction == 'bottomleft':
-                        delta = global_bbox.bottomleft - island_bbox.bottomleft
-                    elif self.direction == 'center':
-                        delta = global_bbox.center - island_bbox.center
-                    elif self.direction == 'horizontal':
-                        delta = global_bbox.center - island_bbox.center
-                        delta.y = 0
-                    elif self.direction == 'vertical':
-                        delta = global_bbox.center - island_bbox.center
-                        delta.x = 0
-
-                    for loop in island:
-                        loop[uv_layer].uv += delta
-
-            else:
-                for loop in part.selected_uvs:
-                    if self.direction == 'left':
-                        loop[uv_layer].uv.x = global_bbox.get_location(self.direction).x
-                    elif self.direction == 'topleft':
-                        loop[uv_layer].uv = global_bbox.get_location(self.direction)
-                    elif self.direction == 'top':
-                        loop[uv_layer].uv.y = global_bbox.get_location(self.direction).y
-                    elif self.direction == 'topright':
-                        loop[uv_layer].uv = global_bbox.get_location(self.direction)
-                    elif self.direction == 'right':
-                        loop[uv_layer].uv.x = global_bbox.get_location(self.direction).x
-                    elif self.direction == 'bottomright':
-                        loop[uv_layer].uv = global_bbox.get_location(self.direction)
-                    elif self.direction == 'bottom':
-                        loop[uv_layer].uv.y = global_bbox.get_location(self.direction).y
-                    elif self.direction == 'bottomleft':
-                        loop[uv_layer].uv = global_bbox.get_location(self.direction)
-                    elif self.direction == 'center':
-                        loop[uv_layer].uv = global_bbox.get_location(self.direction)
-                    elif self.direction == 'horizontal':
-                        loop[uv_layer].uv.y = global_bbox.get_location(self.direction).y
-                    elif self.direction == 'vertical':
-                        loop[uv_layer].uv.x = global_bbox.get_location(self.direction).x
-
-            bmesh.update_edit_mesh(part.mesh)
+
+        align_uvs(snapshots, bounds, self.direction, self.move_island)
+
+        for obj, snapshot in zip(objects, snapshots):
+            snapshot.write_uvs()
+            with profiler.phase("update_edit_mesh"):
+                bmesh.update_edit_mesh(obj.data)
         return {"FINISHED"}
   
 
@@ -681,6 +408,19 @@ ALT   - set the Cursor"""
         return self.execute(context)
 
 
+def uv_aspect(space:bpy.types.SpaceImageEditor) -> Tuple[float, float]:
+    '''aspect of the image in the uv editor, the uv transform tools work in that space'''
+    width, height = 256.0, 256.0
+    image = space.image
+    if image is not None and image.size[0] > 0 and image.size[1] > 0:
+        width = image.size[0] * image.display_aspect[0]
+        height = image.size[1] * image.display_aspect[1]
+
+    if width < height:
+        return 1.0, height / width
+    return width / height, 1.0
+
+
 class UV_OT_uvkit_rotate_shell(bpy.types.Operator):
     bl_idname = "view2d.uvkit_rotate_shell"
     bl_label = "Rotate 90 degrees"
@@ -697,79 +437,50 @@ ALT  - rotate around 2D Cursor"""
 
     @classmethod
     def poll(cls, context):
-        if bpy.context.area.type != 'IMAGE_EDITOR':
+        # without an area (background mode, scripts) it runs too, only other editors are ruled out
+        if context.area is not None and context.area.type != 'IMAGE_EDITOR':
             return False
-        if not bpy.context.active_object:
+        if not context.active_object:
             return False
-        if bpy.context.active_object.type != 'MESH':
+        if context.active_object.type != 'MESH':
             return False
-        if bpy.context.active_object.mode != 'EDIT':
+        if context.active_object.mode != 'EDIT':
             return False
-        if not bpy.context.object.data.uv_layers:
+        if not context.active_object.data.uv_layers:
             return False
-        if bpy.context.scene.tool_settings.use_uv_select_sync:
+        if context.scene.tool_settings.use_uv_select_sync:
             return False
         return True
 
     def execute(self, context):
+        from .snapshot import UVMeshSnapshot
+        from .core.rotate import rotate_uvs
 
-        class Part():
-            def __init__(self):
-                self.mesh = None
-                self.bm = None
-                self.uv_layer = None
-                self.selected = []
+        # without an uv editor there is no cursor and no image, the uvs rotate 1:1
+        space = context.space_data if context.area is not None and context.area.type == 'IMAGE_EDITOR' else None
+        if self.use_cursor and space is None:
+            self.report({'ERROR'}, "Rotating around the 2D cursor needs an UV editor")
+            return {'CANCELLED'}
 
-        # remember initial pivot point setting
-        intial_pivot_point = context.space_data.pivot_point 
+        cursor = space.cursor_location if space is not None else (0.0, 0.0)
+        aspect = uv_aspect(space) if space is not None else (1.0, 1.0)
 
-        context.space_data.pivot_point = "CENTER"
+        pivot = "CENTER"
         if self.use_cursor:
-            context.space_data.pivot_point = 'CURSOR'
+            pivot = "CURSOR"
         elif self.use_individual_origin:
-            context.space_data.pivot_point = 'INDIVIDUAL_ORIGINS'
-               
-
-        # store selected uv loops
-        parts = []    
-        if self.use_island:
-            for obj in context.selected_objects:
-                if obj.mode != "EDIT" or obj.type != "MESH":
-                    continue
-
-                bm = bmesh.from_edit_mesh(obj.data)
-                uv_layer = bm.loops.layers.uv.verify()
-                
-                part = Part()
-                part.mesh = obj.data
-                part.bm = bm
-                part.uv_layer = uv_layer
-                part.selected = get_selected_uv_vert_loops(bm, uv_layer)
-                parts.append(part)
-
-            bpy.ops.uv.select_linked()
-
-        bpy.ops.transform.rotate(value=self.angle, orient_axis='Z', constraint_axis=(False, False, False), use_proportional_edit=False)
-        
-        context.space_data.pivot_point = intial_pivot_point 
-
-        if self.use_island:
-            bpy.ops.uv.select_all(action='DESELECT')
+            pivot = "INDIVIDUAL_ORIGINS"
 
-            # regenerate the selection state
-            for part in parts:
-                bm = part.bm
-                uv_layer = part.uv_layer
-                for loop in part.selected:
-                    loop[uv_layer].select = True
-            
-                bmesh.update_edit_mesh(part.mesh)
+        objects = [obj for obj in unique_mesh_objects(context.selected_objects) if obj.mode == "EDIT"]
+        snapshots = [UVMeshSnapshot.from_object(obj) for obj in objects]
 
-            # flush selection... bit ugly..
-            uv_selection_mode = context.tool_settings.uv_select_mode        
-            bpy.ops.uv.select_mode(type='VERTEX')
-            bpy.ops.uv.select_mode(type=uv_selection_mode)
+        # like transform.rotate in the uv editor, positive angles turn clockwise
+        rotate_uvs(snapshots, -self.angle, pivot, cursor, self.use_island, aspect)
 
+        for obj, snapshot in zip(objects, snapshots):
+            snapshot.write_uvs()
+            with profiler.phase("update_edit_mesh"):
+                bmesh.update_edit_mesh(obj.data)
         return {'FINISHED'}
 
     def invoke(self, context: Context, event: Event):
@@ -807,14 +518,8 @@ classes = [
 
 
 def register():
-
-    import importlib
-    from . import bbox
-    importlib.reload(bbox)
-    from . import uv
-    importlib.reload(uv)
-
     for c in classes:
+        profiler.instrument(c)
         bpy.utils.register_class(c)
 
 
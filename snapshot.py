@@ -0,0 +1,231 @@
+import bpy
+import bmesh
+import numpy as np
+
+from typing import Callable, List
+
+from .core.analysis_cache import analysis_cache, fingerprint
+from .core.mesh import UVMesh
+from .core.profiling import profiler
+
+
+def read_face_select(mesh:bpy.types.Mesh) -> np.ndarray:
+    '''select flags of the polygons - the attribute is a lot faster to read than mesh.polygons, it doesn't exist while nothing is selected'''
+    face_select = np.zeros(len(mesh.polygons), dtype=bool)
+    attribute = mesh.attributes.get(".select_poly")
+    if attribute is not None:
+        attribute.data.foreach_get("value", face_select)
+    return face_select
+
+
+def read_face_loops(mesh:bpy.types.Mesh):
+    '''loop_start and loop_total of the polygons, loop_total is derived to read mesh.polygons only once'''
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.diff(loop_start, append=np.int32(len(mesh.loops))).astype(np.int32)
+    return loop_start, loop_total
+
+
+def write_bmesh_through_mesh(bm:bmesh.types.BMesh, write:Callable[[bpy.types.Mesh], bool]) -> bool:
+    '''copies the bmesh to a temporary mesh for write to change it with foreach_set, then loads the bmesh back from it
+
+    A lot faster than setting many loops one by one in python. write returns whether it changed anything,
+    the bmesh only gets loaded back then. The element indices stay the same, but elements of the bmesh taken
+    before are gone. Shape keys live outside of the mesh and would get lost, so for a bmesh with shape keys
+    this returns False without calling write.
+    '''
+    if len(bm.verts.layers.shape) > 0:
+        return False
+
+    select_mode = bm.select_mode
+    mesh = bpy.data.meshes.new(".uvkit_write")
+    try:
+        bm.to_mesh(mesh)
+        if write(mesh):
+            bm.clear()
+            bm.from_mesh(mesh)
+            bm.select_mode = select_mode
+    finally:
+        bpy.data.meshes.remove(mesh)
+    return True
+
+
+class UVMeshSnapshot(UVMesh):
+    '''UVMesh read from a Blender mesh or edit bmesh, the uvs and flags the tools change get written back to it.
+
+    When the snapshot is taken from a bmesh, the bmesh loop indices match the snapshot indices,
+    so loop.index can be used to look up a bmesh loop in the arrays.
+    '''
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bm = None
+        self.mesh = None
+
+    @classmethod
+    def from_object(cls, obj:bpy.types.Object, uv_layer_name:str=None) -> "UVMeshSnapshot":
+        '''snapshot the mesh of an object - uses the edit bmesh when the object is in edit mode'''
+        if obj.mode == 'EDIT':
+            bm = bmesh.from_edit_mesh(obj.data)
+            if uv_layer_name is None:
+                uv_layer_name = bm.loops.layers.uv.verify().name
+            return cls.from_bmesh(bm, uv_layer_name)
+
+        if uv_layer_name is None:
+            uv_layer_name = obj.data.uv_layers.active.name
+        return cls.from_mesh(obj.data, uv_layer_name)
+
+    @classmethod
+    @profiler.timed("snapshot")
+    def from_bmesh(cls, bm:bmesh.types.BMesh, uv_layer_name:str) -> "UVMeshSnapshot":
+        '''snapshot a bmesh - converts it to a temporary mesh to be able to use foreach_get'''
+
+        # bm.to_mesh also ensures the element indices, which keeps loop.index in sync with the arrays
+        mesh = bpy.data.meshes.new(".uvkit_snapshot")
+        try:
+            bm.to_mesh(mesh)
+            snapshot = cls.from_mesh(mesh, uv_layer_name)
+            snapshot.bm = bm
+            snapshot.mesh = None
+            return snapshot
+        finally:
+            bpy.data.meshes.remove(mesh)
+
+    @classmethod
+    @profiler.timed("snapshot")
+    def from_mesh(cls, mesh:bpy.types.Mesh, uv_layer_name:str) -> "UVMeshSnapshot":
+        '''snapshot a mesh (which is not in edit mode) with foreach_get'''
+        snapshot = cls()
+        snapshot.uv_layer_name = uv_layer_name
+        snapshot.mesh = mesh
+
+        loop_count = len(mesh.loops)
+        face_count = len(mesh.polygons)
+        vert_count = len(mesh.vertices)
+        profiler.count("faces_scanned", face_count)
+
+        # the first access to the uv selection or pins creates their layers and moves the loop data,
+        # so the uv map gets looked up for every access instead of keeping a stale reference
+        uv_layers = mesh.uv_layers
+
+        uv = np.empty(loop_count * 2, dtype=np.float32)
+        uv_layers[uv_layer_name].uv.foreach_get("vector", uv)
+        snapshot.uv = uv.reshape(-1, 2)
+
+        snapshot.vert_select = np.empty(loop_count, dtype=bool)
+        uv_layers[uv_layer_name].vertex_selection.foreach_get("value", snapshot.vert_select)
+        snapshot.edge_select = np.empty(loop_count, dtype=bool)
+        uv_layers[uv_layer_name].edge_selection.foreach_get("value", snapshot.edge_select)
+        snapshot.pin = np.empty(loop_count, dtype=bool)
+        uv_layers[uv_layer_name].pin.foreach_get("value", snapshot.pin)
+
+        snapshot.loop_vert = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", snapshot.loop_vert)
+        snapshot.loop_edge = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", snapshot.loop_edge)
+
+        snapshot.face_select = read_face_select(mesh)
+        snapshot.face_loop_start, snapshot.face_loop_total = read_face_loops(mesh)
+
+        co = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        snapshot.vert_co = co.reshape(-1, 3)
+
+        snapshot.edge_seam = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get("use_seam", snapshot.edge_seam)
+
+        snapshot._cache = analysis_cache.entry(fingerprint(uv_layer_name, len(mesh.edges), (
+            snapshot.loop_vert, snapshot.loop_edge, snapshot.face_loop_start, snapshot.face_loop_total,
+            snapshot.uv, snapshot.face_select, snapshot.vert_select, snapshot.edge_select, snapshot.pin,
+        )))
+
+        edge_count = len(mesh.edges)
+        (
+            snapshot.loop_face, snapshot.loop_next, snapshot.loop_prev,
+            snapshot.loop_radial_next, snapshot.loop_is_boundary,
+        ) = snapshot.cached("topology", lambda: snapshot._build_topology(edge_count))
+        snapshot._mark_written()
+        return snapshot
+
+    @profiler.timed("write_back")
+    def write_uv_flags(self) -> None:
+        '''writes vert_select, edge_select and pin back in one go
+
+        A bmesh only gets the loops which changed since the snapshot or the last write, unless that's
+        most of them, see _write_bmesh. A mesh gets all values with foreach_set.
+        '''
+        changed = self.changed_flag_loops()
+        if len(changed) == 0:
+            return
+        self._cache = None
+
+        if self.bm is None:
+            self._set_uv_flags(self.mesh)
+            self.mesh.update()
+        elif not self._write_bmesh(changed, self._set_uv_flags):
+            uv_layer = self.bm.loops.layers.uv[self.uv_layer_name]
+            flags = zip(
+                self.to_bmesh_loops(changed),
+                self.vert_select[changed].tolist(),
+                self.edge_select[changed].tolist(),
+                self.pin[changed].tolist(),
+            )
+            for loop, vert_select, edge_select, pin in flags:
+                loop_uv = loop[uv_layer]
+                loop_uv.select = vert_select
+                loop_uv.select_edge = edge_select
+                loop_uv.pin_uv = pin
+
+        self._mark_flags_written()
+
+    @profiler.timed("write_back")
+    def write_uvs(self) -> None:
+        '''writes the uvs back, same as write_uv_flags only the changed loops for a bmesh'''
+        changed = self.changed_uv_loops()
+        if len(changed) == 0:
+            return
+
+        if self.bm is None:
+            self._set_uvs(self.mesh)
+            self.mesh.update()
+        elif not self._write_bmesh(changed, self._set_uvs):
+            uv_layer = self.bm.loops.layers.uv[self.uv_layer_name]
+            for loop, uv in zip(self.to_bmesh_loops(changed), self.uv[changed].tolist()):
+                loop[uv_layer].uv = uv
+
+        self._mark_uvs_written()
+
+    def _set_uv_flags(self, mesh:bpy.types.Mesh) -> None:
+        # looked up for every write, writing the flags can create their layers, see from_mesh
+        uv_layers = mesh.uv_layers
+        uv_layers[self.uv_layer_name].vertex_selection.foreach_set("value", self.vert_select)
+        uv_layers[self.uv_layer_name].edge_selection.foreach_set("value", self.edge_select)
+        uv_layers[self.uv_layer_name].pin.foreach_set("value", self.pin)
+
+    def _set_uvs(self, mesh:bpy.types.Mesh) -> None:
+        mesh.uv_layers[self.uv_layer_name].uv.foreach_set("vector", self.uv.ravel())
+
+    def _write_bmesh(self, changed:np.ndarray, set_values:Callable[[bpy.types.Mesh], None]) -> bool:
+        '''writes all loops with write_bmesh_through_mesh once about a quarter of them changed, returns False when it didn't
+
+        The bmesh gets copied again instead of keeping the copy of the snapshot, it can have changed since.
+        All loops get the values of the snapshot.
+        '''
+        if len(changed) * 4 < self.loop_count:
+            return False
+
+        def write(mesh:bpy.types.Mesh) -> bool:
+            set_values(mesh)
+            return True
+
+        return write_bmesh_through_mesh(self.bm, write)
+
+    def to_bmesh_loops(self, loop_indices:np.ndarray) -> List[bmesh.types.BMLoop]:
+        '''lookup the bmesh loops for loop indices, bmesh has no loop lookup table so this goes through the faces'''
+        self.bm.faces.ensure_lookup_table()
+        faces = self.bm.faces
+
+        face_indices = self.loop_face[loop_indices]
+        corners = loop_indices - self.face_loop_start[face_indices]
+
+        return [faces[f].loops[c] for f, c in zip(face_indices.tolist(), corners.tolist())]
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the core package runs without Blender, it gets imported on its own instead of through the addon
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,69 @@
+'''small meshes for the tests, built with UVMesh.from_arrays'''
+
+import numpy as np
+
+from core.mesh import UVMesh
+
+
+def grid_vert(x:int, y:int, columns:int) -> int:
+    return y * (columns + 1) + x
+
+
+def grid_mesh(columns:int, rows:int, **kwargs) -> UVMesh:
+    '''quads in the xy plane, face (x, y) has the verts (x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)
+
+    The uvs are the vert positions, vert_co the same positions in 3D.
+    '''
+    loop_vert = []
+    for y in range(rows):
+        for x in range(columns):
+            loop_vert += [
+                grid_vert(x, y, columns), grid_vert(x + 1, y, columns),
+                grid_vert(x + 1, y + 1, columns), grid_vert(x, y + 1, columns),
+            ]
+    loop_vert = np.array(loop_vert, dtype=np.int32)
+
+    co = np.array([(x, y, 0.0) for y in range(rows + 1) for x in range(columns + 1)], dtype=np.float64)
+    kwargs.setdefault("vert_co", co)
+    return UVMesh.from_arrays(np.full(columns * rows, 4), loop_vert, co[loop_vert, :2], **kwargs)
+
+
+def edge_loop(mesh:UVMesh, a:int, b:int, face:int=None) -> int:
+    '''the loop going from vert a to vert b, in the given face or the first one'''
+    loops = np.flatnonzero((mesh.loop_vert == a) & (mesh.loop_vert[mesh.loop_next] == b))
+    if face is not None:
+        loops = loops[mesh.loop_face[loops] == face]
+    return int(loops[0])
+
+
+def selected_edges(mesh:UVMesh) -> set:
+    '''the selected uv edges as sorted vert pairs'''
+    loops = mesh.selected_uv_edge_loops()
+    return {tuple(sorted(pair)) for pair in zip(mesh.loop_vert[loops].tolist(), mesh.loop_vert[mesh.loop_next[loops]].tolist())}
+
+
+def selected_verts(mesh:UVMesh) -> set:
+    return set(mesh.loop_vert[mesh.selected_uv_vert_loops()].tolist())
+
+
+def bent_row(**kwargs) -> UVMesh:
+    '''4 x 1 quads with the bottom edgeloop selected, its inner uv verts moved off the line'''
+    mesh = grid_mesh(4, 1, **kwargs)
+    for vert, offset in ((grid_vert(1, 0, 4), (0.1, 0.2)), (grid_vert(2, 0, 4), (-0.2, -0.1)), (grid_vert(3, 0, 4), (0.3, 0.3))):
+        mesh.uv[mesh.loop_vert == vert] += offset
+    mesh.uvs_changed()
+    mesh.select_uv_edges([edge_loop(mesh, grid_vert(x, 0, 4), grid_vert(x + 1, 0, 4)) for x in range(4)])
+    return mesh
+
+
+def vert_uvs(mesh:UVMesh, verts) -> np.ndarray:
+    '''the uv per vert, after checking all loops of the vert agree on it'''
+    uvs = []
+    for vert in verts:
+        loop_uvs = mesh.uv[mesh.loop_vert == vert]
+        assert np.allclose(loop_uvs, loop_uvs[0])
+        uvs.append(loop_uvs[0])
+    return np.array(uvs)
+
+
+BENT_ROW_BOTTOM = [grid_vert(x, 0, 4) for x in range(5)]
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from core.align import align_uv_edgeloops, align_uvs, uv_selection_bounds
+
+from meshes import BENT_ROW_BOTTOM as BOTTOM, bent_row, edge_loop, grid_mesh, grid_vert, vert_uvs
+
+
+def test_align_edgeloop_auto_average():
+    mesh = bent_row()
+    align_uv_edgeloops([mesh])
+
+    # the bounds are 4 wide and 0.4 high (v from -0.1 to 0.3), it aligns on the middle of v
+    expected = [(0, 0.1), (1.1, 0.1), (1.8, 0.1), (3.3, 0.1), (4, 0.1)]
+    assert vert_uvs(mesh, BOTTOM) == pytest.approx(np.array(expected), abs=1e-6)
+
+
+def test_align_edgeloop_x_max():
+    mesh = bent_row()
+    align_uv_edgeloops([mesh], "X", "MAX")
+
+    expected = [(4, 0), (4, 0.2), (4, -0.1), (4, 0.3), (4, 0)]
+    assert vert_uvs(mesh, BOTTOM) == pytest.approx(np.array(expected), abs=1e-6)
+
+
+def test_align_edgeloops_together():
+    mesh = grid_mesh(4, 2)
+    mesh.uv[mesh.loop_vert == grid_vert(2, 2, 4)] += (0.0, 0.5)
+    mesh.uvs_changed()
+    # the loops of the top border go from right to left
+    mesh.select_uv_edges(
+        [edge_loop(mesh, grid_vert(x, 0, 4), grid_vert(x + 1, 0, 4)) for x in range(4)]
+        + [edge_loop(mesh, grid_vert(x + 1, 2, 4), grid_vert(x, 2, 4)) for x in range(4)]
+    )
+
+    align_uv_edgeloops([mesh], "Y", "MIN", apply_per_edgeloop=False)
+
+    # both rows go to the lowest v of all selected edgeloops
+    assert vert_uvs(mesh, [grid_vert(x, y, 4) for x in range(5) for y in (0, 2)])[:, 1] == pytest.approx(np.zeros(10))
+
+
+def test_align_uvs_left():
+    mesh = grid_mesh(2, 1)
+    selected = np.isin(mesh.loop_vert, [grid_vert(1, 0, 2), grid_vert(1, 1, 2)])
+    mesh.vert_select[selected] = True
+
+    bounds = uv_selection_bounds([mesh])
+    assert bounds.min[0].tolist() == [1, 0] and bounds.max[0].tolist() == [1, 1]
+
+    bounds.set_to_unit_square()
+    align_uvs([mesh], bounds, "left")
+    assert mesh.uv[selected, 0] == pytest.approx(np.zeros(selected.sum()))
+    assert np.array_equal(mesh.uv[~selected], grid_mesh(2, 1).uv[~selected])
+
+
+def test_align_islands_topright():
+    mesh = grid_mesh(2, 1, vert_select=np.arange(8) == 0)
+    mesh.uv[mesh.loop_face == 1] += (5.0, 0.0)
+    mesh.uvs_changed()
+
+    bounds = uv_selection_bounds([mesh], move_island=True)
+    bounds.set_to_unit_square()
+    align_uvs([mesh], bounds, "topright", move_island=True)
+
+    # the selected island (face 0, 1 x 1) moves into the unit square, the other one stays
+    assert mesh.uv[:4] == pytest.approx(np.array([(0, 0), (1, 0), (1, 1), (0, 1)]))
+    assert mesh.uv[4:] == pytest.approx(np.array([(6, 0), (7, 0), (7, 1), (6, 1)]))
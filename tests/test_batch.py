@@ -0,0 +1,92 @@
+import importlib
+import json
+import os
+
+import pytest
+
+import batch
+
+
+@pytest.fixture
+def operations():
+    '''the batch operations of the addon, they need Blender as the bpy module'''
+    pytest.importorskip("bpy")
+    addon_name, _ = batch.import_addon()
+    return importlib.import_module(f"{addon_name}.batch_operations")
+
+
+JOB = {
+    "files": ["*.blend"],
+    "faces": "all",
+    "operations": [{"op": "sync_uv_maps", "order": ["UVMap", "lightmap"]}],
+    "output_dir": "out",
+}
+
+
+def test_job_hash():
+    same = {"output_dir": "out", "operations": JOB["operations"], "faces": "all", "files": ["*.blend"]}
+    assert batch.job_hash(same) == batch.job_hash(JOB)
+    assert len(batch.job_hash(JOB)) == 12
+
+    changed = dict(JOB, operations=[{"op": "sync_uv_maps", "order": ["lightmap", "UVMap"]}])
+    assert batch.job_hash(changed) != batch.job_hash(JOB)
+
+
+def test_finished_files(tmp_path):
+    out = tmp_path / "results.jsonl"
+    assert batch.finished_files(str(out), "job") == set()
+
+    results = [
+        {"file": "a.blend", "status": "ok", "job": "job"},
+        {"file": "b.blend", "status": "crashed", "job": "job"},
+        {"file": "c.blend", "status": "ok", "job": "job"},
+        {"file": "c.blend", "status": "timeout", "job": "job"},
+        {"file": "d.blend", "status": "ok", "job": "other job"},
+        {"file": "b.blend", "status": "ok", "job": "job"},
+    ]
+    lines = [json.dumps(result) for result in results]
+    # a killed run can leave a cut off last line
+    out.write_text("\n".join(lines) + '\n{"file": "e.blend", "sta')
+
+    # the last result of a file counts
+    assert batch.finished_files(str(out), "job") == {"a.blend", "b.blend"}
+
+
+def test_output_path(operations, tmp_path):
+    base_dir = str(tmp_path)
+    inside = os.path.join(base_dir, "props", "crate.blend")
+    assert operations.output_path(inside, JOB, base_dir) == os.path.join(base_dir, "out", "props", "crate.blend")
+
+    # files outside of the job directory keep only their name
+    outside = os.path.join(os.path.dirname(base_dir), "elsewhere", "crate.blend")
+    assert operations.output_path(outside, JOB, base_dir) == os.path.join(base_dir, "out", "crate.blend")
+
+
+def test_process_file(operations, tmp_path):
+    import bpy
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=4, y_subdivisions=4)
+    mesh = bpy.context.active_object.data
+    path = str(tmp_path / "grid.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=path)
+    uvs = [loop.uv[:] for loop in mesh.uv_layers["UVMap"].data]
+
+    result = operations.process_file(path, JOB, str(tmp_path))
+
+    target = str(tmp_path / "out" / "grid.blend")
+    assert result["objects"] == 1
+    assert result["saved"] == target
+    assert result["operations"][0]["op"] == "sync_uv_maps"
+    assert result["operations"][0]["maps_created"] == 1
+
+    # the copy has the new uv map, the file itself stays as it was
+    bpy.ops.wm.open_mainfile(filepath=target)
+    mesh = bpy.data.meshes[0]
+    assert [uv_map.name for uv_map in mesh.uv_layers] == ["UVMap", "lightmap"]
+    assert [loop.uv[:] for loop in mesh.uv_layers["lightmap"].data] == uvs
+
+    bpy.ops.wm.open_mainfile(filepath=path)
+    assert [uv_map.name for uv_map in bpy.data.meshes[0].uv_layers] == ["UVMap"]
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
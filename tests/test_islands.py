@@ -0,0 +1,46 @@
+import numpy as np
+
+from core.islands import find_uv_islands
+from core.mesh import UVMesh
+
+from meshes import grid_mesh
+
+
+def split_strip(**kwargs) -> UVMesh:
+    '''three quads in a row, the uvs of the last one moved away'''
+    mesh = grid_mesh(3, 1, **kwargs)
+    mesh.uv[mesh.loop_face == 2] += (5.0, 0.0)
+    mesh.uvs_changed()
+    return mesh
+
+
+def test_islands_split_at_uv_seams():
+    islands = find_uv_islands(split_strip())
+
+    assert islands.count == 2
+    assert islands.face_island.tolist() == [0, 0, 1]
+    assert sorted(islands.island_loops(0).tolist()) == list(range(8))
+    assert sorted(islands.island_loops(1).tolist()) == list(range(8, 12))
+
+
+def test_faces_sharing_a_single_uv_vert_are_one_island():
+    # two triangles touching in vert 2 only
+    mesh = UVMesh.from_arrays([3, 3], [0, 1, 2, 2, 3, 4], [(0, 0), (1, 0), (1, 1), (1, 1), (2, 1), (2, 2)])
+    islands = find_uv_islands(mesh)
+    assert islands.count == 1
+
+
+def test_unselected_faces_are_no_island():
+    islands = find_uv_islands(split_strip(face_select=[True, False, True]))
+
+    assert islands.face_island.tolist() == [0, -1, 1]
+    assert islands.count == 2
+
+
+def test_selected_islands():
+    mesh = grid_mesh(3, 1, vert_select=np.arange(12) == 9)
+    mesh.uv[mesh.loop_face == 2] += (5.0, 0.0)
+    mesh.uvs_changed()
+
+    # loop 9 is the second corner of the last quad
+    assert find_uv_islands(mesh).selected.tolist() == [False, True]
@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.rotate import rotate_uvs
+
+from meshes import grid_mesh
+
+
+def test_rotate_selection_around_center():
+    mesh = grid_mesh(2, 1)
+    mesh.vert_select[:] = True
+    rotate_uvs([mesh], math.pi / 2)
+
+    # the bounds center is (1, 0.5), a quarter turn counter-clockwise maps (u, v) to (1.5 - v, u - 0.5)
+    original = grid_mesh(2, 1).uv
+    expected = np.column_stack((1.5 - original[:, 1], original[:, 0] - 0.5))
+    assert mesh.uv == pytest.approx(expected, abs=1e-6)
+
+
+def test_rotate_around_cursor_with_aspect():
+    mesh = grid_mesh(1, 1)
+    mesh.vert_select[mesh.loop_vert == 1] = True
+    rotate_uvs([mesh], math.pi / 2, "CURSOR", cursor=(0.0, 0.0), aspect=(2.0, 1.0))
+
+    # (1, 0) is (2, 0) in pixel space, turned to (0, 2) and back to (0, 2) in uv space
+    assert mesh.uv[mesh.loop_vert == 1] == pytest.approx(np.array([(0.0, 2.0)]), abs=1e-6)
+    assert np.array_equal(mesh.uv[mesh.loop_vert != 1], grid_mesh(1, 1).uv[mesh.loop_vert != 1])
+
+
+def test_rotate_islands_around_their_origins():
+    mesh = grid_mesh(2, 1, vert_select=np.arange(8) == 0)
+    mesh.uv[mesh.loop_face == 1] += (5.0, 0.0)
+    mesh.uvs_changed()
+    mesh.vert_select[4] = True
+
+    rotate_uvs([mesh], math.pi, "INDIVIDUAL_ORIGINS", use_island=True)
+
+    # both islands turn half around their own middle, so every quad ends up on itself
+    assert mesh.uv[:4] == pytest.approx(np.array([(1, 1), (0, 1), (0, 0), (1, 0)]), abs=1e-6)
+    assert mesh.uv[4:] == pytest.approx(np.array([(7, 1), (6, 1), (6, 0), (7, 0)]), abs=1e-6)
+
+
+def test_rotate_without_selection():
+    mesh = grid_mesh(1, 1)
+    rotate_uvs([mesh], 1.0)
+    assert np.array_equal(mesh.uv, grid_mesh(1, 1).uv)
+
+
+def test_unknown_pivot():
+    mesh = grid_mesh(1, 1)
+    mesh.vert_select[:] = True
+    with pytest.raises(ValueError):
+        rotate_uvs([mesh], 1.0, "MEDIAN")
@@ -0,0 +1,96 @@
+from core.select import (expand_uv_edgeloops, expand_uv_edgerings, select_uv_edgeloops_of_selection,
+                         select_uv_edgerings_of_selection, shrink_uv_edgeloops, shrink_uv_edgerings)
+
+from meshes import edge_loop, grid_mesh, grid_vert, selected_edges, selected_verts
+
+# a grid of 4 x 3 quads, the verts of the row y are 5 * y .. 5 * y + 4
+
+
+def v(x:int, y:int) -> int:
+    return grid_vert(x, y, 4)
+
+
+def row(y:int, start:int=0, end:int=4) -> set:
+    return {(v(x, y), v(x + 1, y)) for x in range(start, end)}
+
+
+def column_edges(y:int, start:int=0, end:int=5) -> set:
+    return {(v(x, y), v(x, y + 1)) for x in range(start, end)}
+
+
+def test_select_edges_flushes_to_both_uv_verts():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(1, 1), v(2, 1))])
+
+    assert selected_edges(mesh) == row(1, 1, 2)
+    # every loop of the two verts, on all faces around them
+    assert selected_verts(mesh) == {v(1, 1), v(2, 1)}
+    assert mesh.vert_select.sum() == 8
+
+
+def test_select_edgeloop():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(1, 1), v(2, 1))])
+    select_uv_edgeloops_of_selection(mesh)
+
+    assert selected_edges(mesh) == row(1)
+    # including the end verts on the border
+    assert selected_verts(mesh) == {v(x, 1) for x in range(5)}
+
+
+def test_shrink_and_expand_edgeloop():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(x, 1), v(x + 1, 1)) for x in range(4)])
+
+    shrink_uv_edgeloops(mesh)
+    assert selected_edges(mesh) == row(1, 1, 3)
+    assert selected_verts(mesh) == {v(1, 1), v(2, 1), v(3, 1)}
+
+    expand_uv_edgeloops(mesh)
+    assert selected_edges(mesh) == row(1)
+    assert selected_verts(mesh) == {v(x, 1) for x in range(5)}
+
+
+def test_shrink_edgeloop_of_one_edge_keeps_it():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(1, 1), v(2, 1))])
+    shrink_uv_edgeloops(mesh)
+    assert selected_edges(mesh) == row(1, 1, 2)
+
+
+def test_select_edgering():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(2, 1), v(2, 2))])
+    select_uv_edgerings_of_selection(mesh)
+
+    assert selected_edges(mesh) == column_edges(1)
+    # both loops of the inner edges, one of the border edges
+    assert mesh.edge_select.sum() == 8
+    assert selected_verts(mesh) == {v(x, y) for x in range(5) for y in (1, 2)}
+
+
+def test_shrink_edgering_drops_both_loops_of_the_end_edges():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(x, a), v(x, b)) for x in (1, 2, 3) for a, b in ((1, 2), (2, 1))])
+    assert mesh.edge_select.sum() == 6
+
+    shrink_uv_edgerings(mesh)
+
+    assert selected_edges(mesh) == column_edges(1, 2, 3)
+    assert mesh.edge_select.sum() == 2
+    # the uv verts of the dropped edges get deselected, the ones still used by the middle edge stay
+    assert selected_verts(mesh) == {v(2, 1), v(2, 2)}
+
+
+def test_shrink_and_expand_edgering():
+    mesh = grid_mesh(4, 3)
+    mesh.select_uv_edges([edge_loop(mesh, v(2, 1), v(2, 2))])
+    select_uv_edgerings_of_selection(mesh)
+
+    shrink_uv_edgerings(mesh)
+    assert selected_edges(mesh) == column_edges(1, 1, 4)
+    assert selected_verts(mesh) == {v(x, y) for x in (1, 2, 3) for y in (1, 2)}
+
+    expand_uv_edgerings(mesh)
+    assert selected_edges(mesh) == column_edges(1)
+    assert mesh.edge_select.sum() == 8
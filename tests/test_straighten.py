@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.straighten import straighten_uv_edgeloops
+
+from meshes import BENT_ROW_BOTTOM as BOTTOM, bent_row, edge_loop, grid_mesh, grid_vert, vert_uvs
+
+
+def v(x:int, y:int) -> int:
+    return grid_vert(x, y, 4)
+
+
+# the bounds of the bent edgeloop are 4 x 0.4
+DIAGONAL = math.hypot(4.0, 0.4)
+
+
+def test_project():
+    mesh = bent_row()
+    straighten_uv_edgeloops(mesh, "PROJECT")
+    assert vert_uvs(mesh, BOTTOM) == pytest.approx(np.array([(0, 0), (1.1, 0), (1.8, 0), (3.3, 0), (4, 0)]), abs=1e-6)
+
+
+def test_even():
+    mesh = bent_row()
+    straighten_uv_edgeloops(mesh, "EVEN")
+
+    step = DIAGONAL / 4
+    # the end uv verts stay where they are
+    expected = [(0, 0), (step, 0), (2 * step, 0), (3 * step, 0), (4, 0)]
+    assert vert_uvs(mesh, BOTTOM) == pytest.approx(np.array(expected), abs=1e-6)
+
+
+def test_geometry():
+    co = np.array([(x, y, 0.0) for y in range(2) for x in range(5)])
+    co[v(1, 0), 0] = 0.5
+    mesh = bent_row(vert_co=co)
+    straighten_uv_edgeloops(mesh, "GEOMETRY")
+
+    # the 3D lengths along the edgeloop are 0.5, 1.5, 1, 1 - scaled from 4 to the uv bounds diagonal
+    scale = DIAGONAL / 4
+    expected = [(0, 0), (0.5 * scale, 0), (2 * scale, 0), (3 * scale, 0), (4, 0)]
+    assert vert_uvs(mesh, BOTTOM) == pytest.approx(np.array(expected), abs=1e-6)
+
+
+def test_other_uvs_stay():
+    mesh = bent_row()
+    top = vert_uvs(mesh, [v(x, 1) for x in range(5)])
+    straighten_uv_edgeloops(mesh, "EVEN")
+    assert np.array_equal(vert_uvs(mesh, [v(x, 1) for x in range(5)]), top)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        straighten_uv_edgeloops(bent_row(), "CURVED")
+
+
+def test_crossing_edgeloops_in_walk_order():
+    # a 3 x 3 grid with the column x = 1 and the row y = 1 selected on one side of their edges,
+    # the row runs from right to left, the column edgeloop comes first as it has the lower loop
+    mesh = grid_mesh(3, 3)
+    column = [edge_loop(mesh, grid_vert(1, y, 3), grid_vert(1, y + 1, 3), face=3 * y) for y in range(3)]
+    row = [edge_loop(mesh, grid_vert(x + 1, 1, 3), grid_vert(x, 1, 3), face=x) for x in range(3)]
+    mesh.edge_select[column + row] = True
+    for vert, uv in ((grid_vert(1, 1, 3), (1.2, 1.3)), (grid_vert(1, 2, 3), (1.1, 2))):
+        mesh.uv[mesh.loop_vert == vert] = uv
+    mesh.uvs_changed()
+
+    straighten_uv_edgeloops(mesh, "EVEN")
+
+    # the column spaces its uv verts over its bounds diagonal, the row then sees the crossing uv vert moved
+    column_step = math.hypot(0.2, 3) / 3
+    row_step = math.hypot(3, column_step - 1) / 3
+    expected = [(3 - 2 * row_step, 1), (1, 2 * column_step), (3 - row_step, 1)]
+    assert vert_uvs(mesh, [grid_vert(1, 1, 3), grid_vert(1, 2, 3), grid_vert(2, 1, 3)]) == pytest.approx(np.array(expected), abs=1e-6)
@@ -0,0 +1,27 @@
+import numpy as np
+
+from core.union_find import compact_labels, connected_components, find_roots
+
+
+def test_connected_components_root_is_smallest_element():
+    roots = connected_components(7, [1, 4, 6], [2, 5, 4])
+    assert roots.tolist() == [0, 1, 1, 3, 4, 4, 4]
+
+
+def test_connected_components_long_chain_in_any_order():
+    count = 2000
+    pairs = np.random.RandomState(0).permutation(count - 1)
+    roots = connected_components(count, pairs + 1, pairs)
+    assert (roots == 0).all()
+
+
+def test_connected_components_without_pairs():
+    assert connected_components(3, [], []).tolist() == [0, 1, 2]
+
+
+def test_find_roots():
+    assert find_roots(np.array([0, 0, 1, 2, 4])).tolist() == [0, 0, 0, 0, 4]
+
+
+def test_compact_labels():
+    assert compact_labels(np.array([0, 0, 3, 3, 5])).tolist() == [0, 0, 1, 1, 2]
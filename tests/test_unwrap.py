@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from core.mesh import UVMesh
+from core.unwrap import _HermitianMatrix, _Multigrid, constrained_unwrap, find_uv_charts
+
+from meshes import grid_mesh, grid_vert
+
+
+def scrambled_grid(size:int, selected_verts, **kwargs):
+    '''size x size quads with the uvs of all other verts moved randomly, and the uvs without the moves'''
+    exact = grid_mesh(size, size).uv.copy()
+    jitter = np.random.RandomState(1).uniform(-0.2, 0.2, ((size + 1) ** 2, 2))
+    jitter[selected_verts] = 0.0
+
+    mesh = grid_mesh(size, size, **kwargs)
+    mesh.uv += jitter[mesh.loop_vert]
+    mesh.vert_select[np.isin(mesh.loop_vert, selected_verts)] = True
+    mesh.uvs_changed()
+    mesh._mark_written()
+    return mesh, exact
+
+
+def test_flat_grid_with_two_selected_corners():
+    mesh, exact = scrambled_grid(8, [grid_vert(0, 0, 8), grid_vert(8, 0, 8)])
+    constrained_unwrap(mesh)
+
+    # a flat grid maps conformally onto itself, the two selected corners fix position, rotation and size
+    assert mesh.uv == pytest.approx(exact, abs=1e-5)
+
+
+def test_selected_uvs_and_flags_stay():
+    selected = [grid_vert(x, 0, 6) for x in range(7)]
+    mesh, _ = scrambled_grid(6, selected)
+    before = mesh.uv.copy()
+    constrained_unwrap(mesh)
+
+    kept = np.isin(mesh.loop_vert, selected)
+    assert np.array_equal(mesh.uv[kept], before[kept])
+    assert len(mesh.changed_uv_loops()) > 0
+    assert len(mesh.changed_flag_loops()) == 0
+
+
+def test_pins_stay_unless_ignored():
+    mesh, _ = scrambled_grid(4, [grid_vert(0, 0, 4)])
+    pinned = mesh.loop_vert == grid_vert(4, 4, 4)
+    mesh.pin[pinned] = True
+    before = mesh.uv.copy()
+
+    constrained_unwrap(mesh)
+    assert np.array_equal(mesh.uv[pinned], before[pinned])
+
+    mesh.uv[:] = before
+    mesh.uvs_changed()
+    constrained_unwrap(mesh, ignore_pins=True)
+    assert not np.array_equal(mesh.uv[pinned], before[pinned])
+
+
+def test_unselected_islands_stay():
+    mesh, _ = scrambled_grid(4, [])
+    before = mesh.uv.copy()
+    assert constrained_unwrap(mesh) == 0
+    assert np.array_equal(mesh.uv, before)
+
+
+def test_charts_are_cut_at_seams():
+    mesh = grid_mesh(4, 2)
+    # the seam runs along x = 2
+    column = mesh.loop_vert % 5 == 2
+    seam_loops = column & (mesh.loop_vert[mesh.loop_next] % 5 == 2)
+    edge_seam = np.zeros(len(mesh.edge_seam), dtype=bool)
+    edge_seam[mesh.loop_edge[seam_loops]] = True
+    mesh = grid_mesh(4, 2, edge_seam=edge_seam)
+
+    faces = np.ones(mesh.face_count, dtype=bool)
+    assert find_uv_charts(mesh, faces).count == 2
+    assert find_uv_charts(mesh, faces, ignore_seams=True).count == 1
+    # the verts on the seam are in both charts
+    assert find_uv_charts(mesh, faces).vert_count == 15 + 3
+
+
+def test_many_tiny_charts():
+    # single triangle islands can't be aggregated, the multigrid has to stop coarsening
+    count = 600
+    triangle = np.array([(0, 0, 0), (1, 0, 0), (0.3, 1, 0)], dtype=np.float64)
+    offsets = np.array([(3.0 * (i % 30), 3.0 * (i // 30), 0.0) for i in range(count)])
+    co = (triangle[None] + offsets[:, None]).reshape(-1, 3)
+    uv = co[:, :2] * 0.01 + np.random.RandomState(0).normal(scale=1e-3, size=(3 * count, 2))
+    selected = np.zeros(3 * count, dtype=bool)
+    selected[2::3] = True
+
+    mesh = UVMesh.from_arrays(np.full(count, 3), np.arange(3 * count), uv, vert_co=co, vert_select=selected)
+    constrained_unwrap(mesh)
+
+    # every triangle keeps its selected corner and gets the shape of the 3D triangle
+    assert np.array_equal(mesh.uv[selected], uv[selected].astype(np.float32))
+    corners = mesh.uv.astype(np.float64).reshape(count, 3, 2)
+    uv_sides = np.linalg.norm(corners[:, [1, 2, 0]] - corners, axis=2)
+    co_sides = np.linalg.norm(triangle[[1, 2, 0]] - triangle, axis=1)
+    ratios = uv_sides / co_sides
+    assert ratios == pytest.approx(ratios[:, :1] * np.ones(3), rel=1e-4)
+
+
+def test_multigrid_without_coarsening_skips_the_dense_solve():
+    size = _Multigrid.dense_size + 1
+    diagonal = np.arange(1.0, size + 1.0)
+    matrix = _HermitianMatrix(np.arange(size), np.arange(size), diagonal + 0j, size)
+
+    # every vert is its own chart, no aggregation is possible
+    multigrid = _Multigrid(matrix, np.zeros((size, 3)), np.arange(size))
+    assert multigrid.levels == []
+    assert multigrid.coarsest is None
+    assert multigrid.apply(diagonal + 0j) == pytest.approx(np.ones(size))
@@ -0,0 +1,38 @@
+import numpy as np
+
+from core.uv_verts import UVVertIndex, gather_ranges
+
+
+def test_gather_ranges():
+    assert gather_ranges(np.array([2, 7, 4]), np.array([4, 7, 6])).tolist() == [2, 3, 4, 5]
+
+
+def test_weld_same_vert_same_location():
+    loop_vert = np.array([0, 0, 0, 1, 1])
+    uv = np.array([(0.2, 0.2), (0.2, 0.2), (0.7, 0.2), (0.2, 0.2), (0.2, 0.2)])
+    index = UVVertIndex(loop_vert, uv, 0.001)
+
+    ids = index.loop_uv_vert
+    assert index.count == 3
+    assert ids[0] == ids[1]
+    assert ids[2] != ids[0]
+    # the same location on another vert is another uv vert
+    assert ids[3] == ids[4] != ids[0]
+
+
+def test_weld_across_cell_borders():
+    # both uvs are within the tolerance, but quantized into neighbouring cells
+    uv = np.array([(0.0009999, 0.5), (0.0010001, 0.5)])
+    index = UVVertIndex(np.array([0, 0]), uv, 0.001)
+    assert index.count == 1
+
+
+def test_uv_vert_loops_csr():
+    loop_vert = np.array([0, 1, 0, 1])
+    uv = np.array([(0.0, 0.0), (1.0, 0.0), (0.0, 0.0), (1.0, 1.0)])
+    index = UVVertIndex(loop_vert, uv, 0.001)
+
+    assert index.count == 3
+    assert index.loop_start.tolist() == [0, 2, 3, 4]
+    assert sorted(index.coincident_loops(np.array([2])).tolist()) == [0, 2]
+    assert sorted(index.uv_vert_loops(np.array([1, 2])).tolist()) == [1, 3]
@@ -1,6 +1,9 @@
 import math
+from typing import Dict, List, Tuple
+
 import bpy
 import bmesh
+from bpy.app.handlers import persistent
 
 
 from bpy.props import (IntProperty,
@@ -13,10 +16,76 @@ from bpy.types import (Operator,
                        Panel,
                        PropertyGroup,
                        UIList)
+from bpy_extras.io_utils import ExportHelper
+
+from .core.profiling import profiler
+from . import uv_layers
 
 
 #region UI
 
+class MaterialImageCache():
+    """What the texture menu shows, it gets drawn over and over while the mesh and materials stay the same.
+
+    Keeps the image names of the image texture nodes per material and the material indices of the
+    selected faces per edit mesh, keyed by session_uid. The depsgraph handler drops the entries of
+    updated meshes, and all image entries when a material or node tree got updated.
+    """
+
+    def __init__(self) -> None:
+        self.material_images: Dict[int, List[str]] = {}
+        self.face_material_indices: Dict[int, Tuple[int, ...]] = {}
+
+    def images(self, material:bpy.types.Material) -> List[bpy.types.Image]:
+        key = material.session_uid
+        names = self.material_images.get(key)
+        if names is not None:
+            images = [bpy.data.images.get(name) for name in names]
+            # renamed images don't show up as depsgraph update
+            if all(images):
+                return images
+
+        images = [node.image for node in material.node_tree.nodes if node.type == 'TEX_IMAGE' and node.image]
+        self.material_images[key] = [image.name for image in images]
+        return images
+
+    def selected_material_indices(self, mesh:bpy.types.Mesh) -> Tuple[int, ...]:
+        """material indices of the selected faces of a mesh in edit mode"""
+        key = mesh.session_uid
+        indices = self.face_material_indices.get(key)
+        if indices is None:
+            # only the bmesh is up to date in edit mode - a set over its faces is quicker than
+            # converting it to a mesh for foreach_get
+            bm = bmesh.from_edit_mesh(mesh)
+            indices = tuple(sorted({face.material_index for face in bm.faces if face.select}))
+            self.face_material_indices[key] = indices
+        return indices
+
+    def depsgraph_updated(self, depsgraph:bpy.types.Depsgraph) -> None:
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Mesh):
+                self.face_material_indices.pop(update.id.original.session_uid, None)
+            elif isinstance(update.id, (bpy.types.Material, bpy.types.NodeTree)):
+                self.material_images.clear()
+
+    def clear(self) -> None:
+        self.material_images.clear()
+        self.face_material_indices.clear()
+
+
+material_image_cache = MaterialImageCache()
+
+
+@persistent
+def material_image_cache_depsgraph_handler(scene, depsgraph):
+    material_image_cache.depsgraph_updated(depsgraph)
+
+
+@persistent
+def material_image_cache_clear_handler(*args):
+    material_image_cache.clear()
+
+
 class IMAGE_MT_uvkit_imageList(bpy.types.Menu):
     # heavily copied from Reinier Goijvaerts
     bl_idname = "IMAGE_MT_uvkit_imageList"
@@ -31,11 +100,14 @@ class IMAGE_MT_uvkit_imageList(bpy.types.Menu):
         
         materials = []
         if obj.type == 'MESH' and obj.mode == 'EDIT':
-            mesh = bmesh.from_edit_mesh(obj.data)
-            material_indices = [face.material_index for face in mesh.faces if face.select]
+            material_indices = material_image_cache.selected_material_indices(obj.data)
 
             if len(material_indices) and len(obj.material_slots):
                 for index in material_indices:
+                    # faces can keep an index past the last slot
+                    if index >= len(obj.material_slots):
+                        continue
+
                     slot = obj.material_slots[index]
                     if not slot.material:
                         continue
@@ -53,16 +125,10 @@ class IMAGE_MT_uvkit_imageList(bpy.types.Menu):
             if not mat:
                 continue
 
-            for node in mat.node_tree.nodes:
-                if node.type != 'TEX_IMAGE':
-                    continue
-
-                if not node.image:
-                    continue
-                
+            for image in material_image_cache.images(mat):
                 texture_usage_found = True
-                button = layout.operator("view2d.uvkit_show_image", text=node.image.name, icon_value=layout.icon(node.image))
-                button.image_name = node.image.name
+                button = layout.operator("view2d.uvkit_show_image", text=image.name, icon_value=layout.icon(image))
+                button.image_name = image.name
 
         if not texture_usage_found:
             layout.label(text='No textures used')
@@ -158,6 +224,81 @@ class IMAGE_PT_uvkit_main(Panel):
         col.operator("view2d.uvkit_constrained_unwrap", text="Constrained Unwrap")
         col.enabled = show_uvedit
 
+class IMAGE_PT_uvkit_profiling(Panel):
+    bl_idname = "IMAGE_PT_uvkit_profiling"
+    bl_label = "Profiling"
+    bl_space_type = 'IMAGE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "Tool"
+    bl_parent_id = "IMAGE_PT_uvkit_main"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.preferences.view.show_developer_ui
+
+    def draw_header(self, context):
+        self.layout.prop(context.window_manager, "uvkit_profiling", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        wm = context.window_manager
+
+        row = layout.row(align=True)
+        row.prop(wm, "uvkit_profiling_history")
+        row.operator("view2d.uvkit_export_profile", text="", icon="EXPORT")
+        row.operator("view2d.uvkit_clear_profile", text="", icon="TRASH")
+
+        refresh = uv_layers.uv_list_refresh
+        col = layout.column(align=True)
+        col.label(text=profiler.startup_report())
+        col.label(text=f"UV map list: {refresh.rebuilt} rebuilds, {refresh.suppressed} refreshes suppressed")
+        col.label(text=f"    {refresh.coalesced} coalesced, {refresh.unchanged} unchanged")
+        index = uv_layers.uv_map_index
+        col.label(text=f"UV map index: {len(index.mesh_layers)} meshes, {index.reads} reads")
+
+        if not profiler.history:
+            layout.label(text="No operator profiled yet")
+            return
+
+        # newest first
+        for profile in reversed(profiler.history):
+            box = layout.box()
+            col = box.column(align=True)
+            col.label(text=f"{profile.operator}  {profile.total * 1000.0:.2f} ms")
+            for name, seconds in sorted(profile.phases.items(), key=lambda item: -item[1]):
+                col.label(text=f"    {name}: {seconds * 1000.0:.2f} ms")
+            for name, value in sorted(profile.counters.items()):
+                col.label(text=f"    {name}: {value}")
+
+class UV_OT_uvkit_export_profile(Operator, ExportHelper):
+    bl_idname = "view2d.uvkit_export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Write the recorded operator profiles to a json file"
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        profiler.export_json(self.filepath)
+        self.report({'INFO'}, f"{len(profiler.history)} profiles written to {self.filepath}")
+        return {'FINISHED'}
+
+class UV_OT_uvkit_clear_profile(Operator):
+    bl_idname = "view2d.uvkit_clear_profile"
+    bl_label = "Clear Profile"
+    bl_description = "Remove the recorded operator profiles"
+
+    def execute(self, context):
+        profiler.clear()
+        return {'FINISHED'}
+
+def profiling_update(self, context):
+    profiler.enabled = self.uvkit_profiling
+
+def profiling_history_update(self, context):
+    profiler.set_history_size(self.uvkit_profiling_history)
+
 class IMAGE_MT_uvkit_align_PIE(bpy.types.Menu):
     bl_label = 'UV kit Align'
     bl_idname = 'IMAGE_MT_uvkit_align_pie' 
@@ -187,6 +328,9 @@ def uvcontext_menu_draw_func(self, context):
 
 classes = [
     IMAGE_PT_uvkit_main,
+    IMAGE_PT_uvkit_profiling,
+    UV_OT_uvkit_export_profile,
+    UV_OT_uvkit_clear_profile,
     IMAGE_MT_uvkit_imageList,
     IMAGE_MT_uvkit_align_PIE,
 ]
@@ -197,6 +341,16 @@ def register():
     for c in classes:
         bpy.utils.register_class(c)
 
+    bpy.types.WindowManager.uvkit_profiling = BoolProperty(name="Profile operators",
+                                            description="Record phase timings and counters of the uv kit operators",
+                                            default=profiler.enabled,
+                                            update=profiling_update)
+    bpy.types.WindowManager.uvkit_profiling_history = IntProperty(name="History",
+                                            description="Number of operator executes to keep",
+                                            default=profiler.history.maxlen,
+                                            min=1, max=1000,
+                                            update=profiling_history_update)
+
     wm = bpy.context.window_manager     
     if  wm.keyconfigs.addon:
         keymap = wm.keyconfigs.addon.keymaps.new(name='UV Editor', space_type='EMPTY', region_type="WINDOW")
@@ -207,8 +361,26 @@ def register():
 
     bpy.types.IMAGE_MT_uvs_context_menu.append(uvcontext_menu_draw_func)
 
+    if material_image_cache_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(material_image_cache_depsgraph_handler)
+
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if material_image_cache_clear_handler not in handlers:
+            handlers.append(material_image_cache_clear_handler)
+
 
 def unregister():
+    if material_image_cache_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(material_image_cache_depsgraph_handler)
+
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if material_image_cache_clear_handler in handlers:
+            handlers.remove(material_image_cache_clear_handler)
+    material_image_cache.clear()
+
+    del bpy.types.WindowManager.uvkit_profiling
+    del bpy.types.WindowManager.uvkit_profiling_history
+
     for keymap, keymap_item in addon_keymaps:
         keymap.keymap_items.remove(keymap_item)
     addon_keymaps.clear()   
@@ -0,0 +1,183 @@
+import bpy
+import bmesh
+import numpy as np
+
+from typing import List, Tuple
+
+from .snapshot import UVMeshSnapshot, read_face_select, read_face_loops, write_bmesh_through_mesh
+from .uv_layers import uv_map_index
+
+
+def uv_layer_names(mesh:bpy.types.Mesh) -> List[str]:
+    return [uv_layer.name for uv_layer in mesh.uv_layers]
+
+
+def reorder_uv_layers(mesh:bpy.types.Mesh, order:List[str]) -> int:
+    """Brings the uv maps of a mesh into the given order of their names, returns the number of uv maps written.
+
+    Blender can't move uv layers, so the layers stay in place and only get the names and data of the
+    maps which end up at their slot. Maps which keep their slot are not touched, the others are read
+    once with foreach_get and written once with foreach_set. Pins and uv selection move along with the uvs,
+    the active and the render active map stay the same map.
+
+    The uv data of a mesh in edit mode is not accessible, see object_mode.
+    """
+    uvs = mesh.uv_layers
+    names = uv_layer_names(mesh)
+    if sorted(order) != sorted(names):
+        raise ValueError(f"{mesh.name}: {order} is no permutation of the uv maps {names}")
+
+    moved = [index for index, name in enumerate(order) if names[index] != name]
+    if not moved:
+        return 0
+
+    active_name = uvs.active.name if uvs.active else None
+    render_active_name = next((uv_layer.name for uv_layer in uvs if uv_layer.active_render), None)
+
+    data = {names[index]: _read_uv_layer(mesh, index) for index in moved}
+
+    # names have to be unique at any time, so the moved maps get a temporary name first
+    for index in moved:
+        mesh.uv_layers[index].name = f".uvkit_reorder_{index}"
+
+    try:
+        for index in moved:
+            _write_uv_layer(mesh, index, order[index], data[order[index]])
+    except Exception:
+        # back to the maps as they were, a half written order would lose uv maps
+        for index in moved:
+            mesh.uv_layers[index].name = f".uvkit_reorder_{index}"
+        for index in moved:
+            _write_uv_layer(mesh, index, names[index], data[names[index]])
+        raise
+
+    if active_name is not None:
+        uvs.active_index = order.index(active_name)
+    if render_active_name is not None:
+        uvs[render_active_name].active_render = True
+
+    mesh.update()
+    uv_map_index.discard(mesh)
+    return len(moved)
+
+
+def _read_uv_layer(mesh:bpy.types.Mesh, index:int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    '''uvs, uv selection and pins of the uv map at index
+
+    The first access to the selection or pins of a uv map creates their layers, which moves the loop data
+    of all uv maps - the uv map gets looked up again for every access instead of keeping a reference.
+    '''
+    loop_count = len(mesh.loops)
+    flags = []
+    for attribute in ("vertex_selection", "edge_selection", "pin"):
+        values = np.empty(loop_count, dtype=bool)
+        getattr(mesh.uv_layers[index], attribute).foreach_get("value", values)
+        flags.append(values)
+
+    uv = np.empty(loop_count * 2, dtype=np.float32)
+    mesh.uv_layers[index].uv.foreach_get("vector", uv)
+    return (uv, *flags)
+
+
+def _write_uv_layer(mesh:bpy.types.Mesh, index:int, name:str, data:Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> None:
+    uv, vert_select, edge_select, pin = data
+    mesh.uv_layers[index].name = name
+    mesh.uv_layers[index].vertex_selection.foreach_set("value", vert_select)
+    mesh.uv_layers[index].edge_selection.foreach_set("value", edge_select)
+    mesh.uv_layers[index].pin.foreach_set("value", pin)
+    mesh.uv_layers[index].uv.foreach_set("vector", uv)
+
+
+def move_uv_layer(mesh:bpy.types.Mesh, name:str, index:int) -> int:
+    """moves the uv map to the slot index, the maps inbetween shift by one slot"""
+    order = uv_layer_names(mesh)
+    order.remove(name)
+    order.insert(max(0, min(index, len(order))), name)
+    return reorder_uv_layers(mesh, order)
+
+
+def uv_selected_faces(face_select:np.ndarray, vert_select:np.ndarray, loop_start:np.ndarray) -> np.ndarray:
+    """per face: selected and all its uvs selected"""
+    if len(face_select) == 0:
+        return face_select
+    return face_select & np.logical_and.reduceat(vert_select, loop_start)
+
+
+def copy_uvs(mesh:bpy.types.Mesh, source:str, destination:str, all_faces:bool=False) -> int:
+    """Copies the uvs of the uv selected faces from one uv map to another, returns the number of faces copied.
+
+    A face counts as uv selected when it is selected and all its uvs are selected in the source map.
+    Uses foreach_get/foreach_set, so the mesh must not be in edit mode - see copy_uvs_bmesh.
+    """
+    # looked up for every access, reading the uv selection can create its layer and move the loop data
+    uvs = mesh.uv_layers
+    if source not in uvs or destination not in uvs or source == destination:
+        return 0
+
+    loop_count = len(mesh.loops)
+    source_uv = np.empty(loop_count * 2, dtype=np.float32)
+    uvs[source].uv.foreach_get("vector", source_uv)
+
+    if all_faces:
+        uvs[destination].uv.foreach_set("vector", source_uv)
+        mesh.update()
+        return len(mesh.polygons)
+
+    face_select = read_face_select(mesh)
+    loop_start, loop_total = read_face_loops(mesh)
+    vert_select = np.empty(loop_count, dtype=bool)
+    uvs[source].vertex_selection.foreach_get("value", vert_select)
+
+    face_mask = uv_selected_faces(face_select, vert_select, loop_start)
+    if not face_mask.any():
+        return 0
+
+    copied = np.repeat(face_mask, loop_total)
+
+    uv = np.empty(loop_count * 2, dtype=np.float32)
+    uvs[destination].uv.foreach_get("vector", uv)
+    uv = uv.reshape(-1, 2)
+    uv[copied] = source_uv.reshape(-1, 2)[copied]
+    uvs[destination].uv.foreach_set("vector", uv.ravel())
+
+    mesh.update()
+    return int(face_mask.sum())
+
+
+def copy_uvs_bmesh(bm:bmesh.types.BMesh, source:str, destination:str, all_faces:bool=False) -> int:
+    """copy_uvs for a mesh in edit mode, returns the number of faces copied
+
+    Runs copy_uvs on a copy of the bmesh, see write_bmesh_through_mesh. With shape keys the selection test
+    runs on a snapshot and only the uvs of the copied faces are written to the bmesh, loop by loop.
+    """
+    uv_destination = bm.loops.layers.uv.get(destination)
+    if bm.loops.layers.uv.get(source) is None or uv_destination is None or source == destination:
+        return 0
+
+    copied = 0
+
+    def copy(mesh:bpy.types.Mesh) -> bool:
+        nonlocal copied
+        copied = copy_uvs(mesh, source, destination, all_faces)
+        return copied > 0
+
+    if write_bmesh_through_mesh(bm, copy):
+        return copied
+
+    snapshot = UVMeshSnapshot.from_bmesh(bm, source)
+    if all_faces:
+        faces = bm.faces
+        uvs = snapshot.uv
+    else:
+        face_mask = uv_selected_faces(snapshot.face_select, snapshot.vert_select, snapshot.face_loop_start)
+        bm.faces.ensure_lookup_table()
+        faces = [bm.faces[index] for index in np.flatnonzero(face_mask).tolist()]
+        uvs = snapshot.uv[face_mask[snapshot.loop_face]]
+
+    # the copied uvs are in face order, like the loops of the faces
+    uvs = iter(uvs.tolist())
+    for face in faces:
+        for loop in face.loops:
+            loop[uv_destination].uv = next(uvs)
+
+    return len(faces)
@@ -1,9 +1,16 @@
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, Set, Tuple
+
 import bpy
 from bpy.app.handlers import persistent
 from bpy.props import StringProperty, IntProperty, BoolProperty, CollectionProperty
 from bpy.types import PropertyGroup, UIList, Operator, Panel
 import bmesh
 
+from .mesh_objects import unique_mesh_objects
+from .core.profiling import profiler
+
 #region UI
 
 class IMAGE_UL_UVKIT_UVLayerList(UIList):
@@ -150,44 +157,25 @@ class UVLayerList_OT_Update(Operator):
         UVLayerProperties_isUpdating = True
 
         #print("update uvkit layerlist")
-               
-        uv_layer_names = []
-        unique_uv_layer_names = []
-        name_counts = []
-
-        mesh_count = 0
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue
-            mesh_count += 1
 
-            mesh = obj.data
-            for uv_map in mesh.uv_layers:
-                if uv_map.name in unique_uv_layer_names:
-                    index = unique_uv_layer_names.index(uv_map.name)
-                    value = name_counts[index]
-                    name_counts[index] = value + 1
-                else:
-                    unique_uv_layer_names.append(uv_map.name)
-                    name_counts.append(1)
-
-            uv_layer_names.append(mesh.uv_layers.keys())
-            
+        uv_layer_names = [uv_map_index.layers(obj.data) for obj in context.selected_objects if obj.type == 'MESH']
+        mesh_count = len(uv_layer_names)
+
+        # in order of appearance, like the names show up in the uv map lists of the objects
+        name_counts = Counter()
+        for names in uv_layer_names:
+            name_counts.update(names)
+
         # check if the order of the names is always the same
-        order_mismatch = False
-        if mesh_count > 1:
-            for i in range(1, len(uv_layer_names)):                
-                if uv_layer_names[0] != uv_layer_names[i]:
-                    order_mismatch = True
-                    break
-            
+        order_mismatch = len(set(uv_layer_names)) > 1
+
         context.scene.uvkit_uv_list.clear()
-        for index, name in enumerate(unique_uv_layer_names):         
+        for name, count in name_counts.items():
             item = context.scene.uvkit_uv_list.add()
             item.name = name
             item.intial_name = item.name 
-            item.use_count = f"{name_counts[index]}/{mesh_count}"
-            item.needs_sync = name_counts[index] != mesh_count
+            item.use_count = f"{count}/{mesh_count}"
+            item.needs_sync = count != mesh_count
             item.order_mismatch = order_mismatch
    
         # lets take the active uv layer from the active_object as a guide to 
@@ -204,6 +192,7 @@ class UVLayerList_OT_Update(Operator):
         else:
             context.scene.uvkit_uv_list_index = 0
 
+        uv_list_refresh.built(context)
         UVLayerProperties_isUpdating = False
         return{'FINISHED'}
     
@@ -231,18 +220,16 @@ class UVLayerList_OT_SelectObjectUsingUVmap(Operator):
     uv_layer_name: StringProperty(name="UVMap", description="", default="UVMap")
 
     def execute(self, context):
-      
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue            
-            mesh = obj.data
-            uvs = mesh.uv_layers       
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        users = uv_map_index.meshes_using(self.uv_layer_name, (obj.data for obj in objects))
 
-            uv_layer = uvs.get(self.uv_layer_name)
-            if uv_layer:
-                uv_layer.active = True
+        for obj in objects:
+            mesh = obj.data
+            uses_uv_layer = mesh.session_uid in users
+            if uses_uv_layer:
+                mesh.uv_layers[self.uv_layer_name].active = True
 
-            obj.select_set(uv_layer != None)
+            obj.select_set(uses_uv_layer)
 
         if len(context.selected_objects) > 0:
             bpy.context.view_layer.objects.active = context.selected_objects[0]
@@ -260,51 +247,56 @@ class UVLayerList_OT_NewMap(Operator):
     mode: StringProperty(name="Mode", description="", default="Duplicate")
    
     def execute(self, context):
-        active_obj = bpy.context.view_layer.objects.active
+        from .uv_layer_data import move_uv_layer
 
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue            
+        moved_layers = []
+
+        for obj in unique_mesh_objects(context.selected_objects):
             mesh = obj.data
             uvs = mesh.uv_layers       
 
+            if self.mode == "Sync" and self.uv_layer_name in uv_map_index.layers(mesh):
+                continue
+
             # TODO this might be obsolete already, can add more than 8 uv layers via attributes...
-            if len(uvs) == 8:
+            if len(uv_map_index.layers(mesh)) == 8:
                 self.report({'WARNING'}, f'{obj.name}: UV map limit reached, cannot have more than 8 UV maps.')
                 continue    
 
+            # the new uv map starts as copy of the active one
             if self.mode == "Duplicate":
-                copy_active_index = False
-            else:
-                copy_active_index = True
-                if len(uvs) > 0:
-                    uvs[0].active = True
-
-            uv_layer = uvs.get(self.uv_layer_name)
-            if uv_layer:
-                if self.mode == "Duplicate":
-                    uv_layer.active = True
-                    copy_active_index = True
-                else:
-                    copy_active_index = False
-            
-            if not copy_active_index:
-                continue
+                uv_layer = uvs.get(self.uv_layer_name)
+                if not uv_layer:
+                    continue
+                uv_layer.active = True
+            elif len(uvs) > 0:
+                uvs[0].active = True
 
-            index = uvs.active_index                
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.mesh.uv_texture_add()
-            uvs.active.name = self.uv_layer_name
-            final_name = uvs.active.name 
+            index = uvs.active_index
+            final_name = uvs.new(name=self.uv_layer_name, do_init=True).name
+            uv_map_index.discard(mesh)
 
+            # the copy goes right after its source
             if self.mode == "Duplicate":
-                for i in range(index, len(uvs) - 2):                
-                    move_to_bottom(obj, index+1)
+                moved_layers.append((obj.data, final_name, index + 1))
 
             uvs[final_name].active = True
 
-        bpy.context.view_layer.objects.active = active_obj
+        failed = []
+        if moved_layers:
+            with object_mode(context):
+                for mesh, name, index in moved_layers:
+                    # a failed move leaves the maps as they were, with the copy at the end
+                    try:
+                        move_uv_layer(mesh, name, index)
+                    except Exception as e:
+                        failed.append(f"{mesh.name}: {e}")
+
         bpy.ops.uvkit.uv_list_update()
+
+        if failed:
+            self.report({'ERROR'}, f"Could not move the copied uv map next to its source - {'; '.join(failed)}")
+            return {'CANCELLED'}
         return{'FINISHED'}
 
 
@@ -321,22 +313,17 @@ class UVLayerList_OT_DeleteMap(Operator):
         return context.scene.uvkit_uv_list
 
     def execute(self, context):
-        active_obj = bpy.context.view_layer.objects.active
-
         item = context.scene.uvkit_uv_list[context.scene.uvkit_uv_list_index]
        
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue            
+        for obj in unique_mesh_objects(context.selected_objects):
             mesh = obj.data
             uvs = mesh.uv_layers           
 
             uv_layer = uvs.get(self.uv_layer_name)
 
             if uv_layer:
-                uv_layer.active = True
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.mesh.uv_texture_remove()         
+                uvs.remove(uv_layer)
+                uv_map_index.discard(mesh)
 
                 original = uvs.get(item.name)  
                 if original:
@@ -344,7 +331,6 @@ class UVLayerList_OT_DeleteMap(Operator):
             else:
                 continue
 
-        bpy.context.view_layer.objects.active = active_obj
         bpy.ops.uvkit.uv_list_update()
         return{'FINISHED'}
 
@@ -362,9 +348,7 @@ class UVLayerList_OT_SetMapRenderActive(Operator):
         return context.scene.uvkit_uv_list
 
     def execute(self, context):      
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue            
+        for obj in unique_mesh_objects(context.selected_objects):
             mesh = obj.data
             uvs = mesh.uv_layers          
 
@@ -375,57 +359,68 @@ class UVLayerList_OT_SetMapRenderActive(Operator):
         return{'FINISHED'}
 
 
-# see: https://blender.stackexchange.com/questions/67266/changing-order-of-uv-maps
-# adapted the code a bit
-
-def set_active_uv_layer(obj, uv_layer_name):
-    uvs = obj.data.uv_layers
-    uv = uvs.get(uv_layer_name)
-    if uv:
-        uv.active = True
-        return
-    
-    raise Exception("UVMap not found!")
-
-
-def move_to_bottom(obj, index):
-    """Make sure active object is set correctly before calling this"""
-
-    # uvs = obj.data.uv_layers
-    uvs = obj.data.uv_layers
-    uvs.active_index = index
-    new_name = uvs.active.name
-
-    bpy.ops.mesh.uv_texture_add()
-
-    # delete the "old" one
-    set_active_uv_layer(obj, new_name)
-    bpy.ops.mesh.uv_texture_remove()
-
-    # set the name of the last one
-    uvs.active_index = len(uvs) - 1
-    uvs.active.name = new_name
-
-
-def move_one_down(obj, uvs):    
-    # get the selected UV map
-    original_index = uvs.active_index
-    original_name = uvs.active.name
-
-    if original_index == len(uvs) - 1:
-        return
-
-    # use "trick" on the one after it
-    move_to_bottom(obj, original_index + 1)
-
-    # use the "trick" on the UV map
-    move_to_bottom(obj, original_index)
-
-    # use the "trick" on the rest that are after where it was
-    for i in range(original_index, len(uvs) - 2):
-        move_to_bottom(obj, original_index)
-    
-    set_active_uv_layer(obj, original_name)
+class UVMapIndex():
+    """Index of the uv map names of the meshes, in slot order - the uv map list is built from it.
+
+    Meshes are keyed by their session_uid, which survives renames and is not reused within a session.
+    Missing entries are read from the mesh, the handlers drop the entries of the meshes the depsgraph
+    reports as updated. So after a change only the changed meshes are read again, not the whole selection.
+    """
+
+    def __init__(self) -> None:
+        self.mesh_layers: Dict[int, Tuple[str, ...]] = {}
+        self.name_meshes: Dict[str, Set[int]] = {}  # the other way around, the meshes per uv map name
+        self.reads = 0
+
+    def layers(self, mesh:bpy.types.Mesh) -> Tuple[str, ...]:
+        key = mesh.session_uid
+        names = self.mesh_layers.get(key)
+        if names is None:
+            names = tuple(mesh.uv_layers.keys())
+            self.mesh_layers[key] = names
+            for name in names:
+                self.name_meshes.setdefault(name, set()).add(key)
+            self.reads += 1
+        return names
+
+    def meshes_using(self, name:str, meshes:Iterable[bpy.types.Mesh]) -> Set[int]:
+        """session_uids of the indexed meshes with this uv map, reads the given meshes first when they are missing"""
+        for mesh in meshes:
+            self.layers(mesh)
+        return self.name_meshes.get(name, set())
+
+    def discard(self, mesh:bpy.types.Mesh) -> None:
+        key = mesh.session_uid
+        for name in self.mesh_layers.pop(key, ()):
+            users = self.name_meshes[name]
+            users.discard(key)
+            if not users:
+                del self.name_meshes[name]
+
+    def depsgraph_updated(self, depsgraph:bpy.types.Depsgraph) -> None:
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Mesh):
+                self.discard(update.id.original)
+
+    def clear(self) -> None:
+        self.mesh_layers.clear()
+        self.name_meshes.clear()
+
+
+uv_map_index = UVMapIndex()
+
+
+@contextmanager
+def object_mode(context:bpy.types.Context):
+    """the uv maps of meshes in edit mode have no data to access - leaves edit mode for the duration"""
+    in_edit_mode = context.mode == 'EDIT_MESH'
+    if in_edit_mode:
+        bpy.ops.object.mode_set(mode='OBJECT')
+    try:
+        yield
+    finally:
+        if in_edit_mode:
+            bpy.ops.object.mode_set(mode='EDIT')
 
 
 class UVLayerList_OT_ListDown(bpy.types.Operator):
@@ -434,17 +429,16 @@ class UVLayerList_OT_ListDown(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
     bl_description = "Move uv map down in the list slots"
 
-    def execute(self, context):               
-        active_obj = bpy.context.view_layer.objects.active
-        for obj in bpy.context.selected_objects:
-            if obj.type != 'MESH':
-                continue
+    def execute(self, context):
+        from .uv_layer_data import move_uv_layer
 
-            bpy.context.view_layer.objects.active = obj
-            uvs = obj.data.uv_layers
-            move_one_down(obj, uvs)            
+        with object_mode(context):
+            for obj in unique_mesh_objects(context.selected_objects):
+                if not obj.data.uv_layers:
+                    continue
 
-        bpy.context.view_layer.objects.active = active_obj
+                uvs = obj.data.uv_layers
+                move_uv_layer(obj.data, uvs.active.name, uvs.active_index + 1)
 
         bpy.ops.uvkit.uv_list_update()
 
@@ -463,22 +457,15 @@ class UVLayerList_OT_ListUp(bpy.types.Operator):
     bl_description = "Move uv map up in the list slots"
 
     def execute(self, context):
-        active_obj = context.view_layer.objects.active
-
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue
+        from .uv_layer_data import move_uv_layer
 
-            uvs = obj.data.uv_layers
+        with object_mode(context):
+            for obj in unique_mesh_objects(context.selected_objects):
+                if not obj.data.uv_layers:
+                    continue
 
-            if uvs.active_index == 0:
-                continue
-            
-            uvs.active_index -= 1
-            context.view_layer.objects.active = obj
-            move_one_down(obj, uvs)
-           
-        context.view_layer.objects.active = active_obj
+                uvs = obj.data.uv_layers
+                move_uv_layer(obj.data, uvs.active.name, uvs.active_index - 1)
 
         bpy.ops.uvkit.uv_list_update()
 
@@ -496,32 +483,13 @@ class UVLayerList_OT_ListSort_A_to_Z (bpy.types.Operator):
     bl_description = "Sorting UV map slots by name (A to Z)"
     bl_options = {"REGISTER", "UNDO"}
   
-    def execute(self, context):   
-        active_obj = context.view_layer.objects.active
+    def execute(self, context):
+        from .uv_layer_data import reorder_uv_layers, uv_layer_names
+
+        with object_mode(context):
+            for obj in unique_mesh_objects(context.selected_objects):
+                reorder_uv_layers(obj.data, sorted(uv_layer_names(obj.data)))
 
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue
-            
-            context.view_layer.objects.active = obj
-
-            uvs = obj.data.uv_layers
-            original_name = uvs.active.name
-            
-            for j in range (len(uvs)):
-                for i in range (len(uvs)-1):
-                    uvs.active_index = i
-                    temp_name = uvs.active.name
-                    uvs.active_index = i+1
-                    if uvs.active.name < temp_name:                   
-                        uvs.active_index -= 1
-                        context.view_layer.objects.active = obj
-                        move_one_down(obj, uvs)
-                                                           
-                        
-            set_active_uv_layer(obj, original_name)
-
-        context.view_layer.objects.active = active_obj   
         bpy.ops.uvkit.uv_list_update()  
         return {"FINISHED"}
     
@@ -545,12 +513,14 @@ class UVLayerList_OT_Copy_UVs(bpy.types.Operator):
         
     source: bpy.props.EnumProperty(name='Source', items=get_uvkit_maps())
     destination: bpy.props.EnumProperty(name='Destination', items=get_uvkit_maps())
+    all_faces: BoolProperty(name="All faces", description="Copy the uvs of all faces, not only of the uv selected ones", default=False)
 
     def draw(self, context: bpy.types.Context):
         layout = self.layout
         layout.use_property_split = True        
        
         layout.prop(self, 'destination')
+        layout.prop(self, 'all_faces')
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
         wm = context.window_manager
@@ -562,7 +532,7 @@ class UVLayerList_OT_Copy_UVs(bpy.types.Operator):
             return False
         if bpy.context.active_object.type != 'MESH':
             return False
-        if bpy.context.active_object.mode != 'EDIT':
+        if bpy.context.active_object.mode not in {'EDIT', 'OBJECT'}:
             return False
         if not bpy.context.object.data.uv_layers:
             return False
@@ -570,34 +540,18 @@ class UVLayerList_OT_Copy_UVs(bpy.types.Operator):
             return False
         return True
 
-    def execute(self, context):        
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue
-            
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.faces.ensure_lookup_table()
-
-            uv_source = bm.loops.layers.uv.get(self.source)
-            uv_destination = bm.loops.layers.uv.get(self.destination)
-
-            for face in bm.faces:
-                if not face.select:
-                    continue
-                skip = False
-                for loop in face.loops:
-                    if not loop[uv_source].select:
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-                for loop in face.loops:
-                    loop[uv_destination].uv.x = loop[uv_source].uv.x
-                    loop[uv_destination].uv.y = loop[uv_source].uv.y
+    def execute(self, context):
+        from .uv_layer_data import copy_uvs, copy_uvs_bmesh
+
+        for obj in unique_mesh_objects(context.selected_objects):
+            if obj.mode == 'EDIT':
+                bm = bmesh.from_edit_mesh(obj.data)
+                if copy_uvs_bmesh(bm, self.source, self.destination, self.all_faces):
+                    with profiler.phase("update_edit_mesh"):
+                        bmesh.update_edit_mesh(obj.data)
+            else:
+                copy_uvs(obj.data, self.source, self.destination, self.all_faces)
 
-            bmesh.update_edit_mesh(obj.data)
-        
         for index, uv_layer in enumerate(context.scene.uvkit_uv_list):
             if uv_layer.name == self.destination:
                 context.scene.uvkit_uv_list_index = index                
@@ -610,41 +564,107 @@ class UVLayerList_OT_Copy_UVs(bpy.types.Operator):
 
 @persistent
 def load_handler(dummy):
+    uv_map_index.clear()
     subscribe_msgbus(subscription_owner)
 
-prev_operator = None
-prev_selected_objects = set()
+@persistent
+def undo_handler(scene):
+    # undo can bring back any uv maps
+    uv_map_index.clear()
+    uv_list_refresh.request()
+
+def uv_list_signature(context:bpy.types.Context):
+    """everything the uv map list is built from - the uv map names of the selected meshes and the active uv map"""
+    active_obj = context.active_object
+    active_uv_layer = None
+    if active_obj and active_obj.type == 'MESH' and active_obj.data.uv_layers:
+        active_uv_layer = active_obj.data.uv_layers.active.name
+
+    return (
+        tuple((obj.name, uv_map_index.layers(obj.data)) for obj in context.selected_objects if obj.type == 'MESH'),
+        active_obj.name if active_obj else None,
+        active_uv_layer,
+    )
+
+
+class UVListRefresh():
+    """Coalesces the refresh requests of the handlers into one uv map list rebuild.
+
+    The first request starts a timer, requests until it fires are merged into that one. The timer
+    only rebuilds the list when the signature of the selection and uv maps changed since the last build.
+    """
+
+    def __init__(self, delay:float=0.1) -> None:
+        self.delay = delay
+        self.scheduled = False
+        self.signature = None
+        # timers are looked up by identity, a bound method is a new object on every access
+        self._timer = self._refresh
+
+        self.requested = 0
+        self.rebuilt = 0
+        self.coalesced = 0  # requests merged into an already scheduled refresh
+        self.unchanged = 0  # refreshes skipped because the signature didn't change
+
+    @property
+    def suppressed(self) -> int:
+        return self.coalesced + self.unchanged
+
+    def request(self) -> None:
+        self.requested += 1
+        if self.scheduled:
+            self.coalesced += 1
+            return
+
+        self.scheduled = True
+        bpy.app.timers.register(self._timer, first_interval=self.delay, persistent=True)
+
+    def built(self, context:bpy.types.Context) -> None:
+        """called after every rebuild of the list, also the ones not triggered by a request"""
+        self.signature = uv_list_signature(context)
+        self.rebuilt += 1
+
+    def cancel(self) -> None:
+        while bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.unregister(self._timer)
+        self.scheduled = False
+
+    def _refresh(self) -> None:
+        self.scheduled = False
+
+        if uv_list_signature(bpy.context) == self.signature:
+            self.unchanged += 1
+            return None
+
+        bpy.ops.uvkit.uv_list_update()
+        return None
+
+
+uv_list_refresh = UVListRefresh()
+
 
 @persistent
-def depsgraph_update_handler(scene):
+def depsgraph_update_handler(scene, depsgraph):
+    uv_map_index.depsgraph_updated(depsgraph)
+
     if  UVLayerProperties_isUpdating:
         return
-    
-    global prev_operator  
-    if (bpy.context.active_operator and 
-        prev_operator != bpy.context.active_operator and 
-        (
-        bpy.context.active_operator.name == 'Add UV Map' or
-        bpy.context.active_operator.name == 'Remove UV Map' 
-        )):
-        
-        prev_operator = bpy.context.active_operator       
-        bpy.ops.uvkit.uv_list_update()
-        return
 
-    global prev_selected_objects  
-    current_selected_objects = set(bpy.context.selected_objects)
-    if current_selected_objects != prev_selected_objects:
-        prev_selected_objects = current_selected_objects
-        bpy.ops.uvkit.uv_list_update()
-        return
+    uv_list_refresh.request()
 
 
 def msgbus_notification_handler(*args):
+    # the notification doesn't tell which mesh got a uv map renamed. The rename tags the mesh, so the depsgraph
+    # handler drops its entry - the active mesh is where the uv map properties rename it, drop that one right away
+    if args == ("name",):
+        obj = bpy.context.object
+        if obj is not None and obj.type == 'MESH':
+            uv_map_index.discard(obj.data)
+
     if  UVLayerProperties_isUpdating:
         return
      
-    bpy.ops.uvkit.uv_list_update()  
+    uv_list_refresh.request()
 
 subscription_owner = object()
 def subscribe_msgbus(subscription_owner):    
@@ -674,10 +694,7 @@ def unsubscribe_msgbus(subscription_owner):
 def listIndex_update_handler(self, context):
     uv_properties = context.scene.uvkit_uv_list[context.scene.uvkit_uv_list_index]
 
-    for obj in bpy.context.selected_objects:
-        if obj.type != 'MESH':
-            continue
-        
+    for obj in unique_mesh_objects(bpy.context.selected_objects):
         mesh = obj.data
         uv_layer = mesh.uv_layers.get(uv_properties.name)
         if uv_layer: 
@@ -691,16 +708,13 @@ def UVLayerProperties_Update(self, context):
         return
 
     print(f"update uv name: {self.intial_name} to {self.name}" )
-    for obj in bpy.context.selected_objects:
-        if obj.type != 'MESH':
-            continue
-        
+    for obj in unique_mesh_objects(bpy.context.selected_objects):
         mesh = obj.data
-        uvs = mesh.uv_layers
+        if self.intial_name not in uv_map_index.layers(mesh):
+            continue
 
-        uv_layer = uvs.get(self.intial_name)
-        if uv_layer: 
-            uv_layer.name = self.name
+        mesh.uv_layers[self.intial_name].name = self.name
+        uv_map_index.discard(mesh)
 
     bpy.ops.uvkit.uv_list_update()
 
@@ -760,6 +774,8 @@ classes = [
 
 def register():
     for c in classes:
+        if issubclass(c, Operator):
+            profiler.instrument(c)
         bpy.utils.register_class(c)
    
     bpy.types.Scene.uvkit_uv_list = CollectionProperty(type = UVLayerProperties)
@@ -774,6 +790,10 @@ def register():
     if load_handler not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(load_handler)
 
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if undo_handler not in handlers:
+            handlers.append(undo_handler)
+
     bpy.types.IMAGE_MT_uvs_context_menu.append(uvcontext_menu_draw_func)
 
 
@@ -786,7 +806,13 @@ def unregister():
     if load_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(load_handler)
 
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if undo_handler in handlers:
+            handlers.remove(undo_handler)
+
     unsubscribe_msgbus(subscription_owner)
+    uv_list_refresh.cancel()
+    uv_map_index.clear()
     
     for c in reversed(classes):
         bpy.utils.unregister_class(c)